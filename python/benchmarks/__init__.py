@@ -0,0 +1 @@
+"""Performance benchmarks for the CSV→JSON converter (see bench_converter)."""
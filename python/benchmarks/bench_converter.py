@@ -0,0 +1,364 @@
+#!/usr/bin/env python3
+"""
+Stage benchmarks for the CSV → JSON converter.
+
+Generates a synthetic unified-schema sheet and times the pipeline stages
+separately:
+
+- read      ``_read_table`` (CSV parsing into rows)
+- rows      row plan + record dispatch into ``UnifiedState`` (all variants)
+- merge     disclaimer block merge + subtitle/super merge and dedupe
+- build     ``build_unified_multi_country_output`` + building every payload
+- validate  ``validate_structure`` on every payload
+- write     ``write_json_file`` for every payload
+
+Results are written as JSON and compared with a stored baseline; a stage
+whose median is slower than the baseline by more than ``--tolerance`` (and by
+at least ``--min-delta`` seconds) counts as a regression (exit code 1).
+
+Examples:
+    python -m python.benchmarks.bench_converter --scenario small
+    python -m python.benchmarks.bench_converter --rows 20000 --countries 40 --variants 2
+    python -m python.benchmarks.bench_converter --scenario medium --update-baseline
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import json
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from dataclasses import asdict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from python.benchmarks.synthetic import SheetSpec, write_unified_sheet
+from python.core.converter_engine import _format_time
+from python.core.record_dispatch import RecordContext, dispatch_record
+from python.core.split_writer import write_json_file
+from python.core.table_reader import _read_table
+from python.core.timecode import parse_timecode
+from python.core.unified_processors import (
+    UnifiedState,
+    build_unified_multi_country_output,
+    merge_and_dedup_video_rows,
+    merge_disclaimer_blocks,
+    propagate_all_scope_texts,
+)
+from python.core.unified_row_plan import build_unified_row_plan
+from python.core.validation import validate_structure
+
+BENCH_RESULT_FORMAT = 1
+STAGES = ("read", "rows", "merge", "build", "validate", "write")
+DEFAULT_BASELINE_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "baseline.json"
+)
+
+SCENARIOS: Dict[str, SheetSpec] = {
+    "small": SheetSpec(rows=500, countries=4, variants=1, videos=4, controller_keys=2),
+    "medium": SheetSpec(
+        rows=5000, countries=20, variants=2, videos=20, controller_keys=3
+    ),
+    "large": SheetSpec(
+        rows=20000, countries=60, variants=2, videos=40, controller_keys=4
+    ),
+}
+
+_FPS = 25.0
+
+
+def _parse_time_optional(val: str) -> Optional[float]:
+    v = (val or "").strip()
+    if not v:
+        return None
+    try:
+        return parse_timecode(v, _FPS)
+    except Exception:
+        return None
+
+
+def _stage_rows(headers: List[str], rows: List[List[str]]) -> Dict[str, Any]:
+    plan = build_unified_row_plan(headers)
+    if plan is None:
+        raise ValueError("benchmark sheet is not a unified-schema sheet")
+    countries = list(plan.countries)
+    max_variants = max(plan.country_variant_counts.values(), default=1)
+    variant_states = [
+        (vi, UnifiedState(), plan.text_plan(vi)) for vi in range(max_variants)
+    ]
+    ctx = RecordContext(countries=countries, start_line_index=1)
+    for r in rows:
+        row = plan.extract(r, _parse_time_optional)
+        if row is None:
+            continue
+        for _vi, state, text_plan in variant_states:
+            texts, texts_portrait = text_plan.collect(row.cells)
+            propagate_all_scope_texts(
+                country_scope_val=row.country_scope,
+                texts=texts,
+                texts_portrait=texts_portrait,
+                countries=countries,
+            )
+            dispatch_record(state, row, texts, texts_portrait, ctx)
+    return {
+        "countries": countries,
+        "country_variant_counts": plan.country_variant_counts,
+        "variant_states": variant_states,
+    }
+
+
+def _stage_merge(parsed: Dict[str, Any]) -> List[Tuple[int, UnifiedState, Any, Any]]:
+    countries = parsed["countries"]
+    merged = []
+    for vi, state, _plan in parsed["variant_states"]:
+        disc = merge_disclaimer_blocks(
+            rows_raw=state.disc_rows_raw, countries=countries, merge_enabled=True
+        )
+        disc_02 = merge_disclaimer_blocks(
+            rows_raw=state.disc_02_rows_raw, countries=countries, merge_enabled=True
+        )
+        merge_and_dedup_video_rows(
+            videos=state.videos, countries=countries, merge_subtitles=True
+        )
+        merged.append((vi, state, disc, disc_02))
+    return merged
+
+
+def _stage_build(
+    parsed: Dict[str, Any], merged: List[Tuple[int, UnifiedState, Any, Any]]
+) -> List[Tuple[str, int, Dict[str, Any]]]:
+    # Same options as convert_csv_to_json defaults (schema v1, 2 decimals).
+    countries = parsed["countries"]
+    variant_counts = parsed["country_variant_counts"]
+    fmt_time = functools.partial(_format_time, round_ndigits=2, times_as_string=False)
+    payloads = []
+    for vi, state, disc, disc_02 in merged:
+        output_countries = [c for c in countries if variant_counts.get(c, 1) > vi]
+        out = build_unified_multi_country_output(
+            countries=output_countries,
+            country_variant_counts=variant_counts,
+            controller_keys_seen=state.controller_keys_seen,
+            claims_rows=state.claims_rows,
+            disclaimers_rows_merged=disc,
+            disclaimers_02_rows_merged=disc_02,
+            logo_rows_raw=state.logo_rows_raw,
+            controller_rows_raw=state.controller_rows_raw,
+            video_order=state.video_order,
+            videos=state.videos,
+            global_flag_defaults_per_country=state.global_flag_defaults_per_country,
+            global_flag_targeted_per_country=state.global_flag_targeted_per_country,
+            per_video_meta_local_country=state.per_video_meta_local_country,
+            skip_empty_text=True,
+            fmt_time=fmt_time,
+            per_video_claim_rows=state.per_video_claim_rows,
+            per_video_disc_rows_raw=state.per_video_disc_rows_raw,
+            merge_disclaimer=True,
+            per_video_disc_02_rows_raw=state.per_video_disc_02_rows_raw,
+            merge_disclaimer_02=True,
+            per_video_logo_rows_raw=state.per_video_logo_rows_raw,
+            endframe_rows_raw=state.endframe_rows_raw,
+            per_video_endframe_rows_raw=state.per_video_endframe_rows_raw,
+            per_video_controller_rows_raw=state.per_video_controller_rows_raw,
+            prefer_local_claim_disclaimer=True,
+            test_mode=False,
+            claims_as_objects=False,
+            controller_always_emit=False,
+            global_meta=state.global_meta,
+            job_number_per_country=state.job_number_per_country,
+            language_per_country=state.language_per_country,
+            cast_metadata=False,
+            flags_overview_object_always=False,
+            schema_version="v1",
+            no_orientation=False,
+            payload_interner=None,
+        )
+        by_country = out["byCountry"]
+        payloads.extend((c, vi, by_country[c]) for c in output_countries)
+    return payloads
+
+
+def _stage_validate(payloads: List[Tuple[str, int, Dict[str, Any]]]) -> int:
+    issues = 0
+    for _c, _vi, payload in payloads:
+        res = validate_structure(payload, required_global_keys=("briefVersion", "fps"))
+        issues += len(res["errors"]) + len(res["warnings"])
+    return issues
+
+
+def _stage_write(payloads: List[Tuple[str, int, Dict[str, Any]]], out_dir: str) -> int:
+    for c, vi, payload in payloads:
+        write_json_file(os.path.join(out_dir, f"bench_{c}_{vi}.json"), payload)
+    return len(payloads)
+
+
+def run_pipeline_once(sheet_path: str, out_dir: str) -> Dict[str, float]:
+    """One pass over every stage; returns seconds per stage."""
+    timings: Dict[str, float] = {}
+
+    def timed(stage: str, fn: Callable[..., Any], *args: Any) -> Any:
+        t0 = time.perf_counter()
+        result = fn(*args)
+        timings[stage] = time.perf_counter() - t0
+        return result
+
+    headers, rows, _delim = timed("read", _read_table, sheet_path)
+    parsed = timed("rows", _stage_rows, headers, rows)
+    merged = timed("merge", _stage_merge, parsed)
+    payloads = timed("build", _stage_build, parsed, merged)
+    timed("validate", _stage_validate, payloads)
+    timed("write", _stage_write, payloads, out_dir)
+    return timings
+
+
+def run_benchmark(
+    spec: SheetSpec, *, repeat: int = 3, name: Optional[str] = None
+) -> Dict[str, Any]:
+    """Time every stage ``repeat`` times on the sheet for ``spec``."""
+    work_dir = tempfile.mkdtemp(prefix="json_converter_bench_")
+    try:
+        sheet_path = write_unified_sheet(os.path.join(work_dir, "sheet.csv"), spec)
+        runs = [run_pipeline_once(sheet_path, work_dir) for _ in range(repeat)]
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    stages = {
+        stage: {
+            "min": min(r[stage] for r in runs),
+            "median": statistics.median(r[stage] for r in runs),
+        }
+        for stage in STAGES
+    }
+    return {
+        "format": BENCH_RESULT_FORMAT,
+        "scenario": name,
+        "spec": asdict(spec),
+        "repeat": repeat,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "stages": stages,
+        "totalMedian": sum(s["median"] for s in stages.values()),
+    }
+
+
+def compare_to_baseline(
+    result: Dict[str, Any],
+    baseline: Dict[str, Any],
+    *,
+    tolerance: float = 0.25,
+    min_delta: float = 0.005,
+) -> List[str]:
+    """Regression messages for stages slower than the baseline."""
+    regressions: List[str] = []
+    base_stages = baseline.get("stages") or {}
+    for stage in STAGES:
+        base = (base_stages.get(stage) or {}).get("median")
+        cur = result["stages"][stage]["median"]
+        if not base:
+            continue
+        if cur > base * (1 + tolerance) and cur - base >= min_delta:
+            regressions.append(
+                f"{stage}: {cur:.4f}s vs baseline {base:.4f}s (+{(cur / base - 1) * 100:.0f}%)"
+            )
+    return regressions
+
+
+def load_baselines(path: str) -> Dict[str, Any]:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def save_baselines(path: str, baselines: Dict[str, Any]) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(baselines, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def _baseline_key(result: Dict[str, Any]) -> str:
+    if result.get("scenario"):
+        return result["scenario"]
+    spec = result["spec"]
+    return "custom:" + ",".join(f"{k}={spec[k]}" for k in sorted(spec))
+
+
+def _print_result(result: Dict[str, Any], baseline: Optional[Dict[str, Any]]) -> None:
+    base_stages = (baseline or {}).get("stages") or {}
+    print(f"Benchmark {_baseline_key(result)} (repeat={result['repeat']})")
+    for stage in STAGES:
+        cur = result["stages"][stage]
+        line = f"  {stage:<9} median {cur['median']:.4f}s  min {cur['min']:.4f}s"
+        base = (base_stages.get(stage) or {}).get("median")
+        if base:
+            line += f"  baseline {base:.4f}s ({(cur['median'] / base - 1) * 100:+.0f}%)"
+        print(line)
+    print(f"  total     median {result['totalMedian']:.4f}s")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    p = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    p.add_argument("--scenario", choices=sorted(SCENARIOS), default=None)
+    p.add_argument("--rows", type=int, default=None)
+    p.add_argument("--countries", type=int, default=None)
+    p.add_argument("--variants", type=int, default=None)
+    p.add_argument("--videos", type=int, default=None)
+    p.add_argument("--controller-keys", type=int, default=None)
+    p.add_argument("--seed", type=int, default=None)
+    p.add_argument("--repeat", type=int, default=3)
+    p.add_argument("--output", help="Write the result JSON to this path")
+    p.add_argument("--baseline", default=DEFAULT_BASELINE_PATH)
+    p.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="Store this result as the baseline for its scenario",
+    )
+    p.add_argument("--tolerance", type=float, default=0.25)
+    p.add_argument("--min-delta", type=float, default=0.005)
+    args = p.parse_args(argv)
+
+    custom = {
+        k: getattr(args, k)
+        for k in ("rows", "countries", "variants", "videos", "controller_keys", "seed")
+        if getattr(args, k) is not None
+    }
+    name = args.scenario or (None if custom else "small")
+    spec = SCENARIOS[name] if name else SheetSpec()
+    if custom:
+        spec = SheetSpec(**{**asdict(spec), **custom})
+        name = None
+
+    result = run_benchmark(spec, repeat=max(1, args.repeat), name=name)
+    baselines = load_baselines(args.baseline)
+    key = _baseline_key(result)
+    baseline = baselines.get(key)
+    _print_result(result, baseline)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=2)
+            f.write("\n")
+
+    if args.update_baseline:
+        baselines[key] = result
+        save_baselines(args.baseline, baselines)
+        print(f"Baseline updated: {args.baseline} [{key}]")
+        return 0
+    if baseline is None:
+        print(f"No baseline for {key} in {args.baseline}")
+        return 0
+    regressions = compare_to_baseline(
+        result, baseline, tolerance=args.tolerance, min_delta=args.min_delta
+    )
+    for msg in regressions:
+        print(f"REGRESSION {msg}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,167 @@
+"""Synthetic unified-schema sheets for the converter benchmarks.
+
+The generator is deterministic for a given ``SheetSpec`` (seeded RNG), so a
+benchmark scenario always converts exactly the same input.
+"""
+
+from __future__ import annotations
+
+import csv
+import itertools
+import random
+import string
+from dataclasses import dataclass
+from typing import Iterator, List, Optional
+
+UNIFIED_BASE_HEADERS = [
+    "record_type",
+    "video_id",
+    "line",
+    "start",
+    "end",
+    "key",
+    "is_global",
+    "country_scope",
+    "metadata",
+]
+
+# Relative weights of the timed record types in the generated body.
+_RECORD_MIX = (
+    ("sub", 60),
+    ("super_a", 5),
+    ("claim", 6),
+    ("disclaimer", 8),
+    ("disclaimer_02", 3),
+    ("logo", 2),
+    ("endframe", 2),
+    ("controller", 14),
+)
+
+_FPS = 25
+
+
+@dataclass(frozen=True)
+class SheetSpec:
+    """Shape of a generated sheet.
+
+    ``rows`` counts timed body rows (subtitles, claims, controllers, ...);
+    metadata rows for the videos and controller flags come on top.
+    """
+
+    rows: int = 1000
+    countries: int = 10
+    variants: int = 1
+    videos: int = 10
+    controller_keys: int = 2
+    seed: int = 0
+
+
+def country_codes(count: int) -> List[str]:
+    """``count`` distinct three-letter codes (AAA, AAB, ...)."""
+    letters = string.ascii_uppercase
+    return [
+        "".join(t)
+        for t in itertools.islice(itertools.product(letters, repeat=3), count)
+    ]
+
+
+def _timecode(frames_total: int) -> str:
+    seconds, frames = divmod(frames_total, _FPS)
+    minutes, seconds = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours:02d}:{minutes:02d}:{seconds:02d}:{frames:02d}"
+
+
+def iter_unified_rows(spec: SheetSpec) -> Iterator[List[str]]:
+    """Header row followed by the sheet body for ``spec``."""
+    rng = random.Random(spec.seed)
+    countries = country_codes(spec.countries)
+    video_ids = [f"VID{i:03d}_{15 * (1 + i % 4)}s" for i in range(spec.videos)]
+    controller_keys = [f"controller_{i + 1:02d}" for i in range(spec.controller_keys)]
+    text_width = 2 * len(countries) * spec.variants
+
+    yield UNIFIED_BASE_HEADERS + [
+        c for _v in range(spec.variants) for c in countries for _o in (0, 1)
+    ]
+
+    def row(
+        record_type: str, texts: Optional[List[str]] = None, **fields: str
+    ) -> List[str]:
+        cells = [record_type] + [fields.get(h, "") for h in UNIFIED_BASE_HEADERS[1:]]
+        cells.extend(texts if texts is not None else [""] * text_width)
+        return cells
+
+    def texts_for(label: str) -> List[str]:
+        out: List[str] = []
+        for v in range(spec.variants):
+            for c in countries:
+                land = f"{label} {c} v{v}"
+                out.append(land)
+                # Roughly half of the portrait cells mirror landscape (empty).
+                out.append("" if rng.random() < 0.5 else f"{land} (p)")
+        return out
+
+    def all_scope_texts(label: str) -> List[str]:
+        # Only the first country is filled; the rest is propagated (ALL scope).
+        out = [""] * text_width
+        out[0] = f"{label} ALL"
+        return out
+
+    global_meta = [("briefVersion", "53"), ("fps", str(_FPS))]
+    global_meta += [(f"{ck}_flag", "G") for ck in controller_keys]
+    for key, value in global_meta:
+        yield row(
+            "meta_global", key=key, is_global="Y", country_scope="ALL", metadata=value
+        )
+    for vid in video_ids:
+        duration = vid.rsplit("_", 1)[-1].rstrip("s")
+        for key, value in (("duration", duration), ("title", f"Title {vid}")):
+            yield row(
+                "meta_local", video_id=vid, key=key, country_scope="ALL", metadata=value
+            )
+
+    kinds = [k for k, _w in _RECORD_MIX]
+    weights = [w for _k, w in _RECORD_MIX]
+    cursor = {vid: 0 for vid in video_ids}
+    lines = {vid: 0 for vid in video_ids}
+    global_cursor = 0
+    for n in range(spec.rows):
+        kind = rng.choices(kinds, weights)[0]
+        per_video = kind in ("sub", "super_a", "controller") or rng.random() < 0.3
+        vid = rng.choice(video_ids) if per_video and video_ids else ""
+        if vid:
+            start = cursor[vid]
+            cursor[vid] += rng.randint(25, 100)
+            end = cursor[vid]
+        else:
+            start = global_cursor
+            global_cursor += rng.randint(25, 100)
+            end = global_cursor
+        if kind == "controller":
+            kind = rng.choice(controller_keys) if controller_keys else "sub"
+        line = ""
+        if kind in ("sub", "super_a") and vid:
+            # Occasionally repeat the previous line number so merging kicks in.
+            if lines[vid] == 0 or rng.random() > 0.15:
+                lines[vid] += 1
+            line = str(lines[vid])
+        use_all = rng.random() < 0.2
+        yield row(
+            kind,
+            video_id=vid,
+            line=line,
+            start=_timecode(start),
+            end=_timecode(end),
+            country_scope="ALL" if use_all else "",
+            texts=all_scope_texts(f"{kind} {n}")
+            if use_all
+            else texts_for(f"{kind} {n}"),
+        )
+
+
+def write_unified_sheet(path: str, spec: SheetSpec, *, delimiter: str = ";") -> str:
+    """Write the sheet for ``spec`` as CSV to ``path``; returns ``path``."""
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f, delimiter=delimiter)
+        writer.writerows(iter_unified_rows(spec))
+    return path
@@ -1,34 +1,127 @@
+from .batch import (
+    dispatch_batch_flags,
+    expand_batch_glob,
+    iter_batch_results,
+    load_batch_manifest,
+    run_batch,
+)
+from .build_cache import (
+    compute_run_key,
+    default_build_cache_path,
+    is_build_cache_hit,
+    load_build_cache,
+    normalize_cli_options,
+    save_build_cache,
+)
+from .check_cache import (
+    compute_check_key,
+    default_check_cache_path,
+    diff_issues,
+    load_check_cache,
+    save_check_cache,
+)
 from .columns import _normalize_header_map, _resolve_column, detect_columns
 from .cli_runner import build_cli_parser, run_cli
 from .converter_engine import convert_csv_to_json
+from .country_checks import CountryCheck, check_countries
 from .generation_metadata import inject_generation_metadata
+from .input_digest import InputDigest, digest_input, touched_countries
 from .integration_injections import (
     inject_layer_config_payload,
     inject_media_mapping,
 )
+from .json_stream import dump_json_stream, iter_json_chunks
+from .lazy_payloads import (
+    CountryPayloadFactory,
+    LazyCountryPayloads,
+    apply_to_payloads,
+)
 from .optional_tools import (
+    DeferredTool,
     load_layer_config_converter,
     load_media_tools,
+    resolve_optional_tool,
     resolve_tools_path,
 )
+from .instrumentation import (
+    NULL_INSTRUMENTATION,
+    Instrumentation,
+    NullInstrumentation,
+    timed_country_builder,
+)
 from .output_paths import (
     build_country_token,
     ensure_country_placeholder,
     resolve_country_output_path,
     resolve_single_country_output_path,
+    strip_logo_anim_overview,
     trim_logo_anim_flag_for_country,
 )
+from .payload_sharing import PayloadInterner, detach, share_country_payload
+from .profiling import MemoryTracer, add_profiling_arguments, run_profiled
+from .provenance import (
+    Provenance,
+    clear_provenance_cache,
+    default_provenance_cache_path,
+    provenance_cache_key,
+    resolve_provenance,
+)
+from .record_dispatch import (
+    RecordContext,
+    dispatch_record,
+    register_record_type,
+    resolve_record_handler,
+    unregister_record_type,
+)
 from .sectioned_mode import convert_sectioned_mode
+from .serve import (
+    default_serve_address,
+    dispatch_serve_flags,
+    handle_serve_request,
+    ping_server,
+    run_via_server,
+    serve_forever,
+    stop_server,
+)
 from .simple_mode import convert_simple_mode
-from .table_reader import _read_table, _sniff_delimiter
-from .timecode import parse_timecode, safe_int
+from .split_writer import (
+    SplitWriteOptions,
+    WriteResult,
+    build_split_payload,
+    derive_sample_path,
+    iter_split_task,
+    make_sample,
+    prepare_country_output,
+    write_country_output,
+    write_json_file,
+    write_split_outputs_parallel,
+)
+from .table_reader import TableStream, _read_table, _sniff_delimiter, _stream_table
+from .workbook_cache import (
+    CachedWorkbook,
+    clear_workbook_cache,
+    default_workbook_cache_dir,
+    open_cached_workbook,
+)
+from .xlsx_reader import XlsxUnsupportedError, open_values_workbook
+from .timecode import (
+    TimecodeBatch,
+    clear_timecode_cache,
+    parse_timecode,
+    parse_timecodes,
+    safe_int,
+)
 from .unified_processors import (
+    CountryTexts,
+    TimedTextRow,
     UnifiedState,
     build_country_orientation_data,
     build_country_payload,
+    build_country_payload_from_state,
     build_unified_multi_country_output,
-    collect_country_texts,
     deduplicate_rows_by_line_timing,
+    iter_country_videos,
+    iter_video_level_fields,
     join_claim_rows_by_timing,
     join_claim_rows_by_timing_per_video,
     merge_and_dedup_video_rows,
@@ -50,10 +143,29 @@ from .unified_processors import (
     process_super_b_row,
     propagate_all_scope_texts,
 )
+from .unified_row_plan import (
+    CountryTextPlan,
+    UnifiedRow,
+    UnifiedRowPlan,
+    build_unified_row_plan,
+)
+from .validation import (
+    PayloadSchema,
+    TimedListRule,
+    build_schema,
+    build_validator,
+    compile_validator,
+    parse_required_global_keys,
+    validate_structure,
+)
 from .validation_reports import write_validation_report
+from .watch import dispatch_watch_flags, watch_loop
 
 __all__ = [
     "parse_timecode",
+    "clear_timecode_cache",
+    "parse_timecodes",
+    "TimecodeBatch",
     "safe_int",
     "build_cli_parser",
     "run_cli",
@@ -67,23 +179,50 @@ __all__ = [
     "resolve_tools_path",
     "load_media_tools",
     "load_layer_config_converter",
+    "DeferredTool",
+    "resolve_optional_tool",
     "ensure_country_placeholder",
     "build_country_token",
     "resolve_country_output_path",
     "resolve_single_country_output_path",
     "trim_logo_anim_flag_for_country",
+    "strip_logo_anim_overview",
     "convert_simple_mode",
     "convert_sectioned_mode",
     "_sniff_delimiter",
     "_read_table",
+    "_stream_table",
+    "TableStream",
+    "XlsxUnsupportedError",
+    "open_values_workbook",
+    "CachedWorkbook",
+    "clear_workbook_cache",
+    "default_workbook_cache_dir",
+    "open_cached_workbook",
     "write_validation_report",
+    "validate_structure",
+    "PayloadSchema",
+    "TimedListRule",
+    "build_schema",
+    "build_validator",
+    "compile_validator",
+    "CountryCheck",
+    "check_countries",
+    "compute_check_key",
+    "default_check_cache_path",
+    "diff_issues",
+    "load_check_cache",
+    "save_check_cache",
+    "parse_required_global_keys",
     "UnifiedState",
+    "CountryTexts",
+    "TimedTextRow",
     "build_country_orientation_data",
     "build_country_payload",
+    "build_country_payload_from_state",
     "build_unified_multi_country_output",
     "normalize_controller_record",
     "normalize_duration_token",
-    "collect_country_texts",
     "join_claim_rows_by_timing",
     "join_claim_rows_by_timing_per_video",
     "merge_disclaimer_blocks",
@@ -103,4 +242,68 @@ __all__ = [
     "process_super_a_row",
     "process_super_b_row",
     "process_controller_row",
+    "UnifiedRow",
+    "UnifiedRowPlan",
+    "CountryTextPlan",
+    "build_unified_row_plan",
+    "RecordContext",
+    "dispatch_record",
+    "register_record_type",
+    "resolve_record_handler",
+    "unregister_record_type",
+    "PayloadInterner",
+    "detach",
+    "share_country_payload",
+    "LazyCountryPayloads",
+    "apply_to_payloads",
+    "CountryPayloadFactory",
+    "SplitWriteOptions",
+    "derive_sample_path",
+    "make_sample",
+    "prepare_country_output",
+    "write_country_output",
+    "write_json_file",
+    "write_split_outputs_parallel",
+    "build_split_payload",
+    "iter_split_task",
+    "iter_json_chunks",
+    "dump_json_stream",
+    "iter_country_videos",
+    "iter_video_level_fields",
+    "WriteResult",
+    "compute_run_key",
+    "default_build_cache_path",
+    "is_build_cache_hit",
+    "load_build_cache",
+    "normalize_cli_options",
+    "save_build_cache",
+    "default_serve_address",
+    "dispatch_serve_flags",
+    "handle_serve_request",
+    "ping_server",
+    "run_via_server",
+    "serve_forever",
+    "stop_server",
+    "Provenance",
+    "clear_provenance_cache",
+    "default_provenance_cache_path",
+    "provenance_cache_key",
+    "resolve_provenance",
+    "Instrumentation",
+    "NullInstrumentation",
+    "NULL_INSTRUMENTATION",
+    "timed_country_builder",
+    "MemoryTracer",
+    "add_profiling_arguments",
+    "run_profiled",
+    "dispatch_batch_flags",
+    "expand_batch_glob",
+    "iter_batch_results",
+    "load_batch_manifest",
+    "run_batch",
+    "InputDigest",
+    "digest_input",
+    "dispatch_watch_flags",
+    "touched_countries",
+    "watch_loop",
 ]
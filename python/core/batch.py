@@ -0,0 +1,166 @@
+"""Convert many inputs in one process (``--batch-manifest`` / ``--batch-glob``).
+
+Every input is an ordinary converter run (same argv as a single invocation),
+executed in-process or in a pool of ``--batch-jobs`` worker processes. Imports,
+the timecode cache and provenance stay warm across the runs of a process.
+Each run's captured output, including its own ``Conversion complete`` line,
+is printed in input order, followed by one ``Batch complete`` line.
+"""
+
+from __future__ import annotations
+
+import argparse
+import glob
+import json
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional
+
+from .cli_runner import _positive_int
+from .serve import RunCallable, handle_serve_request
+
+BATCH_STEM_PLACEHOLDER = "{stem}"
+
+_SUMMARY_RE = re.compile(r"^Conversion complete: Files written: (\d+), Errors: (\d+)$")
+
+_worker_run: Optional[RunCallable] = None
+
+
+def _build_batch_parser() -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(add_help=False, allow_abbrev=False)
+    source = p.add_mutually_exclusive_group()
+    source.add_argument("--batch-manifest", default=None)
+    source.add_argument("--batch-glob", default=None)
+    p.add_argument("--batch-jobs", type=_positive_int, default=1)
+    return p
+
+
+def load_batch_manifest(path: str) -> List[Dict[str, Any]]:
+    """Read a JSON manifest into ``[{"argv": [...], "cwd": ...}, ...]``.
+
+    The manifest is a list whose entries are either an argv list or an object
+    with ``argv`` and an optional ``cwd``. Raises ValueError when malformed.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        entries = json.load(f)
+    if not isinstance(entries, list):
+        raise ValueError("manifest must be a JSON list of runs")
+    requests: List[Dict[str, Any]] = []
+    for i, entry in enumerate(entries):
+        if isinstance(entry, list):
+            entry = {"argv": entry}
+        argv = entry.get("argv") if isinstance(entry, dict) else None
+        if not isinstance(argv, list) or not all(isinstance(a, str) for a in argv):
+            raise ValueError(
+                f"manifest entry {i}: expected an argv list or {{'argv': [str, ...]}}"
+            )
+        request: Dict[str, Any] = {"argv": list(argv)}
+        if entry.get("cwd"):
+            request["cwd"] = str(entry["cwd"])
+        requests.append(request)
+    return requests
+
+
+def expand_batch_glob(pattern: str, template: List[str]) -> List[Dict[str, Any]]:
+    """One run per input matching ``pattern`` (sorted): ``[input, *template]``.
+
+    ``{stem}`` in the template is replaced by the input's file name without
+    extension, e.g. ``out/{stem}_{country}.json``.
+    """
+    requests: List[Dict[str, Any]] = []
+    for path in sorted(glob.glob(pattern, recursive=True)):
+        if not os.path.isfile(path):
+            continue
+        stem = os.path.splitext(os.path.basename(path))[0]
+        argv = [path] + [a.replace(BATCH_STEM_PLACEHOLDER, stem) for a in template]
+        requests.append({"argv": argv})
+    return requests
+
+
+def _init_batch_worker(run: RunCallable) -> None:
+    global _worker_run
+    _worker_run = run
+
+
+def _run_batch_request(request: Dict[str, Any]) -> Dict[str, Any]:
+    assert _worker_run is not None
+    return handle_serve_request(request, _worker_run)
+
+
+def iter_batch_results(
+    requests: List[Dict[str, Any]], run: RunCallable, jobs: int = 1
+) -> Iterable[Dict[str, Any]]:
+    """``{"exitCode", "stdout", "stderr"}`` per request, in request order."""
+    if jobs <= 1 or len(requests) <= 1:
+        for request in requests:
+            yield handle_serve_request(request, run)
+        return
+    with ProcessPoolExecutor(
+        max_workers=min(jobs, len(requests)),
+        initializer=_init_batch_worker,
+        initargs=(run,),
+    ) as pool:
+        yield from pool.map(_run_batch_request, requests)
+
+
+def run_batch(requests: List[Dict[str, Any]], run: RunCallable, jobs: int = 1) -> int:
+    """Run all requests, print their output in order and a batch summary.
+
+    Returns 0 when every run succeeded, 1 otherwise.
+    """
+    failed = files_written = errors = 0
+    total = len(requests)
+    results = iter_batch_results(requests, run, jobs)
+    for n, (request, result) in enumerate(zip(requests, results), start=1):
+        label = request["argv"][0] if request["argv"] else "<no input>"
+        print(f"[{n}/{total}] {label}")
+        sys.stdout.write(result["stdout"])
+        sys.stderr.write(result["stderr"])
+        if result["exitCode"] != 0:
+            failed += 1
+        for line in result["stdout"].splitlines():
+            match = _SUMMARY_RE.match(line)
+            if match:
+                files_written += int(match.group(1))
+                errors += int(match.group(2))
+    print(
+        f"Batch complete: Inputs: {total}, Failed: {failed}, "
+        f"Files written: {files_written}, Errors: {errors}"
+    )
+    return 1 if failed else 0
+
+
+def dispatch_batch_flags(argv: List[str], run: RunCallable) -> Optional[int]:
+    """Handle ``--batch-manifest``/``--batch-glob``; None otherwise.
+
+    With ``--batch-glob``, the remaining arguments are the per-input template
+    (see ``expand_batch_glob``); with a manifest they must be empty.
+    """
+    if not any(
+        a.split("=", 1)[0] in ("--batch-manifest", "--batch-glob") for a in argv
+    ):
+        return None
+    opts, rest = _build_batch_parser().parse_known_args(argv)
+    if opts.batch_manifest:
+        if rest:
+            print(
+                f"Error: unexpected arguments with --batch-manifest: {rest}",
+                file=sys.stderr,
+            )
+            return 2
+        try:
+            requests = load_batch_manifest(opts.batch_manifest)
+        except (OSError, ValueError) as ex:
+            print(
+                f"Error: failed to read batch manifest '{opts.batch_manifest}': {ex}",
+                file=sys.stderr,
+            )
+            return 1
+    else:
+        requests = expand_batch_glob(opts.batch_glob, rest)
+        if not requests:
+            print(f"Error: no inputs match '{opts.batch_glob}'", file=sys.stderr)
+            return 1
+    return run_batch(requests, run, opts.batch_jobs)
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from typing import Any, Dict, Iterable, Optional
+
+BUILD_CACHE_FILENAME = ".json_converter_cache.json"
+BUILD_CACHE_FORMAT = 1
+
+# CLI options that never change the written files.
+_NON_OUTPUT_OPTIONS = frozenset(
+    {
+        "verbose",
+        "jobs",
+        "skip_unchanged",
+        "build_cache",
+        "converter_version",
+        "timings",
+        "timings_json",
+        "profile",
+        "trace_memory",
+        "incremental_check",
+    }
+)
+
+
+def file_sha256(path: str) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f_in:
+        for chunk in iter(lambda: f_in.read(1024 * 1024), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def default_build_cache_path(output: str) -> str:
+    """Cache file next to the outputs of ``output`` (path or pattern)."""
+    out_dir = os.path.dirname(os.path.abspath(output or "")) or os.getcwd()
+    return os.path.join(out_dir, BUILD_CACHE_FILENAME)
+
+
+def normalize_cli_options(options: Dict[str, Any]) -> Dict[str, Any]:
+    """Options that affect output, with path values made absolute."""
+    normalized: Dict[str, Any] = {}
+    for key in sorted(options):
+        if key in _NON_OUTPUT_OPTIONS:
+            continue
+        value = options[key]
+        if key in ("input", "output", "output_pattern", "output_dir") and value:
+            value = os.path.abspath(value)
+        normalized[key] = value
+    return normalized
+
+
+def extra_file_hashes(extra_files: Iterable[Optional[str]]) -> Dict[str, Optional[str]]:
+    """Absolute path -> SHA-256 of each given side input (None when missing)."""
+    extras: Dict[str, Optional[str]] = {}
+    for extra in extra_files:
+        if extra:
+            extras[os.path.abspath(extra)] = (
+                file_sha256(extra) if os.path.isfile(extra) else None
+            )
+    return extras
+
+
+def compute_run_key(
+    *,
+    input_path: str,
+    converter_version: str,
+    options: Dict[str, Any],
+    extra_files: Iterable[Optional[str]] = (),
+) -> str:
+    """SHA-256 over the input, converter version, options and extra inputs.
+
+    ``extra_files`` are side inputs (media/layer config); missing ones hash as
+    absent so that creating them later invalidates the key.
+    """
+    material = {
+        "format": BUILD_CACHE_FORMAT,
+        "inputSha256": file_sha256(input_path),
+        "converterVersion": converter_version,
+        "options": normalize_cli_options(options),
+        "extraFiles": extra_file_hashes(extra_files),
+    }
+    encoded = json.dumps(material, sort_keys=True, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def load_build_cache(path: str) -> Dict[str, Any]:
+    """Previous cache contents, or ``{}`` when missing/unreadable."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("format") != BUILD_CACHE_FORMAT:
+        return {}
+    if not isinstance(data.get("outputs"), dict):
+        return {}
+    return data
+
+
+def is_build_cache_hit(cache: Dict[str, Any], run_key: str) -> bool:
+    """True when ``run_key`` matches and every recorded output still exists."""
+    outputs = cache.get("outputs") or {}
+    return (
+        cache.get("runKey") == run_key
+        and bool(outputs)
+        and all(os.path.isfile(p) for p in outputs)
+    )
+
+
+def save_build_cache(path: str, run_key: str, outputs: Dict[str, str]) -> None:
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(
+            {"format": BUILD_CACHE_FORMAT, "runKey": run_key, "outputs": outputs},
+            f,
+            ensure_ascii=False,
+            indent=2,
+            sort_keys=True,
+        )
+    os.replace(tmp_path, path)
@@ -0,0 +1,181 @@
+"""Per-country result cache and issue delta for ``--incremental-check``.
+
+The cache sits next to the validation report (``<report>.cache.json``). It
+keeps each country's check result together with the input digest it was
+computed from (see ``input_digest``) and a key over the converter version,
+the output options and the side config files. A later check reuses the
+results of countries whose digest and key are unchanged, revalidates the
+rest and compares all issues with the previous run.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .build_cache import extra_file_hashes, normalize_cli_options
+from .country_checks import CountryCheck
+from .input_digest import InputDigest
+
+CHECK_CACHE_FORMAT = 1
+
+# (country, "error" | "warning", message)
+Issue = Tuple[str, str, str]
+
+
+def default_check_cache_path(report_path: str) -> str:
+    root, ext = os.path.splitext(report_path)
+    return f"{root}.cache{ext or '.json'}"
+
+
+def compute_check_key(
+    *,
+    converter_version: str,
+    options: Dict[str, Any],
+    extra_files: Iterable[Optional[str]] = (),
+) -> str:
+    """SHA-256 over everything but the input that shapes the checked payloads."""
+    material = {
+        "format": CHECK_CACHE_FORMAT,
+        "converterVersion": converter_version,
+        "options": normalize_cli_options(options),
+        "extraFiles": extra_file_hashes(extra_files),
+    }
+    encoded = json.dumps(material, sort_keys=True, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def load_check_cache(path: str) -> Dict[str, Any]:
+    """Previous cache contents, or ``{}`` when missing/unreadable."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("format") != CHECK_CACHE_FORMAT:
+        return {}
+    if not isinstance(data.get("countries"), dict):
+        return {}
+    return data
+
+
+def _check_from_entry(country: str, entry: Dict[str, Any]) -> CountryCheck:
+    return CountryCheck(
+        country=country,
+        errors=list(entry["errors"]),
+        warnings=list(entry["warnings"]),
+        summary=entry["summary"],
+        metadata_global=entry.get("metadataGlobal"),
+        build_seconds=0.0,
+        validate_seconds=0.0,
+        cached=True,
+    )
+
+
+def reusable_checks(
+    cache: Dict[str, Any], check_key: str, digest: Optional[InputDigest]
+) -> Dict[str, CountryCheck]:
+    """Cached results still valid for ``digest`` (none if the key changed)."""
+    if (
+        digest is None
+        or cache.get("checkKey") != check_key
+        or cache.get("shared") != digest.shared
+    ):
+        return {}
+    reused: Dict[str, CountryCheck] = {}
+    for country, entry in cache["countries"].items():
+        if digest.countries.get(country) == entry.get("digest"):
+            try:
+                reused[country] = _check_from_entry(country, entry)
+            except (KeyError, TypeError):
+                continue
+    return reused
+
+
+def cached_issues(cache: Dict[str, Any]) -> List[Issue]:
+    """Issues of the previous check recorded in ``cache``."""
+    issues: List[Issue] = []
+    for country, entry in cache.get("countries", {}).items():
+        issues.extend((country, "error", m) for m in entry.get("errors", []))
+        issues.extend((country, "warning", m) for m in entry.get("warnings", []))
+    return issues
+
+
+def check_issues(checks: Sequence[CountryCheck]) -> List[Issue]:
+    issues: List[Issue] = []
+    for r in checks:
+        issues.extend((r.country, "error", m) for m in r.errors)
+        issues.extend((r.country, "warning", m) for m in r.warnings)
+    return issues
+
+
+def diff_issues(
+    previous: Sequence[Issue], current: Sequence[Issue]
+) -> Dict[str, List[Dict[str, str]]]:
+    """Split issues into ``new``, ``fixed`` and ``unchanged`` (multiset compare).
+
+    ``new`` and ``unchanged`` follow the order of ``current``, ``fixed`` the
+    order of ``previous``.
+    """
+    remaining = Counter(previous)
+    new: List[Issue] = []
+    unchanged: List[Issue] = []
+    for issue in current:
+        if remaining[issue] > 0:
+            remaining[issue] -= 1
+            unchanged.append(issue)
+        else:
+            new.append(issue)
+    fixed: List[Issue] = []
+    for issue in previous:
+        if remaining[issue] > 0:
+            remaining[issue] -= 1
+            fixed.append(issue)
+
+    def _entries(issues: List[Issue]) -> List[Dict[str, str]]:
+        return [
+            {"country": country, "level": level, "message": message}
+            for country, level, message in issues
+        ]
+
+    return {
+        "new": _entries(new),
+        "fixed": _entries(fixed),
+        "unchanged": _entries(unchanged),
+    }
+
+
+def save_check_cache(
+    path: str,
+    check_key: str,
+    digest: Optional[InputDigest],
+    checks: Sequence[CountryCheck],
+) -> None:
+    """Record ``checks``; without a digest they only serve as delta baseline."""
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    countries: Dict[str, Dict[str, Any]] = {}
+    for r in checks:
+        countries[r.country] = {
+            "digest": digest.countries.get(r.country) if digest else None,
+            "errors": r.errors,
+            "warnings": r.warnings,
+            "summary": r.summary,
+            "metadataGlobal": r.metadata_global,
+        }
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(
+            {
+                "format": CHECK_CACHE_FORMAT,
+                "checkKey": check_key,
+                "shared": digest.shared if digest else None,
+                "countries": countries,
+            },
+            f,
+            ensure_ascii=False,
+            indent=2,
+        )
+    os.replace(tmp_path, path)
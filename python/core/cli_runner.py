@@ -1,28 +1,84 @@
 from __future__ import annotations
 
 import argparse
-import copy
-import json
+import functools
 import os
-import re
-import subprocess
 import sys
-from typing import Any, Callable, Dict, List, Optional, Tuple, cast
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+)
 
+from .build_cache import (
+    BUILD_CACHE_FILENAME,
+    compute_run_key,
+    default_build_cache_path,
+    is_build_cache_hit,
+    load_build_cache,
+    save_build_cache,
+)
+from .check_cache import (
+    cached_issues,
+    check_issues,
+    compute_check_key,
+    default_check_cache_path,
+    diff_issues,
+    load_check_cache,
+    reusable_checks,
+    save_check_cache,
+)
+from .country_checks import CountryCheck, check_countries
 from .generation_metadata import inject_generation_metadata
+from .input_digest import InputDigest, digest_input
+from .instrumentation import NULL_INSTRUMENTATION, Instrumentation
 from .integration_injections import (
     inject_layer_config_payload,
     inject_media_mapping,
 )
+from .lazy_payloads import LazyCountryPayloads, apply_to_payloads
+from .optional_tools import DeferredTool, resolve_optional_tool
 from .output_paths import (
     ensure_country_placeholder,
     resolve_country_output_path,
     resolve_single_country_output_path,
+    strip_logo_anim_overview,
     trim_logo_anim_flag_for_country,
 )
+from .profiling import MemoryTracer, add_profiling_arguments, run_profiled
+from .provenance import resolve_provenance
+from .split_writer import (
+    SplitWriteOptions,
+    WriteResult,
+    derive_sample_path,
+    empty_country_payload,
+    iter_split_task,
+    make_sample,
+    prepare_country_output,
+    write_country_output,
+    write_json_file,
+    write_split_outputs_parallel,
+)
+from .validation import build_schema, compile_validator, parse_required_global_keys
 from .validation_reports import write_validation_report
 
 
+def _positive_int(value: str) -> int:
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{value}'")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be >= 1, got {number}")
+    return number
+
+
 def build_cli_parser() -> argparse.ArgumentParser:
     p = argparse.ArgumentParser(description="Convert subtitle CSV/XLSX to JSON")
     p.add_argument("input", help="Path to input CSV file")
@@ -173,6 +229,11 @@ def build_cli_parser() -> argparse.ArgumentParser:
         default=None,
         help="Write a JSON validation report to this path during --check",
     )
+    p.add_argument(
+        "--incremental-check",
+        action="store_true",
+        help="With --check and --validation-report, cache per-country results next to the report and only revalidate countries whose input changed; the report gains a new/fixed/unchanged issue delta",
+    )
     p.add_argument(
         "--auto-output",
         action="store_true",
@@ -241,6 +302,46 @@ def build_cli_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Legacy behavior: emit per-video controller_NN rows from global controller_NN when local rows are missing",
     )
+    p.add_argument(
+        "--shared-payloads",
+        action="store_true",
+        help="Share identical per-country payload subtrees in memory (output unchanged; lowers memory for many countries)",
+    )
+    p.add_argument(
+        "--jobs",
+        type=_positive_int,
+        default=1,
+        metavar="N",
+        help="With --split-by-country, build and write per-country files in N worker processes; with --check, build and validate them there (default 1: in-process)",
+    )
+    p.add_argument(
+        "--only-countries",
+        default=None,
+        metavar="CODES",
+        help="Requires --split-by-country: only build and write the outputs of these comma-separated countries (e.g. DEU,FRA)",
+    )
+    p.add_argument(
+        "--skip-unchanged",
+        action="store_true",
+        help="Use a build cache: skip the run when input, converter version and options are unchanged, and only rewrite output files whose content changed",
+    )
+    p.add_argument(
+        "--build-cache",
+        default=None,
+        metavar="PATH",
+        help=f"Build cache file for --skip-unchanged (default: {BUILD_CACHE_FILENAME} next to the outputs)",
+    )
+    p.add_argument(
+        "--timings",
+        action="store_true",
+        help="Print per-stage timings ('Timing (s) => ...') and counters ('Counts => ...') after the run",
+    )
+    p.add_argument(
+        "--timings-json",
+        default=None,
+        metavar="PATH",
+        help="Write per-stage timings, per-country build times and counters to a JSON file",
+    )
 
     p.add_argument(
         "--media-config",
@@ -274,22 +375,68 @@ def build_cli_parser() -> argparse.ArgumentParser:
             "By default all three are non-fatal warnings and conversion continues."
         ),
     )
+    add_profiling_arguments(p)
     return p
 
 
+# Tool arguments may be DeferredTool loaders, resolved only when used.
+_OptionalTool = Union[DeferredTool, Callable[..., Any]]
+
+
 def run_cli(
     argv: Optional[List[str]],
     *,
     convert_csv_to_json: Callable[..., Dict[str, Any]],
     script_file_path: str,
-    layercfg_convert_workbook: Optional[Callable[..., Any]],
-    media_read_csv: Optional[Callable[..., Any]],
-    media_group_by_country_language: Optional[Callable[..., Any]],
-    media_convert_rows: Optional[Callable[..., Any]],
+    layercfg_convert_workbook: Optional[_OptionalTool],
+    media_read_csv: Optional[_OptionalTool],
+    media_group_by_country_language: Optional[_OptionalTool],
+    media_convert_rows: Optional[_OptionalTool],
 ) -> int:
     p = build_cli_parser()
     args = p.parse_args(argv)
+    if args.only_countries and not args.split_by_country:
+        p.error("--only-countries requires --split-by-country")
+    instrumentation: Instrumentation
+    if args.trace_memory:
+        instrumentation = MemoryTracer()
+    elif args.timings or args.timings_json:
+        instrumentation = Instrumentation()
+    else:
+        instrumentation = NULL_INSTRUMENTATION
+    run = functools.partial(
+        _run_cli_args,
+        args,
+        instrumentation,
+        convert_csv_to_json=convert_csv_to_json,
+        script_file_path=script_file_path,
+        layercfg_convert_workbook=layercfg_convert_workbook,
+        media_read_csv=media_read_csv,
+        media_group_by_country_language=media_group_by_country_language,
+        media_convert_rows=media_convert_rows,
+    )
+    if args.profile or args.trace_memory:
+        return run_profiled(
+            run,
+            profile_path=args.profile,
+            memory_tracer=(
+                instrumentation if isinstance(instrumentation, MemoryTracer) else None
+            ),
+        )
+    return run()
+
 
+def _run_cli_args(
+    args: argparse.Namespace,
+    instrumentation: Instrumentation,
+    *,
+    convert_csv_to_json: Callable[..., Dict[str, Any]],
+    script_file_path: str,
+    layercfg_convert_workbook: Optional[_OptionalTool],
+    media_read_csv: Optional[_OptionalTool],
+    media_group_by_country_language: Optional[_OptionalTool],
+    media_convert_rows: Optional[_OptionalTool],
+) -> int:
     runtime_error_count = 0
 
     def _report_runtime_error(message: str):
@@ -298,9 +445,19 @@ def run_cli(
         print(message, file=sys.stderr)
 
     def _print_conversion_summary(files_written: int, validation_errors: int = 0):
+        if args.timings_json:
+            try:
+                instrumentation.write_json(args.timings_json)
+            except OSError as ex:
+                _report_runtime_error(
+                    f"Warning: failed to write timings '{args.timings_json}': {ex}"
+                )
         print(
             f"Conversion complete: Files written: {files_written}, Errors: {runtime_error_count + validation_errors}"
         )
+        if args.timings:
+            print(instrumentation.timing_line())
+            print(instrumentation.counts_line())
 
     if not os.path.exists(args.input):
         _report_runtime_error(
@@ -315,62 +472,17 @@ def run_cli(
         # may be unavailable. Prefer env in that context only.
         if getattr(sys, "frozen", False) and env_val and env_val.strip():
             return env_val.strip()
-        try:
-            repo_root = os.path.dirname(
-                os.path.dirname(os.path.abspath(script_file_path))
-            )
-            py_dir = os.path.dirname(os.path.abspath(script_file_path))
-            changelog_candidates = [
-                os.path.join(repo_root, "CHANGELOG.md"),
-                os.path.join(py_dir, "readMe", "CHANGELOG.md"),
-            ]
-            for changelog_path in changelog_candidates:
-                if os.path.isfile(changelog_path):
-                    with open(changelog_path, "r", encoding="utf-8") as chf:
-                        for line in chf:
-                            stripped_line = line.strip()
-                            if stripped_line.startswith("#"):
-                                heading = stripped_line.lstrip("#").strip()
-                                m = re.match(
-                                    r"\[?v?([0-9]+\.[0-9]+\.[0-9]+(?:[-+][A-Za-z0-9.]+)?)",
-                                    heading,
-                                )
-                                if m:
-                                    return m.group(1)
-                                token = heading.split()[0]
-                                if re.match(r"v?[0-9]+\.[0-9]+(\.[0-9]+)?", token):
-                                    return token.lstrip("v")
-                                break
-        except Exception:
-            pass
+        provenance = resolve_provenance(script_file_path)
+        if provenance.changelog_version:
+            return provenance.changelog_version
         # For source runs, allow env fallback only when changelog parsing fails.
         if env_val and env_val.strip():
             return env_val.strip()
-        try:
-            tag = (
-                subprocess.check_output(
-                    ["git", "describe", "--tags", "--abbrev=0"],
-                    stderr=subprocess.DEVNULL,
-                )
-                .decode("utf-8")
-                .strip()
-            )
-            if tag:
-                return tag[1:] if tag.startswith("v") else tag
-        except Exception:
-            pass
-        try:
-            sc = (
-                subprocess.check_output(
-                    ["git", "rev-parse", "--short", "HEAD"], stderr=subprocess.DEVNULL
-                )
-                .decode("utf-8")
-                .strip()
-            )
-            if sc:
-                return f"0.0.0+{sc}"
-        except Exception:
-            pass
+        tag = provenance.git_tag
+        if tag:
+            return tag[1:] if tag.startswith("v") else tag
+        if provenance.git_commit:
+            return f"0.0.0+{provenance.git_commit}"
         return "dev"
 
     if args.converter_version in ("auto", "dev", "", None):  # type: ignore[arg-type]
@@ -402,6 +514,30 @@ def run_cli(
     else:
         round_ndigits = None
 
+    build_cache_path: Optional[str] = None
+    build_run_key: Optional[str] = None
+    previous_fingerprints: Optional[Dict[str, str]] = None
+    if args.skip_unchanged and not args.check:
+        build_cache_path = args.build_cache or default_build_cache_path(
+            args.output_pattern or args.output
+        )
+        build_run_key = compute_run_key(
+            input_path=args.input,
+            converter_version=args.converter_version,
+            options=vars(args),
+            extra_files=(args.media_config, args.layer_config),
+        )
+        build_cache = load_build_cache(build_cache_path)
+        if is_build_cache_hit(build_cache, build_run_key):
+            print(
+                f"Build cache hit ({build_cache_path}): input and options unchanged, skipping conversion."
+            )
+            _print_conversion_summary(0)
+            return 0
+        # Outputs are still compared by content, so unchanged files keep
+        # their timestamps even when the options changed.
+        previous_fingerprints = dict(build_cache.get("outputs") or {})
+
     data = convert_csv_to_json(
         input_csv=args.input,
         fps=args.fps,
@@ -430,21 +566,18 @@ def run_cli(
         flags_overview_object_always=args.flags_overview_object_always,
         xlsx_sheet=args.xlsx_sheet,
         controller_always_emit=args.controller_always_emit,
+        all_variants=args.split_by_country,
+        shared_payloads=args.shared_payloads,
+        instrumentation=instrumentation,
     )
 
     if args.no_logo_anim_overview and isinstance(data, dict):
-
-        def _strip(obj: Dict[str, Any]):
-            mg = obj.get("metadataGlobal") or obj.get("metadata")
-            if isinstance(mg, dict) and "logo_anim_flag" in mg:
-                del mg["logo_anim_flag"]
-
         if data.get("_multi"):
-            for _c, node in (data.get("byCountry") or {}).items():
-                if isinstance(node, dict):
-                    _strip(node)
+            apply_to_payloads(data.get("byCountry") or {}, strip_logo_anim_overview)
+            for variant_nodes in (data.get("_variantsByIndex") or {}).values():
+                apply_to_payloads(variant_nodes, strip_logo_anim_overview)
         else:
-            _strip(data)
+            strip_logo_anim_overview(data)
 
     if (not args.no_generation_meta) and (not getattr(args, "check", False)):
         inject_generation_metadata(
@@ -456,6 +589,7 @@ def run_cli(
 
     layer_config_payload: Optional[Dict[str, Any]] = None
     if args.layer_config:
+        layercfg_convert_workbook = resolve_optional_tool(layercfg_convert_workbook)
         if not os.path.isfile(args.layer_config):
             _report_runtime_error(
                 f"Warning: failed to load layer config '{args.layer_config}': "
@@ -520,6 +654,11 @@ def run_cli(
 
     media_groups_map: Dict[Tuple[str, str], Dict[str, Any]] = {}
     if args.media_config:
+        media_read_csv = resolve_optional_tool(media_read_csv)
+        media_group_by_country_language = resolve_optional_tool(
+            media_group_by_country_language
+        )
+        media_convert_rows = resolve_optional_tool(media_convert_rows)
         if (
             media_read_csv is None
             or media_group_by_country_language is None
@@ -555,258 +694,42 @@ def run_cli(
                     file=sys.stderr,
                 )
 
-    def _validate_structure(obj: Dict[str, Any]) -> Dict[str, List[str]]:
-        errs: List[str] = []
-        warnings: List[str] = []
-        raw_keys = args.required_global_keys.strip()
-        if raw_keys in ("", '""', "none", "off", "disable", "disabled"):
-            required_global_keys = []
-        else:
-            parts = []
-            for segment in raw_keys.split(","):
-                seg = segment.strip().strip('"').strip("'")
-                if seg:
-                    parts.append(seg)
-            required_global_keys = parts
-        if (
-            any(k in obj for k in ("subtitles", "claim", "disclaimer", "disclaimer_02"))
-            and "videos" not in obj
-        ):
-            for arr_name in ("subtitles", "claim", "disclaimer", "disclaimer_02"):
-                arr = obj.get(arr_name)
-                if arr is None:
-                    continue
-                if not isinstance(arr, list):
-                    errs.append(f"{arr_name} is not a list")
-                    continue
-                prev_out: Optional[float] = None
-                for i, item in enumerate(arr):
-                    if not isinstance(item, dict):
-                        errs.append(f"{arr_name}[{i}] not an object")
-                        continue
-                    tin = item.get("in")
-                    tout = item.get("out")
-                    try:
-                        if tin is not None and tout is not None:
-                            ftin = float(tin)
-                            ftout = float(tout)
-                            if ftin > ftout:
-                                errs.append(
-                                    f"{arr_name}[{i}] in > out ({tin} > {tout})"
-                                )
-                            if prev_out is not None and ftin < prev_out:
-                                errs.append(
-                                    f"{arr_name}[{i}] overlaps previous (start {ftin} < prev end {prev_out})"
-                                )
-                            prev_out = ftout
-                    except Exception:
-                        pass
-            return {"errors": errs, "warnings": warnings}
-
-        if args.no_orientation:
-            for nm in ("claim", "disclaimer", "disclaimer_02", "logo"):
-                val = obj.get(nm)
-                if val is not None and not isinstance(val, list):
-                    errs.append(f"{nm} must be a list in --no-orientation mode")
-        else:
+    # One traversal per payload yields the errors/warnings and the --check
+    # summary counters.
+    schema = build_schema(
+        required_global_keys=parse_required_global_keys(args.required_global_keys),
+        missing_keys_warn=args.missing_keys_warn,
+        no_orientation=args.no_orientation,
+    )
+    _validate = compile_validator(schema)
 
-            def _validate_orientation_array(name: str, val: Any):
-                if val is None:
-                    return
-                if not isinstance(val, dict):
-                    errs.append(
-                        f"{name} must be an object with landscape/portrait keys"
-                    )
-                    return
-                for key in ("landscape", "portrait"):
-                    if key not in val:
-                        errs.append(f"{name}.{key} missing")
-                for key in ("landscape", "portrait"):
-                    arr = val.get(key)
-                    if arr is None:
-                        continue
-                    if not isinstance(arr, list):
-                        errs.append(f"{name}.{key} not a list")
-                    else:
-                        for i, elem in enumerate(arr):
-                            if not isinstance(elem, str):
-                                errs.append(f"{name}.{key}[{i}] not a string")
-                if isinstance(val.get("landscape"), list) and isinstance(
-                    val.get("portrait"), list
-                ):
-                    land = val["landscape"]
-                    port = val["portrait"]
-                    if land and not port:
-                        warnings.append(
-                            f"{name}: portrait empty while landscape has data (expected mirror)"
-                        )
-                    if land and port and len(port) != len(land):
-                        warnings.append(
-                            f"{name}: landscape/portrait length mismatch {len(land)}!={len(port)}"
-                        )
+    def _validate_structure(obj: Dict[str, Any]) -> Dict[str, Any]:
+        with instrumentation.span("validate", exclude=("build",)):
+            return _validate(obj)
 
-            _validate_orientation_array("claim", obj.get("claim"))
-            _validate_orientation_array("disclaimer", obj.get("disclaimer"))
-            _validate_orientation_array("disclaimer_02", obj.get("disclaimer_02"))
-            _validate_orientation_array("logo", obj.get("logo"))
-        gm = obj.get("metadataGlobal", {})
-        if gm and isinstance(gm, dict) and required_global_keys:
-            for k in required_global_keys:
-                if k not in gm:
-                    if args.missing_keys_warn:
-                        warnings.append(f"metadataGlobal missing required key '{k}'")
-                    else:
-                        errs.append(f"metadataGlobal missing required key '{k}'")
+    file_write_count = 0
+    unchanged_file_count = 0
+    output_fingerprints: Dict[str, str] = {}
 
-        videos = obj.get("videos")
-        if videos is not None:
-            if not isinstance(videos, list):
-                errs.append("videos is not a list")
+    def _record_writes(results: List[WriteResult]):
+        nonlocal file_write_count, unchanged_file_count
+        for result in results:
+            if result.written:
+                file_write_count += 1
+                if instrumentation.enabled:
+                    instrumentation.count("filesWritten")
+                    instrumentation.count("bytesWritten", os.path.getsize(result.path))
             else:
-                for v_index, v in enumerate(videos):
-                    if not isinstance(v, dict):
-                        errs.append(f"videos[{v_index}] not an object")
-                        continue
-                    vid = v.get("videoId")
-                    if isinstance(vid, str):
-                        if not (
-                            vid.endswith("_landscape") or vid.endswith("_portrait")
-                        ):
-                            warnings.append(
-                                f"videos[{v_index}].videoId missing orientation suffix"
-                            )
-                    meta = v.get("metadata", {})
-                    if isinstance(meta, dict):
-                        orient = meta.get("orientation")
-                        if isinstance(vid, str) and (
-                            vid.endswith("_landscape") or vid.endswith("_portrait")
-                        ):
-                            expected = (
-                                "landscape"
-                                if vid.endswith("_landscape")
-                                else "portrait"
-                            )
-                            if orient != expected:
-                                errs.append(
-                                    f"videos[{v_index}].metadata.orientation '{orient}' != expected '{expected}'"
-                                )
-                        if "orientation" not in meta:
-                            warnings.append(
-                                f"videos[{v_index}].metadata missing orientation"
-                            )
-                    subs = v.get("subtitles")
-                    if subs is None:
-                        continue
-                    if not isinstance(subs, list):
-                        errs.append(f"videos[{v_index}].subtitles not a list")
-                        continue
-                    prev_out: Optional[float] = None
-                    for si, s in enumerate(subs):
-                        if not isinstance(s, dict):
-                            errs.append(
-                                f"videos[{v_index}].subtitles[{si}] not an object"
-                            )
-                            continue
-                        tin = s.get("in")
-                        tout = s.get("out")
-                        try:
-                            if tin is not None and tout is not None:
-                                ftin = float(tin)
-                                ftout = float(tout)
-                                if ftin > ftout:
-                                    errs.append(
-                                        f"videos[{v_index}].subtitles[{si}] in > out ({tin} > {tout})"
-                                    )
-                                if prev_out is not None and ftin < prev_out:
-                                    errs.append(
-                                        f"videos[{v_index}].subtitles[{si}] overlaps previous (start {ftin} < prev end {prev_out})"
-                                    )
-                                prev_out = ftout
-                        except Exception:
-                            pass
-        return {"errors": errs, "warnings": warnings}
-
-    file_write_count = 0
+                unchanged_file_count += 1
+            if result.fingerprint is not None:
+                output_fingerprints[os.path.abspath(result.path)] = result.fingerprint
 
     def write_json(path: str, payload: Dict[str, Any]):
-        nonlocal file_write_count
-        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(payload, f, ensure_ascii=False, indent=2)
-        file_write_count += 1
-
-    def make_sample(payload: Dict[str, Any]) -> Dict[str, Any]:
-        SAMPLE_LIMITS = {
-            "claim": 2,
-            "disclaimer": 1,
-            "disclaimer_02": 1,
-            "logo": 1,
-            "videos": 2,
-            "subtitles": 5,
-            "video_claim": 2,
-        }
-
-        def _truncate_top_arrays(obj: Dict[str, Any]):
-            out = obj
-            if "claim" in out and isinstance(out["claim"], list):
-                out["claim"] = out["claim"][: SAMPLE_LIMITS["claim"]]
-            if "disclaimer" in out and isinstance(out["disclaimer"], list):
-                out["disclaimer"] = out["disclaimer"][: SAMPLE_LIMITS["disclaimer"]]
-            if "disclaimer_02" in out and isinstance(out["disclaimer_02"], list):
-                out["disclaimer_02"] = out["disclaimer_02"][
-                    : SAMPLE_LIMITS["disclaimer_02"]
-                ]
-            if "logo" in out and isinstance(out["logo"], list):
-                out["logo"] = out["logo"][: SAMPLE_LIMITS["logo"]]
-            for key in ("claim", "disclaimer", "disclaimer_02", "logo"):
-                val = out.get(key)
-                if isinstance(val, dict):
-                    for orient in ("landscape", "portrait"):
-                        arr = val.get(orient)
-                        if isinstance(arr, list):
-                            limit = (
-                                SAMPLE_LIMITS["claim"]
-                                if key == "claim"
-                                else SAMPLE_LIMITS["disclaimer"]
-                                if key == "disclaimer"
-                                else SAMPLE_LIMITS["disclaimer_02"]
-                                if key == "disclaimer_02"
-                                else SAMPLE_LIMITS["logo"]
-                            )
-                            val[orient] = arr[:limit]
-            return out
-
-        sample = copy.deepcopy(payload)
-        if sample.get("_multi") and isinstance(sample.get("byCountry"), dict):
-            for c, pld in sample.get("byCountry", {}).items():
-                sample["byCountry"][c] = make_sample(pld)
-            countries = sample.get("countries")
-            if isinstance(countries, list):
-                sample["countries"] = countries[:3]
-            return sample
-        sample = _truncate_top_arrays(sample)
-        vids = sample.get("videos")
-        if isinstance(vids, list):
-            vids_trunc = []
-            for v in vids[: SAMPLE_LIMITS["videos"]]:
-                v2 = copy.deepcopy(v)
-                subs = v2.get("subtitles")
-                if isinstance(subs, list):
-                    v2["subtitles"] = subs[: SAMPLE_LIMITS["subtitles"]]
-                if "claim" in v2 and isinstance(v2["claim"], list):
-                    v2["claim"] = v2["claim"][: SAMPLE_LIMITS["video_claim"]]
-                claim_keys = sorted([k for k in v2.keys() if k.startswith("claim_")])
-                for ck in claim_keys[SAMPLE_LIMITS["video_claim"] :]:
-                    del v2[ck]
-                vids_trunc.append(v2)
-            sample["videos"] = vids_trunc
-        if "subtitles" in sample and isinstance(sample["subtitles"], list):
-            sample["subtitles"] = sample["subtitles"][: SAMPLE_LIMITS["subtitles"]]
-        return sample
-
-    def derive_sample_path(path: str) -> str:
-        root, ext = os.path.splitext(path)
-        return f"{root}_sample{ext or '.json'}"
+        with instrumentation.span("write", exclude=("build",)):
+            result = write_json_file(
+                path, payload, previous_fingerprints=previous_fingerprints
+            )
+        _record_writes([result])
 
     if isinstance(data, dict) and data.get("_multi"):
         countries: List[str] = data.get("countries", [])
@@ -816,37 +739,72 @@ def run_cli(
             all_warnings: List[str] = []
             reports: List[Dict[str, Any]] = []
             print(f"Discovered countries ({len(countries)}): {countries}")
-            for c in countries:
-                payload = by_country.get(c, {})
-                res = _validate_structure(payload)
-                vids_objs = [
-                    v for v in payload.get("videos", []) if isinstance(v, dict)
-                ]
-                vids = [v.get("videoId") for v in vids_objs]
-                subtitle_count = sum(len(v.get("subtitles", [])) for v in vids_objs)
+            check_cache_path: Optional[str] = None
+            check_cache: Dict[str, Any] = {}
+            check_key = ""
+            input_digest: Optional[InputDigest] = None
+            reused: Dict[str, CountryCheck] = {}
+            if args.incremental_check and not args.validation_report:
+                print(
+                    "Warning: --incremental-check needs --validation-report; running a full check",
+                    file=sys.stderr,
+                )
+            elif args.incremental_check:
+                check_cache_path = default_check_cache_path(args.validation_report)
+                check_cache = load_check_cache(check_cache_path)
+                check_key = compute_check_key(
+                    converter_version=args.converter_version,
+                    options=vars(args),
+                    extra_files=(args.media_config, args.layer_config),
+                )
+                try:
+                    input_digest = digest_input(
+                        args.input,
+                        encoding=args.encoding,
+                        delimiter=args.delimiter,
+                        xlsx_sheet=args.xlsx_sheet,
+                    )
+                except Exception:
+                    input_digest = None
+                reused = reusable_checks(check_cache, check_key, input_digest)
+            # With --jobs, payloads are built and validated in worker
+            # processes, so that build time shows up under "validate".
+            with instrumentation.span("validate", exclude=("build",)):
+                fresh = check_countries(
+                    [c for c in countries if c not in reused],
+                    by_country,
+                    schema,
+                    args.jobs,
+                )
+            fresh_by_country = {r.country: r for r in fresh}
+            checks = [reused.get(c) or fresh_by_country[c] for c in countries]
+            metadata_by_country = {r.country: r.metadata_global for r in checks}
+            for r in checks:
+                c = r.country
+                summary = r.summary
                 print(
-                    f"  {c}: videos={len(vids)} subtitleLines={subtitle_count} claimLines={len(payload.get('claim', []))} disclaimerLines={len(payload.get('disclaimer', []))} disclaimer_02Lines={len(payload.get('disclaimer_02', []))} logoLines={len(payload.get('logo', []))}"
+                    f"  {c}: videos={len(summary['videos'])} subtitleLines={summary['subtitleLines']} claimLines={summary['claimLines']} disclaimerLines={summary['disclaimerLines']} disclaimer_02Lines={summary['disclaimer_02Lines']} logoLines={summary['logoLines']}"
                 )
-                all_errors.extend([f"{c}: {e}" for e in res["errors"]])
-                all_warnings.extend([f"{c}: {w}" for w in res["warnings"]])
+                all_errors.extend([f"{c}: {e}" for e in r.errors])
+                all_warnings.extend([f"{c}: {w}" for w in r.warnings])
                 reports.append(
                     {
                         "country": c,
-                        "errors": res["errors"],
-                        "warnings": res["warnings"],
-                        "videos": [
-                            {
-                                "videoId": v.get("videoId"),
-                                "subtitleCount": len(v.get("subtitles", [])),
-                            }
-                            for v in vids_objs
-                        ],
-                        "claimLines": len(payload.get("claim", [])),
-                        "disclaimerLines": len(payload.get("disclaimer", [])),
-                        "disclaimer_02Lines": len(payload.get("disclaimer_02", [])),
-                        "logoLines": len(payload.get("logo", [])),
+                        "errors": r.errors,
+                        "warnings": r.warnings,
+                        "videos": summary["videos"],
+                        "claimLines": summary["claimLines"],
+                        "disclaimerLines": summary["disclaimerLines"],
+                        "disclaimer_02Lines": summary["disclaimer_02Lines"],
+                        "logoLines": summary["logoLines"],
+                        "timings": {
+                            "buildSeconds": round(r.build_seconds, 6),
+                            "validateSeconds": round(r.validate_seconds, 6),
+                        },
                     }
                 )
+                if check_cache_path:
+                    reports[-1]["cached"] = r.cached
             if all_warnings:
                 print("Validation warnings:")
                 for w in all_warnings:
@@ -855,6 +813,18 @@ def run_cli(
                 print("Validation errors:")
                 for e in all_errors:
                     print(f"  - {e}")
+            delta: Optional[Dict[str, Any]] = None
+            if check_cache_path:
+                delta = {
+                    "baseline": bool(check_cache),
+                    "revalidated": [r.country for r in fresh],
+                    "reused": [r.country for r in checks if r.cached],
+                    **diff_issues(cached_issues(check_cache), check_issues(checks)),
+                }
+                print(
+                    f"Incremental check: revalidated {len(fresh)} of {len(countries)} countries; "
+                    f"issues new={len(delta['new'])}, fixed={len(delta['fixed'])}, unchanged={len(delta['unchanged'])}"
+                )
             if args.validation_report:
                 report_obj = {
                     "input": os.path.abspath(args.input),
@@ -865,6 +835,8 @@ def run_cli(
                         "warnings": len(all_warnings),
                     },
                 }
+                if delta is not None:
+                    report_obj["delta"] = delta
                 report_error = write_validation_report(
                     report_path=args.validation_report,
                     report_obj=report_obj,
@@ -874,6 +846,14 @@ def run_cli(
                         f"Failed to write validation report: {report_error}",
                         file=sys.stderr,
                     )
+            if check_cache_path:
+                try:
+                    save_check_cache(check_cache_path, check_key, input_digest, checks)
+                except Exception as ex:
+                    print(
+                        f"Warning: failed to write check cache '{check_cache_path}': {ex}",
+                        file=sys.stderr,
+                    )
             print("Check mode output targets:")
             if args.split_by_country:
                 pattern = ensure_country_placeholder(args.output_pattern or args.output)
@@ -882,51 +862,21 @@ def run_cli(
                     if isinstance(data, dict)
                     else {}
                 )
+                variants_by_index: Dict[int, Dict[str, Any]] = (
+                    data.get("_variantsByIndex", {}) if isinstance(data, dict) else {}
+                )
                 for c in countries:
                     count = max(1, int(variant_counts.get(c, 1)))
                     for vi in range(count):
                         if vi == 0:
-                            payload = by_country.get(c, {})
+                            mg = metadata_by_country.get(c)
                         else:
-                            alt = convert_csv_to_json(
-                                input_csv=args.input,
-                                fps=args.fps,
-                                start_line_index=args.start_line,
-                                round_ndigits=round_ndigits,
-                                times_as_string=args.times_as_string,
-                                strip_text=not args.no_strip_text,
-                                skip_empty_text=not args.keep_empty_text,
-                                encoding=args.encoding,
-                                delimiter=args.delimiter,
-                                start_col=args.start_col,
-                                end_col=args.end_col,
-                                text_col=args.text_col,
-                                verbose=False,
-                                schema_version=args.schema_version,
-                                merge_subtitles=not args.no_merge_subtitles,
-                                merge_disclaimer=not args.merge_disclaimer,
-                                merge_disclaimer_02=not args.merge_disclaimer_02,
-                                cast_metadata=args.cast_metadata,
-                                join_claim=args.join_claim,
-                                prefer_local_claim_disclaimer=args.prefer_local_claim_disclaimer,
-                                test_mode=args.test_mode,
-                                claims_as_objects=args.claims_as_objects,
-                                no_orientation=args.no_orientation,
-                                country_variant_index=vi,
-                                flags_overview_object_always=args.flags_overview_object_always,
-                                xlsx_sheet=args.xlsx_sheet,
-                                controller_always_emit=args.controller_always_emit,
+                            payload = variants_by_index.get(vi, {}).get(c, {})
+                            mg = (
+                                payload.get("metadataGlobal")
+                                if isinstance(payload, dict)
+                                else None
                             )
-                            payload = (
-                                alt.get("byCountry", {})
-                                if isinstance(alt, dict)
-                                else {}
-                            ).get(c, {})
-                        mg = (
-                            payload.get("metadataGlobal")
-                            if isinstance(payload, dict)
-                            else None
-                        )
                         out_path = resolve_country_output_path(
                             pattern=pattern,
                             country_code=c,
@@ -946,10 +896,15 @@ def run_cli(
                     csel = countries[args.country_column - 1]
                 else:
                     csel = countries[-1] if countries else "default"
-                payload = by_country.get(csel, {})
-                mg = (
-                    payload.get("metadataGlobal") if isinstance(payload, dict) else None
-                )
+                if csel in metadata_by_country:
+                    mg = metadata_by_country[csel]
+                else:
+                    payload = by_country.get(csel, {})
+                    mg = (
+                        payload.get("metadataGlobal")
+                        if isinstance(payload, dict)
+                        else None
+                    )
                 out_path_single = resolve_single_country_output_path(
                     output=args.output,
                     output_pattern=args.output_pattern,
@@ -977,98 +932,83 @@ def run_cli(
             _print_conversion_summary(0, len(all_errors))
             return exit_code
         if args.split_by_country:
-            pattern = ensure_country_placeholder(args.output_pattern or args.output)
             variant_counts: Dict[str, int] = (
                 data.get("_countryVariantCount", {}) if isinstance(data, dict) else {}
             )
-            for c in countries:
-                count = max(1, int(variant_counts.get(c, 1)))
-                for vi in range(count):
-                    if vi == 0:
-                        payload = by_country.get(
-                            c,
-                            {
-                                "subtitles": [],
-                                "claim": [],
-                                "disclaimer": [],
-                                "metadata": {},
-                            },
+            variants_by_index: Dict[int, Dict[str, Any]] = (
+                data.get("_variantsByIndex", {}) if isinstance(data, dict) else {}
+            )
+            payload_sources: Dict[int, Dict[str, Any]] = {
+                0: by_country,
+                **variants_by_index,
+            }
+            write_options = SplitWriteOptions(
+                pattern=ensure_country_placeholder(args.output_pattern or args.output),
+                media_groups_map=media_groups_map,
+                layer_config_payload=layer_config_payload,
+                sample=args.sample,
+                previous_fingerprints=previous_fingerprints,
+            )
+            split_tasks = [
+                (c, max(1, int(variant_counts.get(c, 1)))) for c in countries
+            ]
+            if args.only_countries:
+                wanted = {
+                    c.strip() for c in args.only_countries.split(",") if c.strip()
+                }
+                unknown = sorted(wanted.difference(countries))
+                if unknown:
+                    print(
+                        f"Warning: --only-countries: not in input: {', '.join(unknown)}",
+                        file=sys.stderr,
+                    )
+                split_tasks = [task for task in split_tasks if task[0] in wanted]
+            # Streamed payloads build their videos while being serialized, so
+            # that part of the build shows up under "write".
+            with instrumentation.span("write", exclude=("build",)):
+                if all(
+                    isinstance(src, LazyCountryPayloads)
+                    for src in payload_sources.values()
+                ):
+                    # Payloads are built per write (streamed, never cached here),
+                    # in-process or in --jobs worker processes.
+                    factories = {
+                        vi: cast(LazyCountryPayloads, src).payload_factory()
+                        for vi, src in payload_sources.items()
+                    }
+                    if args.jobs > 1 and len(split_tasks) > 1:
+                        split_results: Iterable[Tuple[str, int]] = (
+                            write_split_outputs_parallel(
+                                split_tasks, factories, write_options, args.jobs
+                            )
                         )
                     else:
-                        alt = convert_csv_to_json(
-                            input_csv=args.input,
-                            fps=args.fps,
-                            start_line_index=args.start_line,
-                            round_ndigits=round_ndigits,
-                            times_as_string=args.times_as_string,
-                            strip_text=not args.no_strip_text,
-                            skip_empty_text=not args.keep_empty_text,
-                            encoding=args.encoding,
-                            delimiter=args.delimiter,
-                            start_col=args.start_col,
-                            end_col=args.end_col,
-                            text_col=args.text_col,
-                            verbose=False,
-                            schema_version=args.schema_version,
-                            merge_subtitles=not args.no_merge_subtitles,
-                            merge_disclaimer=not args.merge_disclaimer,
-                            merge_disclaimer_02=not args.merge_disclaimer_02,
-                            cast_metadata=args.cast_metadata,
-                            join_claim=args.join_claim,
-                            prefer_local_claim_disclaimer=args.prefer_local_claim_disclaimer,
-                            test_mode=args.test_mode,
-                            claims_as_objects=args.claims_as_objects,
-                            no_orientation=args.no_orientation,
-                            country_variant_index=vi,
-                            flags_overview_object_always=args.flags_overview_object_always,
-                            xlsx_sheet=args.xlsx_sheet,
-                            controller_always_emit=args.controller_always_emit,
-                        )
-                        if not args.no_generation_meta:
-                            try:
-                                inject_generation_metadata(
-                                    alt,
-                                    input_path=args.input,
-                                    converter_version=args.converter_version,
-                                    script_file_path=script_file_path,
-                                )
-                            except Exception:
-                                pass
-                        payload = (
-                            alt.get("byCountry", {}) if isinstance(alt, dict) else {}
-                        ).get(
-                            c,
-                            {
-                                "subtitles": [],
-                                "claim": [],
-                                "disclaimer": [],
-                                "metadata": {},
-                            },
-                        )
-                    if isinstance(payload, dict):
-                        inject_media_mapping(payload, c, media_groups_map)
-                        inject_layer_config_payload(payload, layer_config_payload)
-                    if isinstance(payload, dict):
-                        trim_logo_anim_flag_for_country(
-                            payload=payload,
-                            country_code=c,
+                        split_results = (
+                            result
+                            for task in split_tasks
+                            for result in iter_split_task(
+                                task, factories, write_options
+                            )
                         )
-                    mg = (
-                        payload.get("metadataGlobal")
-                        if isinstance(payload, dict)
-                        else None
-                    )
-                    out_path = resolve_country_output_path(
-                        pattern=pattern,
-                        country_code=c,
-                        metadata_global=mg,
-                    )
-                    if args.verbose:
-                        print(f"Writing {out_path}")
-                    write_json(out_path, payload)
-                    if args.sample:
-                        sample_path = derive_sample_path(out_path)
-                        write_json(sample_path, make_sample(payload))
+                    for out_path, results in split_results:
+                        if args.verbose:
+                            if results[0].written:
+                                print(f"Writing {out_path}")
+                            else:
+                                print(f"Unchanged {out_path} (not rewritten)")
+                        _record_writes(results)
+                else:
+                    for c, count in split_tasks:
+                        for vi in range(count):
+                            payload = payload_sources.get(vi, {}).get(
+                                c, empty_country_payload()
+                            )
+                            out_path = prepare_country_output(payload, c, write_options)
+                            if args.verbose:
+                                print(f"Writing {out_path}")
+                            _record_writes(
+                                write_country_output(out_path, payload, write_options)
+                            )
         else:
             csel = None
             if args.country_column and 1 <= args.country_column <= len(countries):
@@ -1154,5 +1094,24 @@ def run_cli(
             sample_path = derive_sample_path(args.output)
             write_json(sample_path, make_sample(data))
 
+    if build_cache_path and build_run_key:
+        if unchanged_file_count:
+            print(
+                f"Build cache: {unchanged_file_count} unchanged file(s) not rewritten."
+            )
+        if runtime_error_count == 0:
+            if args.only_countries:
+                # Partial (e.g. --watch) runs keep the other countries' entries.
+                output_fingerprints = {
+                    **(previous_fingerprints or {}),
+                    **output_fingerprints,
+                }
+            try:
+                save_build_cache(build_cache_path, build_run_key, output_fingerprints)
+            except OSError as ex:
+                _report_runtime_error(
+                    f"Warning: failed to write build cache '{build_cache_path}': {ex}"
+                )
+
     _print_conversion_summary(file_write_count)
     return 0
@@ -1,12 +1,57 @@
 from __future__ import annotations
 
 from datetime import datetime
+import functools
 import hashlib
 import os
 import platform
-import subprocess
+from collections.abc import Mapping
 from typing import Any, Dict, Optional
 
+from .lazy_payloads import apply_to_payloads
+from .provenance import resolve_provenance
+
+
+def _augment_payload(
+    pld: Dict[str, Any],
+    *,
+    timestamp: str,
+    checksum: str,
+    input_file_name: str,
+    converter_version: str,
+    git_commit: Optional[str],
+    py_version: str,
+    impl: str,
+    platform_str: str,
+    last_change_id: Optional[str],
+) -> None:
+    if "metadataGlobal" in pld and isinstance(pld.get("metadataGlobal"), dict):
+        mg = pld["metadataGlobal"]
+        mg["generatedAt"] = timestamp
+        mg["inputSha256"] = checksum
+        mg.setdefault("inputFileName", input_file_name)
+        mg["converterVersion"] = converter_version
+        if git_commit and "converterCommit" not in mg:
+            mg["converterCommit"] = git_commit
+        mg.setdefault("pythonVersion", py_version)
+        mg.setdefault("pythonImplementation", impl)
+        mg.setdefault("platform", platform_str)
+        if last_change_id and "lastChangeId" not in mg:
+            mg["lastChangeId"] = last_change_id
+    elif "metadata" in pld and isinstance(pld.get("metadata"), dict):
+        mg = pld["metadata"]
+        mg["generatedAt"] = timestamp
+        mg["inputSha256"] = checksum
+        mg.setdefault("inputFileName", input_file_name)
+        mg["converterVersion"] = converter_version
+        if git_commit and "converterCommit" not in mg:
+            mg["converterCommit"] = git_commit
+        mg.setdefault("pythonVersion", py_version)
+        mg.setdefault("pythonImplementation", impl)
+        mg.setdefault("platform", platform_str)
+        if last_change_id and "lastChangeId" not in mg:
+            mg["lastChangeId"] = last_change_id
+
 
 def inject_generation_metadata(
     obj: Dict[str, Any],
@@ -32,85 +77,38 @@ def inject_generation_metadata(
         utc_now = datetime.now(timezone.utc)
     timestamp = utc_now.replace(microsecond=0).isoformat().replace("+00:00", "Z")
 
-    git_commit: Optional[str] = None
-    try:
-        git_commit = (
-            subprocess.check_output(
-                ["git", "rev-parse", "--short", "HEAD"], stderr=subprocess.DEVNULL
-            )
-            .decode("utf-8")
-            .strip()
-            or None
-        )
-    except Exception:
-        git_commit = None
+    provenance = resolve_provenance(script_file_path)
+    git_commit = provenance.git_commit
 
     py_version = __import__("sys").version.split()[0]
     impl = platform.python_implementation()
     platform_str = platform.platform()
 
-    last_change_id: Optional[str] = None
-    try:
-        py_dir = os.path.dirname(os.path.abspath(script_file_path))
-        changelog_candidates = [
-            os.path.join(py_dir, "CHANGELOG.md"),
-            os.path.join(py_dir, "readMe", "CHANGELOG.md"),
-        ]
-        for changelog_path in changelog_candidates:
-            if os.path.isfile(changelog_path):
-                with open(changelog_path, "r", encoding="utf-8") as chf:
-                    for line in chf:
-                        stripped_line = line.strip()
-                        if stripped_line.startswith("#"):
-                            last_change_id = stripped_line.lstrip("#").strip()
-                            break
-                        if (
-                            stripped_line
-                            and ("202" in stripped_line or "20" in stripped_line)
-                            and any(c.isdigit() for c in stripped_line)
-                        ):
-                            last_change_id = stripped_line
-                            break
-                    if last_change_id:
-                        break
-    except Exception:
-        last_change_id = None
+    last_change_id = provenance.last_change_id
 
-    def _augment_payload(pld: Dict[str, Any]) -> None:
-        if "metadataGlobal" in pld and isinstance(pld.get("metadataGlobal"), dict):
-            mg = pld["metadataGlobal"]
-            mg["generatedAt"] = timestamp
-            mg["inputSha256"] = checksum
-            mg.setdefault("inputFileName", os.path.basename(input_path))
-            mg["converterVersion"] = converter_version
-            if git_commit and "converterCommit" not in mg:
-                mg["converterCommit"] = git_commit
-            mg.setdefault("pythonVersion", py_version)
-            mg.setdefault("pythonImplementation", impl)
-            mg.setdefault("platform", platform_str)
-            if last_change_id and "lastChangeId" not in mg:
-                mg["lastChangeId"] = last_change_id
-        elif "metadata" in pld and isinstance(pld.get("metadata"), dict):
-            mg = pld["metadata"]
-            mg["generatedAt"] = timestamp
-            mg["inputSha256"] = checksum
-            mg.setdefault("inputFileName", os.path.basename(input_path))
-            mg["converterVersion"] = converter_version
-            if git_commit and "converterCommit" not in mg:
-                mg["converterCommit"] = git_commit
-            mg.setdefault("pythonVersion", py_version)
-            mg.setdefault("pythonImplementation", impl)
-            mg.setdefault("platform", platform_str)
-            if last_change_id and "lastChangeId" not in mg:
-                mg["lastChangeId"] = last_change_id
+    # Bound with functools.partial (not a closure) so lazily built payloads can
+    # still be produced in --jobs worker processes.
+    augment_payload = functools.partial(
+        _augment_payload,
+        timestamp=timestamp,
+        checksum=checksum,
+        input_file_name=os.path.basename(input_path),
+        converter_version=converter_version,
+        git_commit=git_commit,
+        py_version=py_version,
+        impl=impl,
+        platform_str=platform_str,
+        last_change_id=last_change_id,
+    )
 
     if (
         isinstance(obj, dict)
         and obj.get("_multi")
-        and isinstance(obj.get("byCountry"), dict)
+        and isinstance(obj.get("byCountry"), Mapping)
     ):
-        for _, p in obj.get("byCountry", {}).items():
-            if isinstance(p, dict):
-                _augment_payload(p)
+        # Lazy byCountry mappings apply this when each payload is built.
+        apply_to_payloads(obj["byCountry"], augment_payload)
+        for variant_payloads in (obj.get("_variantsByIndex") or {}).values():
+            apply_to_payloads(variant_payloads, augment_payload)
     elif isinstance(obj, dict):
-        _augment_payload(obj)
+        augment_payload(obj)
@@ -0,0 +1,89 @@
+"""Per-country digests of a unified-schema input sheet.
+
+Used to tell which countries an input edit can affect (``--watch``) and
+which cached per-country check results are still valid
+(``--incremental-check``) without building any payload.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from typing import Dict, List, NamedTuple, Optional
+
+from .table_reader import _stream_table
+from .unified_row_plan import build_unified_row_plan
+
+# Field/record separators for the digested cell streams.
+_SEP = "\x1f"
+_ROW_SEP = "\x1e"
+
+
+class InputDigest(NamedTuple):
+    """SHA-256 of the shared columns plus one per country's text columns."""
+
+    shared: str
+    countries: Dict[str, str]
+
+
+def digest_input(
+    path: str,
+    *,
+    encoding: str = "utf-8-sig",
+    delimiter: Optional[str] = None,
+    xlsx_sheet: Optional[str] = None,
+) -> Optional[InputDigest]:
+    """Per-country digest of a unified-schema sheet; None for other layouts.
+
+    Rows whose texts cross countries (``ALL`` scope propagation, and
+    ``meta_global`` rows, which also carry fps) go to the shared digest whole.
+    """
+    with _stream_table(
+        path, encoding=encoding, delimiter=delimiter, xlsx_sheet=xlsx_sheet
+    ) as table:
+        plan = build_unified_row_plan(table.headers)
+        if plan is None:
+            return None
+        country_cols = plan.country_occurrences
+        text_col_set = {i for occ in country_cols.values() for i in occ}
+        shared_cols = [i for i in range(plan.width) if i not in text_col_set]
+        idx_rt = plan.idx_record_type
+        idx_scope = plan.indices.get("country_scope")
+
+        shared = hashlib.sha256(_SEP.join(table.headers).encode("utf-8"))
+        parts: Dict[str, List[str]] = {c: [] for c in plan.countries}
+        for row in table:
+            if len(row) < plan.width:
+                row = row + [""] * (plan.width - len(row))
+            record_type = row[idx_rt].strip().lower()
+            scope = row[idx_scope].strip().upper() if idx_scope is not None else ""
+            if scope == "ALL" or record_type in ("meta_global", "meta-global"):
+                shared.update((_SEP.join(row) + _ROW_SEP).encode("utf-8"))
+                for c in parts:
+                    parts[c].append(_ROW_SEP)
+                continue
+            shared.update(
+                (_SEP.join([row[i] for i in shared_cols]) + _ROW_SEP).encode("utf-8")
+            )
+            for c, occ in country_cols.items():
+                parts[c].append(_SEP.join([row[i] for i in occ]) + _ROW_SEP)
+
+    return InputDigest(
+        shared=shared.hexdigest(),
+        countries={
+            c: hashlib.sha256("".join(p).encode("utf-8")).hexdigest()
+            for c, p in parts.items()
+        },
+    )
+
+
+def touched_countries(
+    previous: Optional[InputDigest], current: Optional[InputDigest]
+) -> Optional[List[str]]:
+    """Countries whose outputs the change can affect, or None for all of them."""
+    if previous is None or current is None:
+        return None
+    if previous.shared != current.shared or list(previous.countries) != list(
+        current.countries
+    ):
+        return None
+    return [c for c, d in current.countries.items() if previous.countries[c] != d]
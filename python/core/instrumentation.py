@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import contextlib
+import functools
+import json
+import os
+import time
+from typing import Any, Callable, Dict, Iterable, Iterator, TypeVar
+
+INSTRUMENTATION_FORMAT = 1
+
+# Top-level spans in report order; anything else is appended after them.
+SPAN_ORDER = ("sniff", "read", "rows", "merge", "build", "validate", "write")
+
+T = TypeVar("T")
+
+
+class Instrumentation:
+    """Named timing spans (seconds, accumulated) and integer counters.
+
+    Spans named ``<span>:<detail>`` (e.g. ``build:DEU``) are detail entries:
+    they are kept in ``to_dict`` but left out of the one-line log summary.
+    """
+
+    enabled = True
+
+    def __init__(self) -> None:
+        self.spans: Dict[str, float] = {}
+        self.counters: Dict[str, int] = {}
+        self._started = time.perf_counter()
+
+    @contextlib.contextmanager
+    def span(self, name: str, exclude: Iterable[str] = ()) -> Iterator[None]:
+        """Time the block into ``name``, minus whatever the block itself added
+        to the ``exclude`` spans (e.g. ``read`` time spent inside the row loop),
+        so top-level spans never count the same second twice.
+        """
+        exclude = tuple(exclude)
+        nested_before = sum(self.spans.get(k, 0.0) for k in exclude)
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - t0
+            nested = sum(self.spans.get(k, 0.0) for k in exclude) - nested_before
+            self.add_time(name, elapsed - nested)
+
+    def add_time(self, name: str, seconds: float) -> None:
+        self.spans[name] = self.spans.get(name, 0.0) + seconds
+
+    def count(self, name: str, n: int = 1) -> None:
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def timed_iter(self, name: str, items: Iterable[T]) -> Iterator[T]:
+        """Yield ``items`` while adding the time spent producing them to ``name``."""
+        it = iter(items)
+        while True:
+            t0 = time.perf_counter()
+            try:
+                item = next(it)
+            except StopIteration:
+                self.add_time(name, time.perf_counter() - t0)
+                return
+            self.add_time(name, time.perf_counter() - t0)
+            yield item
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self._started
+
+    def _ordered_spans(self) -> Dict[str, float]:
+        ordered = {k: self.spans[k] for k in SPAN_ORDER if k in self.spans}
+        for k, v in self.spans.items():
+            if k not in ordered and ":" not in k:
+                ordered[k] = v
+        return ordered
+
+    def timing_line(self) -> str:
+        """``Timing (s) => key=value, ...`` line (same format as the AE logs)."""
+        parts = [f"{k}={v:.3f}" for k, v in self._ordered_spans().items()]
+        parts.append(f"total={self.elapsed():.3f}")
+        return "Timing (s) => " + ", ".join(parts)
+
+    def counts_line(self) -> str:
+        parts = [f"{k}={v}" for k, v in self.counters.items()]
+        return "Counts => " + ", ".join(parts)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "format": INSTRUMENTATION_FORMAT,
+            "totalSeconds": self.elapsed(),
+            "spans": {**self._ordered_spans(), **self.spans},
+            "counters": dict(self.counters),
+        }
+
+    def write_json(self, path: str) -> None:
+        out_dir = os.path.dirname(os.path.abspath(path))
+        os.makedirs(out_dir, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=2)
+            f.write("\n")
+
+
+class NullInstrumentation(Instrumentation):
+    """Drop-in no-op used when no timings were requested."""
+
+    enabled = False
+
+    @contextlib.contextmanager
+    def span(self, name: str, exclude: Iterable[str] = ()) -> Iterator[None]:
+        yield
+
+    def add_time(self, name: str, seconds: float) -> None:
+        pass
+
+    def count(self, name: str, n: int = 1) -> None:
+        pass
+
+    def timed_iter(self, name: str, items: Iterable[T]) -> Iterator[T]:
+        return iter(items)
+
+
+NULL_INSTRUMENTATION = NullInstrumentation()
+
+
+def _call_timed(
+    builder: Callable[..., T],
+    instrumentation: Instrumentation,
+    span_name: str,
+    country: str,
+    *args: Any,
+    **kwargs: Any,
+) -> T:
+    t0 = time.perf_counter()
+    try:
+        return builder(country, *args, **kwargs)
+    finally:
+        elapsed = time.perf_counter() - t0
+        instrumentation.add_time(span_name, elapsed)
+        instrumentation.add_time(f"{span_name}:{country}", elapsed)
+
+
+def timed_country_builder(
+    builder: Callable[..., T],
+    instrumentation: Instrumentation,
+    span_name: str = "build",
+) -> Callable[..., T]:
+    """Wrap a per-country payload builder so each call adds to ``span_name``
+    and ``span_name:<country>``. Stays picklable (functools.partial); copies
+    shipped to ``--jobs`` workers record into the worker's copy only.
+    """
+    return functools.partial(_call_timed, builder, instrumentation, span_name)
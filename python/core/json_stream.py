@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import json
+from collections.abc import Iterator
+from typing import Any, TextIO
+
+
+def _is_streamed(value: Any) -> bool:
+    # Lists/dicts/strings are iterables, not iterators; generators are both.
+    return isinstance(value, Iterator)
+
+
+def iter_json_chunks(value: Any, *, indent: int = 2, _level: int = 0) -> Iterator[str]:
+    """Yield the text of ``json.dump(value, indent=indent, ensure_ascii=False)``.
+
+    Iterators (e.g. a generator of ``videos`` entries) are encoded as JSON
+    arrays one element at a time, and dicts holding them are walked key by
+    key, so such values never have to exist in full. Every other value is
+    encoded by ``json.dumps`` and re-indented, keeping the bytes identical.
+    """
+    if _is_streamed(value):
+        inner = "\n" + " " * (indent * (_level + 1))
+        opened = False
+        for item in value:
+            yield (",", "[")[not opened] + inner
+            opened = True
+            yield from iter_json_chunks(item, indent=indent, _level=_level + 1)
+        yield ("\n" + " " * (indent * _level) + "]") if opened else "[]"
+        return
+    if (
+        isinstance(value, dict)
+        and value
+        and any(_is_streamed(v) for v in value.values())
+        and all(isinstance(k, str) for k in value)
+    ):
+        inner = "\n" + " " * (indent * (_level + 1))
+        first = True
+        for key, item in value.items():
+            yield ("{" if first else ",") + inner
+            yield json.dumps(key, ensure_ascii=False) + ": "
+            first = False
+            yield from iter_json_chunks(item, indent=indent, _level=_level + 1)
+        yield "\n" + " " * (indent * _level) + "}"
+        return
+    text = json.dumps(value, ensure_ascii=False, indent=indent)
+    # JSON strings escape newlines, so every "\n" here is structural.
+    yield text.replace("\n", "\n" + " " * (indent * _level)) if _level else text
+
+
+def dump_json_stream(value: Any, fp: TextIO, *, indent: int = 2) -> None:
+    """Write ``value`` to ``fp`` chunk by chunk (see ``iter_json_chunks``)."""
+    fp.writelines(iter_json_chunks(value, indent=indent))
@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import copy
+from collections.abc import ItemsView, Mapping, ValuesView
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+PayloadPostProcessor = Callable[[Dict[str, Any]], None]
+
+# Stored in place of a payload that has not been built yet.
+_PENDING = object()
+
+
+def _build_payload(
+    builder: Callable[[str], Dict[str, Any]],
+    post_processors: Sequence[PayloadPostProcessor],
+    country: str,
+) -> Dict[str, Any]:
+    payload = builder(country)
+    for post_process in post_processors:
+        post_process(payload)
+    return payload
+
+
+@dataclass(frozen=True)
+class CountryPayloadFactory:
+    """Standalone ``country -> payload`` builder taken from a lazy mapping.
+
+    Holds only the builder and post-processors, so it can be pickled to worker
+    processes as long as those callables are module-level functions/partials.
+    """
+
+    countries: FrozenSet[str]
+    builder: Callable[[str], Dict[str, Any]]
+    post_processors: Tuple[PayloadPostProcessor, ...] = ()
+    stream_builder: Optional[Callable[[str], Dict[str, Any]]] = None
+
+    def __call__(self, country: str) -> Dict[str, Any]:
+        if country not in self.countries:
+            raise KeyError(country)
+        return _build_payload(self.builder, self.post_processors, country)
+
+    def stream(self, country: str) -> Dict[str, Any]:
+        """Payload for a single streaming write; large arrays may be generators.
+
+        Falls back to ``self(country)`` when no streaming builder is available.
+        """
+        if country not in self.countries:
+            raise KeyError(country)
+        builder = self.stream_builder or self.builder
+        return _build_payload(builder, self.post_processors, country)
+
+
+class LazyCountryPayloads(dict):
+    """``byCountry`` dict that builds each payload on first access.
+
+    ``builder(country)`` is called at most once per country and its result is
+    cached. Post-processors registered with ``add_post_processor`` run on every
+    payload exactly once, in registration order: immediately for payloads that
+    already exist, otherwise right after the payload is built.
+
+    It stays a ``dict`` so existing ``isinstance`` checks, ``json.dumps`` and
+    ``dict(...)`` copies keep working; those simply build every country.
+
+    ``stream_builder`` optionally builds a one-shot payload for streaming
+    writers (see ``CountryPayloadFactory.stream``); it is never cached.
+    """
+
+    def __init__(
+        self,
+        countries: Sequence[str],
+        builder: Callable[[str], Dict[str, Any]],
+        *,
+        stream_builder: Optional[Callable[[str], Dict[str, Any]]] = None,
+    ) -> None:
+        super().__init__((c, _PENDING) for c in countries)
+        self._builder = builder
+        self._stream_builder = stream_builder
+        self._post_processors: List[PayloadPostProcessor] = []
+
+    def __getitem__(self, country: str) -> Dict[str, Any]:
+        payload = dict.__getitem__(self, country)
+        if payload is _PENDING:
+            payload = _build_payload(self._builder, self._post_processors, country)
+            dict.__setitem__(self, country, payload)
+        return payload
+
+    # Overriding __iter__ makes dict(...) / {**...} go through __getitem__.
+    def __iter__(self) -> Iterator[str]:
+        return dict.__iter__(self)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Mapping):
+            return self.to_dict() == dict(other.items())
+        return NotImplemented
+
+    def __ne__(self, other: object) -> bool:
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        built = [c for c in self if self.is_built(c)]
+        return f"LazyCountryPayloads(countries={list(self)!r}, built={built!r})"
+
+    def __reduce__(self):
+        return (dict, (self.to_dict(),))
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> Dict[str, Any]:
+        return copy.deepcopy(self.to_dict(), memo)
+
+    def get(self, country: str, default: Any = None) -> Any:
+        return self[country] if country in self else default
+
+    def items(self) -> ItemsView:  # type: ignore[override]
+        return ItemsView(self)
+
+    def values(self) -> ValuesView:  # type: ignore[override]
+        return ValuesView(self)
+
+    def copy(self) -> Dict[str, Dict[str, Any]]:  # type: ignore[override]
+        return self.to_dict()
+
+    def pop(self, country: str, *default: Any) -> Any:
+        if country in self:
+            payload = self[country]
+            dict.pop(self, country)
+            return payload
+        if default:
+            return default[0]
+        raise KeyError(country)
+
+    def popitem(self) -> Any:
+        country = next(reversed(dict.keys(self)), None)
+        if country is None:
+            raise KeyError("popitem(): dictionary is empty")
+        return country, self.pop(country)
+
+    def setdefault(self, country: str, default: Any = None) -> Any:
+        if country in self:
+            return self[country]
+        dict.__setitem__(self, country, default)
+        return default
+
+    def is_built(self, country: str) -> bool:
+        return dict.get(self, country, _PENDING) is not _PENDING
+
+    def add_post_processor(self, post_process: PayloadPostProcessor) -> None:
+        for country in self:
+            if self.is_built(country):
+                payload = dict.__getitem__(self, country)
+                if isinstance(payload, dict):
+                    post_process(payload)
+        self._post_processors.append(post_process)
+
+    def payload_factory(self) -> CountryPayloadFactory:
+        """Detached builder that reproduces ``self[country]`` without caching."""
+        return CountryPayloadFactory(
+            countries=frozenset(dict.keys(self)),
+            builder=self._builder,
+            post_processors=tuple(self._post_processors),
+            stream_builder=self._stream_builder,
+        )
+
+    def to_dict(self) -> Dict[str, Dict[str, Any]]:
+        """Build every remaining country and return a plain dict."""
+        return {c: self[c] for c in self}
+
+
+def apply_to_payloads(payloads: Mapping, post_process: PayloadPostProcessor) -> None:
+    """Run ``post_process`` on each payload dict, deferring it for lazy mappings."""
+    if isinstance(payloads, LazyCountryPayloads):
+        payloads.add_post_processor(post_process)
+        return
+    for payload in payloads.values():
+        if isinstance(payload, dict):
+            post_process(payload)
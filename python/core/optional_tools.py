@@ -4,7 +4,21 @@ import importlib
 import os
 import sys
 import types
-from typing import Any, Callable, Optional, Tuple
+from dataclasses import dataclass
+from typing import Any, Callable, Optional, Tuple, Union
+
+
+@dataclass(frozen=True)
+class DeferredTool:
+    """Optional tool that is loaded only when a run actually uses it."""
+
+    load: Callable[[], Optional[Callable[..., Any]]]
+
+
+def resolve_optional_tool(
+    tool: Union[DeferredTool, Callable[..., Any], None],
+) -> Optional[Callable[..., Any]]:
+    return tool.load() if isinstance(tool, DeferredTool) else tool
 
 
 def resolve_tools_path(module_name: str, script_file_path: str) -> str:
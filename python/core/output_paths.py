@@ -70,3 +70,9 @@ def trim_logo_anim_flag_for_country(payload: Dict[str, Any], country_code: str)
         else:
             trimmed[dur] = val
     mg["logo_anim_flag"] = trimmed
+
+
+def strip_logo_anim_overview(payload: Dict[str, Any]) -> None:
+    mg = payload.get("metadataGlobal") or payload.get("metadata")
+    if isinstance(mg, dict) and "logo_anim_flag" in mg:
+        del mg["logo_anim_flag"]
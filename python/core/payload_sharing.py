@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import copy
+import math
+from typing import Any, Dict, Hashable, List
+
+# Top-level payload keys that always stay private to one country. They are
+# mutated after conversion (generation metadata, logo_anim_flag trimming,
+# media/layer config injection).
+PRIVATE_PAYLOAD_KEYS = frozenset({"metadataGlobal", "config"})
+
+
+class PayloadInterner:
+    """Hash-consing pool for JSON-like payload subtrees.
+
+    ``intern`` returns one canonical object per distinct value, so identical
+    lists/dicts/strings built for different countries end up shared. Values
+    returned by the pool must be treated as read-only; use ``detach`` before
+    changing a shared subtree.
+    """
+
+    def __init__(self) -> None:
+        self._strings: Dict[str, str] = {}
+        self._ints: Dict[int, int] = {}
+        self._floats: Dict[float, float] = {}
+        self._zeros: Dict[float, float] = {}
+        # Containers are keyed by the identities of their (canonical) children.
+        self._dicts: Dict[Hashable, Dict[str, Any]] = {}
+        self._lists: Dict[Hashable, List[Any]] = {}
+
+    def __len__(self) -> int:
+        return (
+            len(self._strings)
+            + len(self._ints)
+            + len(self._floats)
+            + len(self._dicts)
+            + len(self._lists)
+        )
+
+    def intern(self, value: Any) -> Any:
+        t = type(value)
+        if t is str:
+            return self._strings.setdefault(value, value)
+        if t is dict:
+            values = [self.intern(v) for v in value.values()]
+            key = (tuple(value), tuple(map(id, values)))
+            found = self._dicts.get(key)
+            if found is None:
+                found = self._dicts[key] = dict(zip(value, values))
+            return found
+        if t is list:
+            items = [self.intern(v) for v in value]
+            key = tuple(map(id, items))
+            found_list = self._lists.get(key)
+            if found_list is None:
+                found_list = self._lists[key] = items
+            return found_list
+        if t is int:
+            return self._ints.setdefault(value, value)
+        if t is float:
+            if value == 0.0:
+                # -0.0 == 0.0, so zeros are pooled by sign to keep "-0.0" output.
+                return self._zeros.setdefault(math.copysign(1.0, value), value)
+            return self._floats.setdefault(value, value)
+        return value
+
+
+def share_country_payload(
+    payload: Dict[str, Any], interner: PayloadInterner
+) -> Dict[str, Any]:
+    """Intern every top-level value of ``payload`` except private keys.
+
+    The payload dict itself and ``metadataGlobal`` remain owned by the country,
+    so per-country post-processing keeps working unchanged.
+    """
+    return {
+        k: (v if k in PRIVATE_PAYLOAD_KEYS else interner.intern(v))
+        for k, v in payload.items()
+    }
+
+
+def detach(container: Dict[str, Any], *path: Any) -> Any:
+    """Copy-on-write: replace the subtree at ``path`` with a private deep copy.
+
+    ``detach(payload, "videos", 0, "subtitles")`` makes that subtitle list (and
+    every container on the way to it) owned by ``container`` so it can be
+    mutated without affecting other countries. Returns the private subtree.
+    """
+    if not path:
+        raise ValueError("detach() needs at least one key or index.")
+    node: Any = container
+    for step in path[:-1]:
+        child = copy.copy(node[step])
+        node[step] = child
+        node = child
+    private = copy.deepcopy(node[path[-1]])
+    node[path[-1]] = private
+    return private
@@ -0,0 +1,180 @@
+"""cProfile / tracemalloc hooks behind the ``--profile`` and ``--trace-memory`` flags.
+
+Both only use the standard library, so they also work in the frozen binaries
+on production inputs. ``MemoryTracer`` is an ``Instrumentation``: passed to
+the converter, it diffs tracemalloc snapshots around each stage span and
+reports the top allocation sites per stage.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import cProfile
+import sys
+import tracemalloc
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, TextIO, TypeVar
+
+from .instrumentation import Instrumentation
+
+TRACE_MEMORY_TOP = 10
+
+T = TypeVar("T")
+
+# Allocation sites left out of the report (the tracer's own bookkeeping).
+# Filtered after diffing: Snapshot.filter_traces walks every trace in Python
+# and would dominate the run time.
+_IGNORED_SITE_FILES = frozenset(
+    {
+        tracemalloc.__file__,
+        "<frozen importlib._bootstrap>",
+        "<frozen importlib._bootstrap_external>",
+        "<unknown>",
+    }
+)
+
+
+def add_profiling_arguments(p: argparse.ArgumentParser) -> None:
+    p.add_argument(
+        "--profile",
+        default=None,
+        metavar="PATH",
+        help="Write cProfile stats of the run to PATH (inspect with 'python -m pstats PATH')",
+    )
+    p.add_argument(
+        "--trace-memory",
+        action="store_true",
+        help=f"Trace allocations with tracemalloc and print the peak and top {TRACE_MEMORY_TOP} allocation sites per stage to stderr",
+    )
+
+
+def _take_snapshot() -> tracemalloc.Snapshot:
+    return tracemalloc.take_snapshot()
+
+
+def _format_size(n: int, *, signed: bool = False) -> str:
+    sign = "-" if n < 0 else ("+" if signed else "")
+    size = float(abs(n))
+    for unit in ("B", "KiB"):
+        if size < 1024:
+            return f"{sign}{size:.1f} {unit}"
+        size /= 1024
+    return f"{sign}{size:.1f} MiB"
+
+
+class MemoryTracer(Instrumentation):
+    """Instrumentation that also records net allocations per stage span.
+
+    Each ``span`` takes a tracemalloc snapshot on entry and exit; the size
+    difference per allocation site (file:line) is accumulated per stage.
+    Snapshots are taken outside the timed part of the span (and with
+    ``profiler`` paused), but tracing itself slows allocations down, so
+    timings taken together with ``--trace-memory`` are inflated.
+    """
+
+    def __init__(self, top: int = TRACE_MEMORY_TOP) -> None:
+        super().__init__()
+        self.top = top
+        self.stage_sites: Dict[str, Dict[str, int]] = {}
+        self.peak_bytes = 0
+        self.profiler: Optional[cProfile.Profile] = None
+
+    @contextlib.contextmanager
+    def _unprofiled(self) -> Iterator[None]:
+        profiler = self.profiler
+        if profiler is not None:
+            profiler.disable()
+        try:
+            yield
+        finally:
+            if profiler is not None:
+                profiler.enable()
+
+    @contextlib.contextmanager
+    def span(self, name: str, exclude: Iterable[str] = ()) -> Iterator[None]:
+        if not tracemalloc.is_tracing():
+            with super().span(name, exclude):
+                yield
+            return
+        with self._unprofiled():
+            before = _take_snapshot()
+        try:
+            with super().span(name, exclude):
+                yield
+        finally:
+            with self._unprofiled():
+                self.record_stage(name, before, _take_snapshot())
+
+    def record_stage(
+        self,
+        name: str,
+        before: tracemalloc.Snapshot,
+        after: tracemalloc.Snapshot,
+    ) -> None:
+        sites = self.stage_sites.setdefault(name, {})
+        for stat in after.compare_to(before, "lineno"):
+            if not stat.size_diff:
+                continue
+            frame = stat.traceback[0]
+            if frame.filename in _IGNORED_SITE_FILES:
+                continue
+            key = f"{frame.filename}:{frame.lineno}"
+            sites[key] = sites.get(key, 0) + stat.size_diff
+        self.peak_bytes = max(self.peak_bytes, tracemalloc.get_traced_memory()[1])
+
+    def memory_report(self) -> str:
+        lines = [f"Memory => peak={_format_size(self.peak_bytes)}"]
+        lines.append(f"Top {self.top} allocation sites per stage (net):")
+        for stage, sites in self.stage_sites.items():
+            top = sorted(sites.items(), key=lambda kv: kv[1], reverse=True)
+            lines.append(f"  {stage}:")
+            for site, size in top[: self.top]:
+                lines.append(f"    {_format_size(size, signed=True):>12}  {site}")
+        return "\n".join(lines)
+
+
+def run_profiled(
+    run: Callable[[], T],
+    *,
+    profile_path: Optional[str] = None,
+    memory_tracer: Optional[MemoryTracer] = None,
+    stream: Optional[TextIO] = None,
+) -> T:
+    """Call ``run`` under cProfile and/or tracemalloc and report afterwards.
+
+    Reports are written even when ``run`` raises (including ``SystemExit``),
+    so failing runs can be profiled too. The whole run is recorded as the
+    ``run`` stage of ``memory_tracer``.
+    """
+    out = stream if stream is not None else sys.stderr
+    profiler = cProfile.Profile() if profile_path else None
+    started_tracing = False
+    baseline: Optional[tracemalloc.Snapshot] = None
+    if memory_tracer is not None:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            started_tracing = True
+        baseline = _take_snapshot()
+        memory_tracer.profiler = profiler
+    try:
+        if profiler is not None:
+            return profiler.runcall(run)
+        return run()
+    finally:
+        messages: List[str] = []
+        if profiler is not None and profile_path:
+            try:
+                profiler.dump_stats(profile_path)
+                messages.append(f"Profile written to {profile_path}")
+            except OSError as ex:
+                messages.append(
+                    f"Warning: failed to write profile '{profile_path}': {ex}"
+                )
+        if memory_tracer is not None and baseline is not None:
+            memory_tracer.profiler = None
+            memory_tracer.record_stage("run", baseline, _take_snapshot())
+            if started_tracing:
+                tracemalloc.stop()
+            messages.append(memory_tracer.memory_report())
+        for message in messages:
+            print(message, file=out)
@@ -0,0 +1,267 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import subprocess
+import tempfile
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List, Optional
+
+PROVENANCE_CACHE_ENV = "JSON_CONVERTER_PROVENANCE_CACHE"
+PROVENANCE_CACHE_FORMAT = 1
+
+# Resolved provenance per cache key, so a process resolves it at most once.
+_MEMO: Dict[str, "Provenance"] = {}
+
+
+@dataclass(frozen=True)
+class Provenance:
+    """Version/commit facts shared by auto-versioning and generation metadata."""
+
+    changelog_version: Optional[str]
+    last_change_id: Optional[str]
+    git_tag: Optional[str]
+    git_commit: Optional[str]
+
+
+def _version_changelog_candidates(script_file_path: str) -> List[str]:
+    py_dir = os.path.dirname(os.path.abspath(script_file_path))
+    return [
+        os.path.join(os.path.dirname(py_dir), "CHANGELOG.md"),
+        os.path.join(py_dir, "readMe", "CHANGELOG.md"),
+    ]
+
+
+def _change_id_changelog_candidates(script_file_path: str) -> List[str]:
+    py_dir = os.path.dirname(os.path.abspath(script_file_path))
+    return [
+        os.path.join(py_dir, "CHANGELOG.md"),
+        os.path.join(py_dir, "readMe", "CHANGELOG.md"),
+    ]
+
+
+def _read_changelog_version(candidates: List[str]) -> Optional[str]:
+    try:
+        for changelog_path in candidates:
+            if os.path.isfile(changelog_path):
+                with open(changelog_path, "r", encoding="utf-8") as chf:
+                    for line in chf:
+                        stripped_line = line.strip()
+                        if stripped_line.startswith("#"):
+                            heading = stripped_line.lstrip("#").strip()
+                            m = re.match(
+                                r"\[?v?([0-9]+\.[0-9]+\.[0-9]+(?:[-+][A-Za-z0-9.]+)?)",
+                                heading,
+                            )
+                            if m:
+                                return m.group(1)
+                            token = heading.split()[0]
+                            if re.match(r"v?[0-9]+\.[0-9]+(\.[0-9]+)?", token):
+                                return token.lstrip("v")
+                            break
+    except Exception:
+        pass
+    return None
+
+
+def _read_last_change_id(candidates: List[str]) -> Optional[str]:
+    last_change_id: Optional[str] = None
+    try:
+        for changelog_path in candidates:
+            if os.path.isfile(changelog_path):
+                with open(changelog_path, "r", encoding="utf-8") as chf:
+                    for line in chf:
+                        stripped_line = line.strip()
+                        if stripped_line.startswith("#"):
+                            last_change_id = stripped_line.lstrip("#").strip()
+                            break
+                        if (
+                            stripped_line
+                            and ("202" in stripped_line or "20" in stripped_line)
+                            and any(c.isdigit() for c in stripped_line)
+                        ):
+                            last_change_id = stripped_line
+                            break
+                if last_change_id:
+                    break
+    except Exception:
+        last_change_id = None
+    return last_change_id
+
+
+def _git_output(args: List[str]) -> Optional[str]:
+    try:
+        out = (
+            subprocess.check_output(["git", *args], stderr=subprocess.DEVNULL)
+            .decode("utf-8")
+            .strip()
+        )
+    except Exception:
+        return None
+    return out or None
+
+
+def _find_git_dir(start: str) -> Optional[str]:
+    env_dir = os.getenv("GIT_DIR")
+    if env_dir:
+        return os.path.abspath(env_dir)
+    cur = os.path.abspath(start)
+    while True:
+        candidate = os.path.join(cur, ".git")
+        if os.path.isdir(candidate):
+            return candidate
+        if os.path.isfile(candidate):
+            # Worktrees/submodules: ".git" is a file pointing at the git dir.
+            try:
+                with open(candidate, "r", encoding="utf-8") as f:
+                    content = f.read().strip()
+            except OSError:
+                return None
+            if content.startswith("gitdir:"):
+                return os.path.normpath(
+                    os.path.join(cur, content[len("gitdir:") :].strip())
+                )
+            return None
+        parent = os.path.dirname(cur)
+        if parent == cur:
+            return None
+        cur = parent
+
+
+def _read_small(path: str) -> Optional[str]:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+def _stat_token(path: str) -> Optional[List[int]]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+
+def _git_state(cwd: str) -> Optional[Dict[str, Any]]:
+    """HEAD, the ref it points at and tag state of the repo git would use."""
+    git_dir = _find_git_dir(cwd)
+    if not git_dir:
+        return None
+    common_dir = git_dir
+    common = _read_small(os.path.join(git_dir, "commondir"))
+    if common:
+        common_dir = os.path.normpath(os.path.join(git_dir, common))
+    head = _read_small(os.path.join(git_dir, "HEAD"))
+    ref_value = None
+    if head and head.startswith("ref:"):
+        ref_value = _read_small(os.path.join(common_dir, head[len("ref:") :].strip()))
+    return {
+        "gitDir": git_dir,
+        "head": head,
+        "ref": ref_value,
+        "packedRefs": _stat_token(os.path.join(common_dir, "packed-refs")),
+        "tags": _stat_token(os.path.join(common_dir, "refs", "tags")),
+    }
+
+
+def provenance_cache_key(script_file_path: str, cwd: Optional[str] = None) -> str:
+    """Hash of everything the provenance depends on (cheap stat/reads only)."""
+    candidates = sorted(
+        set(_version_changelog_candidates(script_file_path))
+        | set(_change_id_changelog_candidates(script_file_path))
+    )
+    material = {
+        "format": PROVENANCE_CACHE_FORMAT,
+        "script": os.path.abspath(script_file_path),
+        "changelogs": {p: _stat_token(p) for p in candidates},
+        "git": _git_state(cwd or os.getcwd()),
+    }
+    encoded = json.dumps(material, sort_keys=True)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def default_provenance_cache_path() -> Optional[str]:
+    """Persistent cache file, or None when disabled via the env variable."""
+    env_val = os.getenv(PROVENANCE_CACHE_ENV)
+    if env_val is not None:
+        if env_val.strip().lower() in ("", "0", "off", "false", "no"):
+            return None
+        return env_val
+    user = str(os.getuid()) if hasattr(os, "getuid") else os.getenv("USERNAME", "")
+    return os.path.join(
+        tempfile.gettempdir(), f"json_converter-provenance-{user or 'default'}.json"
+    )
+
+
+def _load_cached(path: str, key: str) -> Optional[Provenance]:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("format") != PROVENANCE_CACHE_FORMAT or data.get("key") != key:
+            return None
+        return Provenance(**data["provenance"])
+    except Exception:
+        return None
+
+
+def _save_cached(path: str, key: str, provenance: Provenance) -> None:
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "format": PROVENANCE_CACHE_FORMAT,
+                    "key": key,
+                    "provenance": asdict(provenance),
+                },
+                f,
+            )
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+def resolve_provenance(
+    script_file_path: str, *, cache_path: Optional[str] = None
+) -> Provenance:
+    """Changelog version/change id and git tag/commit, resolved once.
+
+    Results are memoized per process and persisted to a small JSON file keyed
+    by the changelog mtimes/sizes and the git HEAD/ref/tag state, so repeated
+    runs do not fork git. Set ``JSON_CONVERTER_PROVENANCE_CACHE`` to a path to
+    relocate the file, or to ``0`` to disable it.
+    """
+    key = provenance_cache_key(script_file_path)
+    memo = _MEMO.get(key)
+    if memo is not None:
+        return memo
+    if cache_path is None:
+        cache_path = default_provenance_cache_path()
+    provenance = _load_cached(cache_path, key) if cache_path else None
+    if provenance is None:
+        provenance = Provenance(
+            changelog_version=_read_changelog_version(
+                _version_changelog_candidates(script_file_path)
+            ),
+            last_change_id=_read_last_change_id(
+                _change_id_changelog_candidates(script_file_path)
+            ),
+            git_tag=_git_output(["describe", "--tags", "--abbrev=0"]),
+            git_commit=_git_output(["rev-parse", "--short", "HEAD"]),
+        )
+        if cache_path:
+            _save_cached(cache_path, key, provenance)
+    _MEMO[key] = provenance
+    return provenance
+
+
+def clear_provenance_cache() -> None:
+    """Forget in-process results (the persisted file is left untouched)."""
+    _MEMO.clear()
@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import functools
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+
+from .unified_processors import (
+    CountryTexts,
+    UnifiedState,
+    normalize_controller_record,
+    process_claim_row,
+    process_controller_row,
+    process_disclaimer_row,
+    process_endframe_row,
+    process_logo_row,
+    process_meta_global_row,
+    process_meta_local_row,
+    process_sub_row,
+    process_super_a_row,
+    process_super_b_row,
+)
+from .unified_row_plan import UnifiedRow
+
+
+@dataclass(frozen=True)
+class RecordContext:
+    """Per-conversion settings shared by every record handler call."""
+
+    countries: List[str]
+    start_line_index: int = 1
+
+
+RecordHandler = Callable[
+    [UnifiedState, UnifiedRow, CountryTexts, CountryTexts, RecordContext], None
+]
+
+# Normalized (lower-case) record type -> handler.
+_RECORD_HANDLERS: Dict[str, RecordHandler] = {}
+# Resolved handlers per raw record type, including controller_NN bindings.
+_RESOLVED_HANDLERS: Dict[str, Optional[RecordHandler]] = {}
+
+
+def _handle_meta_global(state, row, texts, texts_portrait, ctx) -> None:
+    process_meta_global_row(
+        state=state,
+        key_name=row.key_name,
+        countries=ctx.countries,
+        texts=texts,
+        texts_portrait=texts_portrait,
+        metadata_cell_val=row.metadata,
+        target_duration_val=row.target_duration,
+        country_scope_raw=row.country_scope_raw,
+    )
+
+
+def _handle_meta_local(state, row, texts, texts_portrait, ctx) -> None:
+    process_meta_local_row(
+        state=state,
+        key_name=row.key_name,
+        video_id=row.video_id,
+        countries=ctx.countries,
+        texts=texts,
+        texts_portrait=texts_portrait,
+        metadata_cell_val=row.metadata,
+    )
+
+
+def _timed_handler(
+    process: Callable[..., bool], *, with_line_index: bool = False, **extra
+) -> RecordHandler:
+    # Claim/logo/endFrame rows take only the timing fields; subtitle-like rows
+    # also need the start line index.
+    def _handle(state, row, texts, texts_portrait, ctx) -> None:
+        kwargs = (
+            {**extra, "start_line_index": ctx.start_line_index}
+            if with_line_index
+            else extra
+        )
+        process(
+            state=state,
+            video_id=row.video_id,
+            line_num=row.line_num,
+            start_tc=row.start_tc,
+            end_tc=row.end_tc,
+            texts=texts,
+            texts_portrait=texts_portrait,
+            **kwargs,
+        )
+
+    return _handle
+
+
+def _handle_controller(
+    state, row, texts, texts_portrait, ctx, *, controller_key: str
+) -> None:
+    process_controller_row(
+        state=state,
+        controller_key=controller_key,
+        video_id=row.video_id,
+        line_num=row.line_num,
+        start_tc=row.start_tc,
+        end_tc=row.end_tc,
+        texts=texts,
+        texts_portrait=texts_portrait,
+        start_line_index=ctx.start_line_index,
+    )
+
+
+def register_record_type(
+    name: str, handler: RecordHandler, *, replace: bool = False
+) -> None:
+    """Register ``handler`` for unified rows whose ``record_type`` is ``name``.
+
+    Handlers are called as ``handler(state, row, texts, texts_portrait, ctx)``
+    once per row and country variant. Registering an existing type raises
+    ``ValueError`` unless ``replace`` is set.
+    """
+    key = (name or "").strip().lower()
+    if not key:
+        raise ValueError("Record type name must not be empty.")
+    if key in _RECORD_HANDLERS and not replace:
+        raise ValueError(f"Record type '{key}' is already registered.")
+    _RECORD_HANDLERS[key] = handler
+    _RESOLVED_HANDLERS.clear()
+
+
+def unregister_record_type(name: str) -> None:
+    """Remove a registered record type; unknown names are ignored."""
+    _RECORD_HANDLERS.pop((name or "").strip().lower(), None)
+    _RESOLVED_HANDLERS.clear()
+
+
+def resolve_record_handler(record_type: str) -> Optional[RecordHandler]:
+    """Handler for an already lower-cased record type, or None to ignore the row."""
+    try:
+        return _RESOLVED_HANDLERS[record_type]
+    except KeyError:
+        pass
+    handler = _RECORD_HANDLERS.get(record_type)
+    if handler is None:
+        # Controller timed rows (scalable): controller_01 .. controller_NN
+        controller_key = normalize_controller_record(record_type)
+        if controller_key:
+            handler = functools.partial(
+                _handle_controller, controller_key=controller_key
+            )
+    _RESOLVED_HANDLERS[record_type] = handler
+    return handler
+
+
+def dispatch_record(
+    state: UnifiedState,
+    row: UnifiedRow,
+    texts: CountryTexts,
+    texts_portrait: CountryTexts,
+    ctx: RecordContext,
+) -> bool:
+    """Route one unified row to its handler; returns False for unknown types."""
+    handler = resolve_record_handler(row.record_type)
+    if handler is None:
+        return False
+    handler(state, row, texts, texts_portrait, ctx)
+    return True
+
+
+for _name in ("meta_global", "meta-global"):
+    register_record_type(_name, _handle_meta_global)
+for _name in ("meta_local", "meta-local"):
+    register_record_type(_name, _handle_meta_local)
+register_record_type("claim", _timed_handler(process_claim_row))
+register_record_type(
+    "disclaimer", _timed_handler(process_disclaimer_row, is_disclaimer_02=False)
+)
+register_record_type(
+    "disclaimer_02", _timed_handler(process_disclaimer_row, is_disclaimer_02=True)
+)
+register_record_type("logo", _timed_handler(process_logo_row))
+for _name in ("endframe", "end_frame"):
+    register_record_type(_name, _timed_handler(process_endframe_row))
+register_record_type("sub", _timed_handler(process_sub_row, with_line_index=True))
+register_record_type(
+    "super_a", _timed_handler(process_super_a_row, with_line_index=True)
+)
+register_record_type(
+    "super_b", _timed_handler(process_super_b_row, with_line_index=True)
+)
+del _name
@@ -0,0 +1,383 @@
+from __future__ import annotations
+
+import argparse
+import contextlib
+import hmac
+import io
+import json
+import os
+import secrets
+import stat
+import sys
+import tempfile
+import traceback
+from multiprocessing.connection import AuthenticationError, Client, Listener
+from typing import Any, Callable, Dict, List, Optional
+
+SERVE_PROTOCOL_VERSION = 1
+SERVE_AUTHKEY_ENV = "JSON_CONVERTER_SERVE_KEY"
+# Seconds the server waits for each handshake/request message of a client.
+SERVE_REQUEST_TIMEOUT = 10.0
+
+_CHALLENGE_BYTES = 32
+
+RunCallable = Callable[[List[str]], int]
+
+
+def _connection_family() -> str:
+    return "AF_PIPE" if sys.platform == "win32" else "AF_UNIX"
+
+
+def _is_private_dir(path: str) -> bool:
+    try:
+        st = os.lstat(path)
+    except OSError:
+        return False
+    return (
+        stat.S_ISDIR(st.st_mode) and st.st_uid == os.getuid() and not st.st_mode & 0o077
+    )
+
+
+def _private_dir() -> str:
+    """Per-user directory for the server socket and key (0700 on Unix).
+
+    Raises ``PermissionError`` when the directory exists but is not private
+    to the current user (e.g. pre-created by someone else in a shared /tmp).
+    """
+    if sys.platform == "win32":
+        base = os.getenv("LOCALAPPDATA") or os.path.expanduser("~")
+        path = os.path.join(base, "json_converter")
+        os.makedirs(path, exist_ok=True)
+        return path
+    runtime_dir = os.getenv("XDG_RUNTIME_DIR")
+    if runtime_dir and _is_private_dir(runtime_dir):
+        path = os.path.join(runtime_dir, "json_converter")
+    else:
+        path = os.path.join(tempfile.gettempdir(), f"json_converter-{os.getuid()}")
+    try:
+        os.mkdir(path, 0o700)
+    except FileExistsError:
+        pass
+    if not _is_private_dir(path):
+        raise PermissionError(
+            f"{path} is not a private directory owned by the current user"
+        )
+    return path
+
+
+def default_serve_address() -> str:
+    """Per-user Unix socket (named pipe on Windows) for ``--serve``."""
+    if sys.platform == "win32":
+        user = os.getenv("USERNAME") or "default"
+        return rf"\\.\pipe\json_converter-{user}"
+    return os.path.join(_private_dir(), "serve.sock")
+
+
+def _check_own_socket(address: str) -> None:
+    """Refuse paths that are not a socket owned by the current user."""
+    st = os.lstat(address)
+    if not stat.S_ISSOCK(st.st_mode) or st.st_uid != os.getuid():
+        raise PermissionError(f"{address} is not a socket owned by the current user")
+
+
+def _default_authkey() -> Optional[bytes]:
+    """Per-user key in the private directory, created on first use."""
+    try:
+        path = os.path.join(_private_dir(), "serve.key")
+    except OSError:
+        return None
+    try:
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    except FileExistsError:
+        try:
+            with open(path, "rb") as f:
+                return f.read().strip() or None
+        except OSError:
+            return None
+    except OSError:
+        return None
+    key = secrets.token_hex(32).encode("ascii")
+    with os.fdopen(fd, "wb") as f:
+        f.write(key)
+    return key
+
+
+def _resolve_authkey(authkey: Optional[bytes]) -> bytes:
+    if authkey is not None:
+        return authkey
+    env_val = os.getenv(SERVE_AUTHKEY_ENV)
+    if env_val:
+        return env_val.encode("utf-8")
+    return _default_authkey() or b""
+
+
+def _send_json(conn: Any, obj: Dict[str, Any]) -> None:
+    conn.send_bytes(json.dumps(obj, ensure_ascii=False).encode("utf-8"))
+
+
+def _recv_bytes(conn: Any, timeout: Optional[float] = None) -> bytes:
+    if timeout is not None and not conn.poll(timeout):
+        raise TimeoutError(f"no message within {timeout:g}s")
+    return conn.recv_bytes()
+
+
+def _recv_json(conn: Any, timeout: Optional[float] = None) -> Any:
+    return json.loads(_recv_bytes(conn, timeout).decode("utf-8"))
+
+
+def _mac(authkey: bytes, message: bytes) -> bytes:
+    return hmac.new(authkey, message, "sha256").digest()
+
+
+def _server_handshake(conn: Any, authkey: bytes, timeout: float) -> None:
+    """Mutual HMAC challenge; unlike ``Listener(authkey=...)`` every read has
+    a timeout, so a silent client cannot block the server."""
+    challenge = secrets.token_bytes(_CHALLENGE_BYTES)
+    conn.send_bytes(challenge)
+    reply = _recv_bytes(conn, timeout)
+    if len(reply) != 2 * _CHALLENGE_BYTES or not hmac.compare_digest(
+        reply[:_CHALLENGE_BYTES], _mac(authkey, challenge)
+    ):
+        raise AuthenticationError("digest received was wrong")
+    conn.send_bytes(_mac(authkey, reply[_CHALLENGE_BYTES:]))
+
+
+def _client_handshake(conn: Any, authkey: bytes, timeout: float) -> None:
+    challenge = _recv_bytes(conn, timeout)
+    own = secrets.token_bytes(_CHALLENGE_BYTES)
+    conn.send_bytes(_mac(authkey, challenge) + own)
+    if not hmac.compare_digest(_recv_bytes(conn, timeout), _mac(authkey, own)):
+        raise AuthenticationError("server failed to authenticate")
+
+
+def handle_serve_request(request: Any, run: RunCallable) -> Dict[str, Any]:
+    """Run one ``{"argv": [...], "cwd": ...}`` request and capture its output.
+
+    Returns ``{"exitCode", "stdout", "stderr"}``. argparse exits and unexpected
+    exceptions are reported in the response instead of stopping the server.
+    """
+    if (
+        not isinstance(request, dict)
+        or not isinstance(request.get("argv"), list)
+        or not all(isinstance(a, str) for a in request["argv"])
+    ):
+        return {
+            "exitCode": 2,
+            "stdout": "",
+            "stderr": "Invalid request: expected {'argv': [str, ...]}\n",
+        }
+    out, err = io.StringIO(), io.StringIO()
+    prev_cwd = os.getcwd()
+    try:
+        with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+            try:
+                if request.get("cwd"):
+                    os.chdir(request["cwd"])
+                exit_code = run(list(request["argv"]))
+            except SystemExit as ex:
+                if ex.code is None:
+                    exit_code = 0
+                elif isinstance(ex.code, int):
+                    exit_code = ex.code
+                else:
+                    print(ex.code, file=sys.stderr)
+                    exit_code = 1
+            except Exception:
+                traceback.print_exc()
+                exit_code = 1
+    finally:
+        os.chdir(prev_cwd)
+    return {
+        "exitCode": int(exit_code or 0),
+        "stdout": out.getvalue(),
+        "stderr": err.getvalue(),
+    }
+
+
+def serve_forever(
+    run: RunCallable,
+    *,
+    address: Optional[str] = None,
+    authkey: Optional[bytes] = None,
+    ready: Optional[Callable[[str], None]] = None,
+    request_timeout: float = SERVE_REQUEST_TIMEOUT,
+) -> int:
+    """Serve conversion requests one at a time until a shutdown request.
+
+    Modules, caches and other process state stay warm between requests.
+    """
+    family = _connection_family()
+    try:
+        address = address or default_serve_address()
+    except OSError as ex:
+        print(f"Error: no usable converter server address: {ex}", file=sys.stderr)
+        return 1
+    authkey = _resolve_authkey(authkey)
+    if family == "AF_UNIX" and os.path.lexists(address):
+        try:
+            _check_own_socket(address)
+        except OSError as ex:
+            print(f"Error: refusing to replace {address}: {ex}", file=sys.stderr)
+            return 1
+        if ping_server(address=address, authkey=authkey) is not None:
+            print(
+                f"Error: a converter server is already running on {address}",
+                file=sys.stderr,
+            )
+            return 1
+        try:
+            os.remove(address)  # stale socket from a crashed server
+        except OSError as ex:
+            print(f"Error: cannot remove stale {address}: {ex}", file=sys.stderr)
+            return 1
+
+    old_umask = os.umask(0o077) if family == "AF_UNIX" else None
+    try:
+        listener = Listener(address, family=family)
+    except OSError as ex:
+        print(f"Error: cannot listen on {address}: {ex}", file=sys.stderr)
+        return 1
+    finally:
+        if old_umask is not None:
+            os.umask(old_umask)
+    try:
+        print(f"Converter server listening on {address}", flush=True)
+        if ready is not None:
+            ready(address)
+        while True:
+            try:
+                conn = listener.accept()
+            except OSError as ex:
+                print(f"Warning: rejected connection: {ex}", file=sys.stderr)
+                continue
+            with conn:
+                try:
+                    _server_handshake(conn, authkey, request_timeout)
+                    request = _recv_json(conn, request_timeout)
+                except (AuthenticationError, EOFError, OSError, ValueError) as ex:
+                    print(f"Warning: rejected connection: {ex}", file=sys.stderr)
+                    continue
+                command = request.get("command") if isinstance(request, dict) else None
+                if command == "shutdown":
+                    _send_json(conn, {"ok": True})
+                    break
+                if command == "ping":
+                    _send_json(
+                        conn,
+                        {
+                            "ok": True,
+                            "pid": os.getpid(),
+                            "protocol": SERVE_PROTOCOL_VERSION,
+                        },
+                    )
+                    continue
+                try:
+                    _send_json(conn, handle_serve_request(request, run))
+                except OSError:
+                    continue  # client went away
+    except KeyboardInterrupt:
+        pass
+    finally:
+        listener.close()
+        if family == "AF_UNIX":
+            with contextlib.suppress(OSError):
+                _check_own_socket(address)
+                os.remove(address)
+    return 0
+
+
+def _request(
+    payload: Dict[str, Any],
+    *,
+    address: Optional[str] = None,
+    authkey: Optional[bytes] = None,
+) -> Dict[str, Any]:
+    address = address or default_serve_address()
+    family = _connection_family()
+    if family == "AF_UNIX":
+        _check_own_socket(address)
+    conn = Client(address, family=family)
+    with conn:
+        _client_handshake(conn, _resolve_authkey(authkey), SERVE_REQUEST_TIMEOUT)
+        _send_json(conn, payload)
+        return _recv_json(conn)
+
+
+def run_via_server(
+    argv: List[str],
+    *,
+    address: Optional[str] = None,
+    authkey: Optional[bytes] = None,
+    cwd: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Send one argument vector to a running server; returns its response.
+
+    Raises ``OSError`` (e.g. ``FileNotFoundError``/``ConnectionRefusedError``)
+    when no server is reachable.
+    """
+    return _request(
+        {"argv": list(argv), "cwd": cwd or os.getcwd()},
+        address=address,
+        authkey=authkey,
+    )
+
+
+def ping_server(
+    *, address: Optional[str] = None, authkey: Optional[bytes] = None
+) -> Optional[Dict[str, Any]]:
+    """Server info, or None when no server answers at ``address``."""
+    try:
+        return _request({"command": "ping"}, address=address, authkey=authkey)
+    except (OSError, EOFError, AuthenticationError, ValueError):
+        return None
+
+
+def stop_server(
+    *, address: Optional[str] = None, authkey: Optional[bytes] = None
+) -> bool:
+    """Ask the server at ``address`` to exit; False when none is running."""
+    try:
+        _request({"command": "shutdown"}, address=address, authkey=authkey)
+    except (OSError, EOFError, AuthenticationError, ValueError):
+        return False
+    return True
+
+
+def _build_serve_parser() -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(add_help=False, allow_abbrev=False)
+    mode = p.add_mutually_exclusive_group()
+    mode.add_argument("--serve", action="store_true")
+    mode.add_argument("--serve-stop", action="store_true")
+    mode.add_argument("--via-server", action="store_true")
+    p.add_argument("--serve-address", default=None)
+    return p
+
+
+def dispatch_serve_flags(argv: List[str], run: RunCallable) -> Optional[int]:
+    """Handle ``--serve``/``--serve-stop``/``--via-server``; None otherwise.
+
+    ``--via-server`` forwards the remaining arguments to a running server and
+    falls back to ``run`` in-process when none is reachable.
+    """
+    if not any(a in ("--serve", "--serve-stop", "--via-server") for a in argv):
+        return None
+    opts, rest = _build_serve_parser().parse_known_args(argv)
+    if opts.serve:
+        return serve_forever(run, address=opts.serve_address)
+    if opts.serve_stop:
+        if stop_server(address=opts.serve_address):
+            print("Converter server stopped.")
+            return 0
+        print("No converter server running.", file=sys.stderr)
+        return 1
+    try:
+        response = run_via_server(rest, address=opts.serve_address)
+    except (OSError, EOFError, AuthenticationError) as ex:
+        print(
+            f"Converter server not reachable ({ex}); running in-process.",
+            file=sys.stderr,
+        )
+        return run(rest)
+    sys.stdout.write(response.get("stdout", ""))
+    sys.stderr.write(response.get("stderr", ""))
+    return int(response.get("exitCode", 1))
@@ -1,7 +1,7 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from .columns import detect_columns
-from .timecode import parse_timecode
+from .timecode import parse_timecode, parse_timecodes
 
 
 def convert_simple_mode(
@@ -38,8 +38,7 @@ def convert_simple_mode(
             return f"{val:.{round_ndigits}f}"
         return float(val)
 
-    out_items: List[Dict[str, Any]] = []
-    line_no = start_line_index
+    kept_rows: List[Tuple[Dict[str, Any], Any]] = []
     for d in dict_rows:
         text_val = d.get(text_name, "")
         text = (
@@ -47,11 +46,25 @@ def convert_simple_mode(
         )
         if skip_empty_text and (text is None or str(text).strip() == ""):
             continue
-        try:
-            tin = parse_timecode(str(d.get(start_name, "")).strip(), effective_fps)
-            tout = parse_timecode(str(d.get(end_name, "")).strip(), effective_fps)
-        except Exception as e:
-            raise ValueError(f"Failed to parse timecodes for row {d}: {e}")
+        kept_rows.append((d, text))
+
+    # Whole start/end columns are parsed in one pass each.
+    starts = [str(d.get(start_name, "")).strip() for d, _ in kept_rows]
+    ends = [str(d.get(end_name, "")).strip() for d, _ in kept_rows]
+    start_batch = parse_timecodes(starts, effective_fps)
+    end_batch = parse_timecodes(ends, effective_fps)
+
+    out_items: List[Dict[str, Any]] = []
+    line_no = start_line_index
+    for i, (d, text) in enumerate(kept_rows):
+        if start_batch.invalid[i] or end_batch.invalid[i]:
+            try:
+                parse_timecode(starts[i], effective_fps)
+                parse_timecode(ends[i], effective_fps)
+            except Exception as e:
+                raise ValueError(f"Failed to parse timecodes for row {d}: {e}")
+        tin = start_batch.seconds[i]
+        tout = end_batch.seconds[i]
         item = {
             "line": line_no,
             "in": fmt_time_simple(tin),
@@ -0,0 +1,294 @@
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+from .integration_injections import (
+    inject_layer_config_payload,
+    inject_media_mapping,
+)
+from .json_stream import iter_json_chunks
+from .lazy_payloads import CountryPayloadFactory
+from .output_paths import (
+    resolve_country_output_path,
+    trim_logo_anim_flag_for_country,
+)
+
+# (country code, variant count). Variants of one country are written in order
+# by the same worker, since they may resolve to the same output path.
+SplitTask = Tuple[str, int]
+
+
+@dataclass(frozen=True)
+class SplitWriteOptions:
+    """Settings shared by every per-country (split) output write."""
+
+    pattern: str
+    media_groups_map: Optional[Dict[str, Any]] = None
+    layer_config_payload: Optional[Dict[str, Any]] = None
+    sample: bool = False
+    # Absolute output path -> content fingerprint from the last build; when
+    # set, files whose fingerprint is unchanged are not rewritten.
+    previous_fingerprints: Optional[Dict[str, str]] = None
+
+
+class WriteResult(NamedTuple):
+    path: str
+    fingerprint: Optional[str]
+    written: bool
+
+
+# Per-run provenance fields, blanked in fingerprints so that a file is only
+# rewritten when its actual content changes.
+_VOLATILE_METADATA_KEYS = ("generatedAt", "inputSha256")
+
+
+def _volatile_fields(payload: Any) -> List[Tuple[str, str]]:
+    if not isinstance(payload, dict):
+        return []
+    mg = payload.get("metadataGlobal") or payload.get("metadata")
+    if not isinstance(mg, dict):
+        return []
+    fields = []
+    for key in _VOLATILE_METADATA_KEYS:
+        value = mg.get(key)
+        if isinstance(value, str):
+            prefix = json.dumps(key) + ": "
+            fields.append(
+                (prefix + json.dumps(value, ensure_ascii=False), prefix + '""')
+            )
+    return fields
+
+
+def write_json_file(
+    path: str,
+    payload: Dict[str, Any],
+    *,
+    previous_fingerprints: Optional[Dict[str, str]] = None,
+) -> WriteResult:
+    """Write ``payload`` as indent=2 JSON.
+
+    With ``previous_fingerprints`` the content is written to a temporary file
+    and fingerprinted (SHA-256, ``generatedAt``/``inputSha256`` excluded); an
+    existing file with the same fingerprint is left untouched. The mapping
+    (absolute path -> fingerprint) is updated in place with the new content.
+    """
+    abs_path = os.path.abspath(path)
+    os.makedirs(os.path.dirname(abs_path), exist_ok=True)
+    if previous_fingerprints is None:
+        with open(path, "w", encoding="utf-8") as f:
+            f.writelines(iter_json_chunks(payload, indent=2))
+        return WriteResult(path, None, True)
+
+    volatile = _volatile_fields(payload)
+    digest = hashlib.sha256()
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        for chunk in iter_json_chunks(payload, indent=2):
+            f.write(chunk)
+            # metadata is never streamed, so each field sits in one chunk.
+            for field in [fld for fld in volatile if fld[0] in chunk]:
+                chunk = chunk.replace(field[0], field[1], 1)
+                volatile.remove(field)
+            digest.update(chunk.encode("utf-8"))
+    fingerprint = digest.hexdigest()
+    unchanged = previous_fingerprints.get(abs_path) == fingerprint
+    # Track what is now on disk: variants may write the same path in turn.
+    previous_fingerprints[abs_path] = fingerprint
+    if unchanged and os.path.isfile(path):
+        os.remove(tmp_path)
+        return WriteResult(path, fingerprint, False)
+    os.replace(tmp_path, path)
+    return WriteResult(path, fingerprint, True)
+
+
+def make_sample(payload: Dict[str, Any]) -> Dict[str, Any]:
+    SAMPLE_LIMITS = {
+        "claim": 2,
+        "disclaimer": 1,
+        "disclaimer_02": 1,
+        "logo": 1,
+        "videos": 2,
+        "subtitles": 5,
+        "video_claim": 2,
+    }
+
+    def _truncate_top_arrays(obj: Dict[str, Any]):
+        out = obj
+        if "claim" in out and isinstance(out["claim"], list):
+            out["claim"] = out["claim"][: SAMPLE_LIMITS["claim"]]
+        if "disclaimer" in out and isinstance(out["disclaimer"], list):
+            out["disclaimer"] = out["disclaimer"][: SAMPLE_LIMITS["disclaimer"]]
+        if "disclaimer_02" in out and isinstance(out["disclaimer_02"], list):
+            out["disclaimer_02"] = out["disclaimer_02"][
+                : SAMPLE_LIMITS["disclaimer_02"]
+            ]
+        if "logo" in out and isinstance(out["logo"], list):
+            out["logo"] = out["logo"][: SAMPLE_LIMITS["logo"]]
+        for key in ("claim", "disclaimer", "disclaimer_02", "logo"):
+            val = out.get(key)
+            if isinstance(val, dict):
+                for orient in ("landscape", "portrait"):
+                    arr = val.get(orient)
+                    if isinstance(arr, list):
+                        limit = (
+                            SAMPLE_LIMITS["claim"]
+                            if key == "claim"
+                            else SAMPLE_LIMITS["disclaimer"]
+                            if key == "disclaimer"
+                            else SAMPLE_LIMITS["disclaimer_02"]
+                            if key == "disclaimer_02"
+                            else SAMPLE_LIMITS["logo"]
+                        )
+                        val[orient] = arr[:limit]
+        return out
+
+    sample = copy.deepcopy(payload)
+    if sample.get("_multi") and isinstance(sample.get("byCountry"), dict):
+        for c, pld in sample.get("byCountry", {}).items():
+            sample["byCountry"][c] = make_sample(pld)
+        countries = sample.get("countries")
+        if isinstance(countries, list):
+            sample["countries"] = countries[:3]
+        return sample
+    sample = _truncate_top_arrays(sample)
+    vids = sample.get("videos")
+    if isinstance(vids, list):
+        vids_trunc = []
+        for v in vids[: SAMPLE_LIMITS["videos"]]:
+            v2 = copy.deepcopy(v)
+            subs = v2.get("subtitles")
+            if isinstance(subs, list):
+                v2["subtitles"] = subs[: SAMPLE_LIMITS["subtitles"]]
+            if "claim" in v2 and isinstance(v2["claim"], list):
+                v2["claim"] = v2["claim"][: SAMPLE_LIMITS["video_claim"]]
+            claim_keys = sorted([k for k in v2.keys() if k.startswith("claim_")])
+            for ck in claim_keys[SAMPLE_LIMITS["video_claim"] :]:
+                del v2[ck]
+            vids_trunc.append(v2)
+        sample["videos"] = vids_trunc
+    if "subtitles" in sample and isinstance(sample["subtitles"], list):
+        sample["subtitles"] = sample["subtitles"][: SAMPLE_LIMITS["subtitles"]]
+    return sample
+
+
+def derive_sample_path(path: str) -> str:
+    root, ext = os.path.splitext(path)
+    return f"{root}_sample{ext or '.json'}"
+
+
+def empty_country_payload() -> Dict[str, Any]:
+    return {"subtitles": [], "claim": [], "disclaimer": [], "metadata": {}}
+
+
+def prepare_country_output(
+    payload: Dict[str, Any], country_code: str, options: SplitWriteOptions
+) -> str:
+    """Inject media/layer config, trim logo_anim_flag; return the output path."""
+    if isinstance(payload, dict):
+        inject_media_mapping(payload, country_code, options.media_groups_map)
+        inject_layer_config_payload(payload, options.layer_config_payload)
+    if isinstance(payload, dict):
+        trim_logo_anim_flag_for_country(
+            payload=payload,
+            country_code=country_code,
+        )
+    mg = payload.get("metadataGlobal") if isinstance(payload, dict) else None
+    return resolve_country_output_path(
+        pattern=options.pattern,
+        country_code=country_code,
+        metadata_global=mg,
+    )
+
+
+def write_country_output(
+    out_path: str, payload: Dict[str, Any], options: SplitWriteOptions
+) -> List[WriteResult]:
+    """Write one prepared payload (and its sample)."""
+    results = [
+        write_json_file(
+            out_path, payload, previous_fingerprints=options.previous_fingerprints
+        )
+    ]
+    if options.sample:
+        results.append(
+            write_json_file(
+                derive_sample_path(out_path),
+                make_sample(payload),
+                previous_fingerprints=options.previous_fingerprints,
+            )
+        )
+    return results
+
+
+# Per-process state installed by the pool initializer.
+_worker_factories: Dict[int, CountryPayloadFactory] = {}
+_worker_options: Optional[SplitWriteOptions] = None
+
+
+def _init_split_worker(
+    factories: Dict[int, CountryPayloadFactory], options: SplitWriteOptions
+) -> None:
+    global _worker_factories, _worker_options
+    _worker_factories = factories
+    _worker_options = options
+
+
+def build_split_payload(
+    factory: CountryPayloadFactory, country: str, options: SplitWriteOptions
+) -> Dict[str, Any]:
+    """Payload for one split write; streamed unless a sample must be cut."""
+    if options.sample:
+        return factory(country)
+    return factory.stream(country)
+
+
+def iter_split_task(
+    task: SplitTask,
+    factories: Dict[int, CountryPayloadFactory],
+    options: SplitWriteOptions,
+) -> Iterator[Tuple[str, List[WriteResult]]]:
+    """Build and write every variant of one country, in variant order."""
+    country, variant_count = task
+    for variant_index in range(variant_count):
+        factory = factories.get(variant_index)
+        if factory is not None and country in factory.countries:
+            payload = build_split_payload(factory, country, options)
+        else:
+            payload = empty_country_payload()
+        out_path = prepare_country_output(payload, country, options)
+        yield out_path, write_country_output(out_path, payload, options)
+
+
+def _run_split_task(task: SplitTask) -> List[Tuple[str, List[WriteResult]]]:
+    assert _worker_options is not None
+    return list(iter_split_task(task, _worker_factories, _worker_options))
+
+
+def write_split_outputs_parallel(
+    tasks: Sequence[SplitTask],
+    factories: Dict[int, CountryPayloadFactory],
+    options: SplitWriteOptions,
+    jobs: int,
+) -> List[Tuple[str, List[WriteResult]]]:
+    """Build and write split outputs in ``jobs`` worker processes.
+
+    Each worker receives the frozen conversion state once (via ``factories``),
+    then builds and writes its countries' payloads itself. Returns
+    ``(output path, write results)`` per payload, in task order.
+    """
+    with ProcessPoolExecutor(
+        max_workers=max(1, min(jobs, len(tasks))),
+        initializer=_init_split_worker,
+        initargs=(factories, options),
+    ) as pool:
+        return [
+            result
+            for task_results in pool.map(_run_split_task, tasks)
+            for result in task_results
+        ]
@@ -1,13 +1,22 @@
 import csv
+import functools
 import os
 import sys
 from datetime import datetime
-from typing import Any, List, Optional, Tuple
+from typing import Any, Callable, Iterator, List, Optional, Tuple
 
-try:
-    from openpyxl import load_workbook as _openpyxl_load_workbook
-except Exception:
-    _openpyxl_load_workbook = None
+from .workbook_cache import open_cached_workbook
+
+
+@functools.lru_cache(maxsize=None)
+def _openpyxl_load_workbook() -> Optional[Callable[..., Any]]:
+    # Only needed for workbooks ``xlsx_reader`` cannot read; not imported
+    # for CSV input.
+    try:
+        from openpyxl import load_workbook
+    except Exception:
+        return None
+    return load_workbook
 
 
 def _sniff_delimiter(sample: str, preferred: Optional[str] = None) -> str:
@@ -44,20 +53,77 @@ def _sniff_delimiter(sample: str, preferred: Optional[str] = None) -> str:
         return best
 
 
-def _read_table(
+class TableStream:
+    """Header row plus a lazy iterator over the remaining rows of a table.
+
+    Rows are yielded as lists of strings (XLSX cells are converted the same way
+    as in ``_read_table``). The underlying file/workbook stays open until the
+    stream is exhausted or closed, so prefer using it as a context manager.
+    """
+
+    def __init__(
+        self,
+        headers: List[str],
+        rows: Iterator[List[str]],
+        delimiter: str,
+        closer: Optional[Callable[[], None]] = None,
+    ) -> None:
+        self.headers = headers
+        self.delimiter = delimiter
+        self._rows = rows
+        self._closer = closer
+
+    def __iter__(self) -> Iterator[List[str]]:
+        return self._rows
+
+    def close(self) -> None:
+        closer, self._closer = self._closer, None
+        if closer is not None:
+            try:
+                closer()
+            except Exception:
+                pass
+
+    def __enter__(self) -> "TableStream":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+def _xlsx_cell_to_text(cell: Any) -> str:
+    if cell is None:
+        return ""
+    if isinstance(cell, datetime):
+        return cell.isoformat()
+    return str(cell)
+
+
+def _openpyxl_fallback(path: str, **kwargs: Any) -> Any:
+    load_workbook = _openpyxl_load_workbook()
+    if load_workbook is None:
+        raise RuntimeError(
+            "XLSX input requires 'openpyxl'. Install it (e.g., pip install openpyxl) or provide CSV input."
+        )
+    return load_workbook(path, **kwargs)
+
+
+def _load_values_workbook(path: str) -> Any:
+    # The data sheet is streamed, not kept (``workbook_cache`` only reuses it
+    # when another consumer already cached it); openpyxl is only loaded for
+    # workbooks the lightweight ``xlsx_reader`` does not support.
+    return open_cached_workbook(path, _openpyxl_fallback, retain=False)
+
+
+def _stream_table(
     path: str,
     encoding: str = "utf-8-sig",
     delimiter: Optional[str] = None,
     xlsx_sheet: Optional[str] = None,
-) -> Tuple[List[str], List[List[str]], str]:
+) -> TableStream:
     ext = os.path.splitext(path)[1].lower()
     if ext in (".xlsx", ".xlsm", ".xltx", ".xltm"):
-        if _openpyxl_load_workbook is None:
-            raise RuntimeError(
-                "XLSX input requires 'openpyxl'. Install it (e.g., pip install openpyxl) or provide CSV input."
-            )
-
-        wb = _openpyxl_load_workbook(path, data_only=True, read_only=True)
+        wb = _load_values_workbook(path)
         try:
             if xlsx_sheet:
                 if xlsx_sheet not in wb.sheetnames:
@@ -81,24 +147,19 @@ def _read_table(
             first_row = next(rows_iter, None)
             if first_row is None:
                 raise ValueError("XLSX appears to be empty.")
-
-            def _to_text(cell: Any) -> str:
-                if cell is None:
-                    return ""
-                if isinstance(cell, datetime):
-                    return cell.isoformat()
-                return str(cell)
-
-            headers = [_to_text(c) for c in first_row]
-            rows = [[_to_text(c) for c in row] for row in rows_iter]
-            return headers, rows, f"xlsx:{ws.title}"
-        finally:
+        except Exception:
             try:
                 wb.close()
             except Exception:
                 pass
+            raise
 
-    with open(path, "r", encoding=encoding, newline="") as f:
+        headers = [_xlsx_cell_to_text(c) for c in first_row]
+        xlsx_rows = ([_xlsx_cell_to_text(c) for c in row] for row in rows_iter)
+        return TableStream(headers, xlsx_rows, f"xlsx:{ws.title}", wb.close)
+
+    f = open(path, "r", encoding=encoding, newline="")
+    try:
         sample = f.read(8192)
         f.seek(0)
         delim = _sniff_delimiter(sample, preferred=delimiter)
@@ -107,5 +168,19 @@ def _read_table(
             headers = next(reader)
         except StopIteration:
             raise ValueError("CSV appears to be empty.")
-        rows = [list(r) for r in reader]
-        return headers, rows, delim
+    except Exception:
+        f.close()
+        raise
+    return TableStream(headers, reader, delim, f.close)
+
+
+def _read_table(
+    path: str,
+    encoding: str = "utf-8-sig",
+    delimiter: Optional[str] = None,
+    xlsx_sheet: Optional[str] = None,
+) -> Tuple[List[str], List[List[str]], str]:
+    with _stream_table(
+        path, encoding=encoding, delimiter=delimiter, xlsx_sheet=xlsx_sheet
+    ) as table:
+        return table.headers, [list(r) for r in table], table.delimiter
@@ -1,8 +1,40 @@
+import functools
+import math
 import re
-from typing import Any
+from typing import Any, List, NamedTuple, Optional, Sequence
 
+try:
+    import numpy as _np
+except Exception:  # pragma: no cover - optional dependency
+    _np = None  # type: ignore[assignment]
 
-def parse_timecode(value: str, fps: float) -> float:
+_PLAIN_SECONDS_RE = re.compile(r"\d+(?:[\.,]\d+)?")
+_ASCII_DIGITS = frozenset("0123456789")
+
+# Distinct (value, fps) pairs kept by the timecode cache.
+TIMECODE_CACHE_SIZE = 16384
+
+
+def _parse_frames_fast(tc: str, fps: float) -> Any:
+    # HH:MM:SS:FF with two ASCII digits per field; None when not that shape.
+    if (
+        len(tc) != 11
+        or tc[2] != ":"
+        or tc[5] != ":"
+        or tc[8] != ":"
+        or not _ASCII_DIGITS.issuperset(tc[0:2] + tc[3:5] + tc[6:8] + tc[9:11])
+    ):
+        return None
+    if fps <= 0:
+        raise ValueError("fps must be > 0 for HH:MM:SS:FF parsing")
+    h = int(tc[0:2])
+    m = int(tc[3:5])
+    s = int(tc[6:8])
+    frames = int(tc[9:11])
+    return float(h * 3600 + m * 60 + s + frames / fps)
+
+
+def _parse_timecode_uncached(value: str, fps: float) -> float:
     if value is None:
         raise ValueError("Timecode value is None")
     tc = value.strip()
@@ -11,7 +43,11 @@ def parse_timecode(value: str, fps: float) -> float:
 
     tc = tc.replace(";", ":")
 
-    plain_sec_match = re.fullmatch(r"\d+(?:[\.,]\d+)?", tc)
+    fast = _parse_frames_fast(tc, fps)
+    if fast is not None:
+        return fast
+
+    plain_sec_match = _PLAIN_SECONDS_RE.fullmatch(tc)
     if plain_sec_match:
         return float(tc.replace(",", "."))
 
@@ -40,6 +76,103 @@ def parse_timecode(value: str, fps: float) -> float:
     raise ValueError(f"Unsupported timecode format: {value}")
 
 
+# Errors are not cached, so invalid values raise on every call as before.
+_parse_timecode_cached = functools.lru_cache(maxsize=TIMECODE_CACHE_SIZE)(
+    _parse_timecode_uncached
+)
+
+
+def parse_timecode(value: str, fps: float) -> float:
+    if type(value) is not str:
+        return _parse_timecode_uncached(value, fps)
+    return _parse_timecode_cached(value, fps)
+
+
+def clear_timecode_cache() -> None:
+    _parse_timecode_cached.cache_clear()
+
+
+class TimecodeBatch(NamedTuple):
+    """Result of ``parse_timecodes``: seconds (NaN where invalid) and a mask."""
+
+    seconds: List[float]
+    invalid: List[bool]
+
+
+def _normalize_token(value: Any) -> Optional[str]:
+    if not isinstance(value, str):
+        return None
+    return value.strip().replace(";", ":")
+
+
+def _parse_frames_numpy(tokens: Sequence[Optional[str]], fps: float) -> Any:
+    # Vectorized HH:MM:SS:FF fast path. Returns (seconds, matched) arrays;
+    # unmatched entries are left for the scalar parser.
+    n = len(tokens)
+    lengths = _np.fromiter(
+        (len(t) if t else 0 for t in tokens), dtype=_np.int64, count=n
+    )
+    candidate = lengths == 11
+    arr = _np.array([t if c else "" for t, c in zip(tokens, candidate)], dtype="<U11")
+    codes = arr.view(_np.uint32).reshape(n, 11).astype(_np.int64)
+    digits = codes[:, [0, 1, 3, 4, 6, 7, 9, 10]] - 48
+    matched = (
+        candidate
+        & (codes[:, [2, 5, 8]] == 58).all(axis=1)
+        & ((digits >= 0) & (digits <= 9)).all(axis=1)
+    )
+    h = digits[:, 0] * 10 + digits[:, 1]
+    m = digits[:, 2] * 10 + digits[:, 3]
+    sec = digits[:, 4] * 10 + digits[:, 5]
+    frames = digits[:, 6] * 10 + digits[:, 7]
+    # Same operation order as the scalar path, so the floats are identical.
+    seconds = (h * 3600 + m * 60 + sec) + frames / fps
+    return seconds, matched
+
+
+def parse_timecodes(
+    values: Sequence[Any], fps: float, *, backend: str = "auto"
+) -> TimecodeBatch:
+    """Parse a whole column of timecodes without raising per value.
+
+    Each entry gets the value ``parse_timecode`` would return; entries it
+    would reject are NaN in ``seconds`` and True in ``invalid`` (call
+    ``parse_timecode`` on one to get its error). ``backend`` is "auto",
+    "numpy" (requires NumPy) or "python"; "auto" uses NumPy when installed.
+    """
+    if backend not in ("auto", "numpy", "python"):
+        raise ValueError(f"Unknown timecode backend: {backend}")
+    if backend == "numpy" and _np is None:
+        raise ImportError("NumPy is required for the 'numpy' timecode backend")
+    tokens = [_normalize_token(v) for v in values]
+    seconds = [math.nan] * len(tokens)
+    invalid = [True] * len(tokens)
+    pending = range(len(tokens))
+    use_numpy = (
+        backend != "python"
+        and _np is not None
+        and len(tokens) > 0
+        and isinstance(fps, (int, float))
+        and fps > 0
+    )
+    if use_numpy:
+        fast_seconds, matched = _parse_frames_numpy(tokens, fps)
+        for i in _np.flatnonzero(matched).tolist():
+            seconds[i] = float(fast_seconds[i])
+            invalid[i] = False
+        pending = _np.flatnonzero(~matched).tolist()
+    for i in pending:
+        token = tokens[i]
+        if token is None:
+            continue
+        try:
+            seconds[i] = parse_timecode(token, fps)
+        except Exception:
+            continue
+        invalid[i] = False
+    return TimecodeBatch(seconds, invalid)
+
+
 def safe_int(val: Any, default: int = 0) -> int:
     try:
         return int(val)
@@ -1,13 +1,119 @@
+import functools
 import re
 import sys
 from dataclasses import dataclass, field
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .instrumentation import Instrumentation, timed_country_builder
+from .lazy_payloads import LazyCountryPayloads
+from .payload_sharing import PayloadInterner, share_country_payload
 
 
 _CONTROLLER_RECORD_RE = re.compile(r"^controller_(\d+)$", re.I)
 _CONTROLLER_FLAG_RE = re.compile(r"^controller_(\d+)_flag$", re.I)
 
 
+class CountryTexts:
+    """Per-country texts of one row, stored as a list in shared country order.
+
+    ``index`` maps country code -> position and is shared by every row of a
+    conversion, so a row only owns its ``cells`` list. Supports the read/write
+    mapping operations the record processors use (``get``, ``[]``, ``in``).
+    """
+
+    __slots__ = ("index", "cells")
+
+    def __init__(self, index: Dict[str, int], cells: List[str]) -> None:
+        self.index = index
+        self.cells = cells
+
+    @classmethod
+    def empty(cls, index: Dict[str, int]) -> "CountryTexts":
+        return cls(index, [""] * len(index))
+
+    def __getitem__(self, country: str) -> str:
+        return self.cells[self.index[country]]
+
+    def __setitem__(self, country: str, value: str) -> None:
+        self.cells[self.index[country]] = value
+
+    def __contains__(self, country: object) -> bool:
+        return country in self.index
+
+    def __iter__(self):
+        return iter(self.index)
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, CountryTexts):
+            return self.index == other.index and self.cells == other.cells
+        if isinstance(other, dict):
+            return dict(self.items()) == other
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"CountryTexts({dict(self.items())!r})"
+
+    def get(self, country: str, default: Any = None) -> Any:
+        pos = self.index.get(country)
+        return default if pos is None else self.cells[pos]
+
+    def keys(self):
+        return self.index.keys()
+
+    def items(self) -> List[Tuple[str, str]]:
+        return list(zip(self.index, self.cells))
+
+    def copy(self) -> "CountryTexts":
+        return CountryTexts(self.index, list(self.cells))
+
+
+class TimedTextRow:
+    """One timed unified row (sub/super/claim/disclaimer/logo/endFrame/controller)."""
+
+    __slots__ = ("line", "start", "end", "texts", "texts_portrait")
+
+    def __init__(
+        self,
+        line: Optional[int],
+        start: Optional[float],
+        end: Optional[float],
+        texts: CountryTexts,
+        texts_portrait: CountryTexts,
+    ) -> None:
+        self.line = line
+        self.start = start
+        self.end = end
+        self.texts = texts
+        self.texts_portrait = texts_portrait
+
+    def __repr__(self) -> str:
+        return (
+            f"TimedTextRow(line={self.line!r}, start={self.start!r}, "
+            f"end={self.end!r}, texts={self.texts!r}, "
+            f"texts_portrait={self.texts_portrait!r})"
+        )
+
+    def copy(self) -> "TimedTextRow":
+        return TimedTextRow(
+            self.line,
+            self.start,
+            self.end,
+            self.texts.copy(),
+            self.texts_portrait.copy(),
+        )
+
+
+def _country_positions(rows: List[TimedTextRow], countries: List[str]) -> List[int]:
+    # All rows of one conversion share the country index of their texts.
+    if not rows:
+        return []
+    index = rows[0].texts.index
+    return [index[c] for c in countries]
+
+
 @dataclass
 class UnifiedState:
     global_meta: Dict[str, Any] = field(default_factory=dict)
@@ -26,26 +132,22 @@ class UnifiedState:
     )
     global_flags_seen: set[str] = field(default_factory=set)
     warned_logo_anim_legacy_country_scope: bool = False
-    claims_rows: List[Dict[str, Any]] = field(default_factory=list)
-    per_video_claim_rows: Dict[str, List[Dict[str, Any]]] = field(default_factory=dict)
-    disc_rows_raw: List[Dict[str, Any]] = field(default_factory=list)
-    per_video_disc_rows_raw: Dict[str, List[Dict[str, Any]]] = field(
-        default_factory=dict
-    )
-    disc_02_rows_raw: List[Dict[str, Any]] = field(default_factory=list)
-    per_video_disc_02_rows_raw: Dict[str, List[Dict[str, Any]]] = field(
+    claims_rows: List[TimedTextRow] = field(default_factory=list)
+    per_video_claim_rows: Dict[str, List[TimedTextRow]] = field(default_factory=dict)
+    disc_rows_raw: List[TimedTextRow] = field(default_factory=list)
+    per_video_disc_rows_raw: Dict[str, List[TimedTextRow]] = field(default_factory=dict)
+    disc_02_rows_raw: List[TimedTextRow] = field(default_factory=list)
+    per_video_disc_02_rows_raw: Dict[str, List[TimedTextRow]] = field(
         default_factory=dict
     )
-    logo_rows_raw: List[Dict[str, Any]] = field(default_factory=list)
-    per_video_logo_rows_raw: Dict[str, List[Dict[str, Any]]] = field(
+    logo_rows_raw: List[TimedTextRow] = field(default_factory=list)
+    per_video_logo_rows_raw: Dict[str, List[TimedTextRow]] = field(default_factory=dict)
+    endframe_rows_raw: List[TimedTextRow] = field(default_factory=list)
+    per_video_endframe_rows_raw: Dict[str, List[TimedTextRow]] = field(
         default_factory=dict
     )
-    endframe_rows_raw: List[Dict[str, Any]] = field(default_factory=list)
-    per_video_endframe_rows_raw: Dict[str, List[Dict[str, Any]]] = field(
-        default_factory=dict
-    )
-    controller_rows_raw: Dict[str, List[Dict[str, Any]]] = field(default_factory=dict)
-    per_video_controller_rows_raw: Dict[str, Dict[str, List[Dict[str, Any]]]] = field(
+    controller_rows_raw: Dict[str, List[TimedTextRow]] = field(default_factory=dict)
+    per_video_controller_rows_raw: Dict[str, Dict[str, List[TimedTextRow]]] = field(
         default_factory=dict
     )
     controller_keys_seen: set[str] = field(default_factory=set)
@@ -68,6 +170,7 @@ class UnifiedState:
     auto_super_b_line_per_video: Dict[str, int] = field(default_factory=dict)
 
 
+@functools.lru_cache(maxsize=1024)
 def normalize_controller_record(name: str) -> Optional[str]:
     m = _CONTROLLER_RECORD_RE.match((name or "").strip())
     if not m:
@@ -101,35 +204,10 @@ def normalize_duration_token(value: str) -> str:
     return token
 
 
-def collect_country_texts(
-    row: List[str],
-    countries: List[str],
-    country_orientation_cols: Dict[str, Dict[str, Optional[int]]],
-) -> Tuple[Dict[str, str], Dict[str, str]]:
-    texts: Dict[str, str] = {}
-    texts_portrait: Dict[str, str] = {}
-    for c in countries:
-        land_idx = country_orientation_cols[c]["landscape"]
-        port_idx = country_orientation_cols[c]["portrait"]
-        land_val = (
-            row[land_idx].replace("\r", "").rstrip()
-            if land_idx is not None and land_idx < len(row)
-            else ""
-        )
-        port_val = (
-            row[port_idx].replace("\r", "").rstrip()
-            if port_idx is not None and port_idx < len(row)
-            else ""
-        )
-        texts[c] = land_val
-        texts_portrait[c] = port_val
-    return texts, texts_portrait
-
-
 def propagate_all_scope_texts(
     country_scope_val: str,
-    texts: Dict[str, str],
-    texts_portrait: Dict[str, str],
+    texts: CountryTexts,
+    texts_portrait: CountryTexts,
     countries: List[str],
 ) -> None:
     if country_scope_val != "ALL":
@@ -151,8 +229,8 @@ def process_meta_global_row(
     state: UnifiedState,
     key_name: str,
     countries: List[str],
-    texts: Dict[str, str],
-    texts_portrait: Dict[str, str],
+    texts: CountryTexts,
+    texts_portrait: CountryTexts,
     metadata_cell_val: str,
     target_duration_val: str,
     country_scope_raw: str,
@@ -234,8 +312,8 @@ def process_meta_local_row(
     key_name: str,
     video_id: str,
     countries: List[str],
-    texts: Dict[str, str],
-    texts_portrait: Dict[str, str],
+    texts: CountryTexts,
+    texts_portrait: CountryTexts,
     metadata_cell_val: str,
 ) -> bool:
     if not key_name or not video_id:
@@ -287,8 +365,8 @@ def process_claim_row(
     line_num: Optional[int],
     start_tc: Optional[float],
     end_tc: Optional[float],
-    texts: Dict[str, str],
-    texts_portrait: Dict[str, str],
+    texts: CountryTexts,
+    texts_portrait: CountryTexts,
 ) -> bool:
     if video_id:
         if video_id not in state.per_video_claim_rows:
@@ -299,26 +377,14 @@ def process_claim_row(
             line_num = state.auto_claim_line_per_video[video_id]
             state.auto_claim_line_per_video[video_id] += 1
         state.per_video_claim_rows[video_id].append(
-            {
-                "line": line_num,
-                "start": start_tc,
-                "end": end_tc,
-                "texts": texts,
-                "texts_portrait": texts_portrait,
-            }
+            TimedTextRow(line_num, start_tc, end_tc, texts, texts_portrait)
         )
     else:
         if line_num is None:
             line_num = state.auto_claim_line
             state.auto_claim_line += 1
         state.claims_rows.append(
-            {
-                "line": line_num,
-                "start": start_tc,
-                "end": end_tc,
-                "texts": texts,
-                "texts_portrait": texts_portrait,
-            }
+            TimedTextRow(line_num, start_tc, end_tc, texts, texts_portrait)
         )
     return True
 
@@ -330,8 +396,8 @@ def process_disclaimer_row(
     line_num: Optional[int],
     start_tc: Optional[float],
     end_tc: Optional[float],
-    texts: Dict[str, str],
-    texts_portrait: Dict[str, str],
+    texts: CountryTexts,
+    texts_portrait: CountryTexts,
     is_disclaimer_02: bool,
 ) -> bool:
     if is_disclaimer_02:
@@ -357,13 +423,7 @@ def process_disclaimer_row(
         else:
             auto_line_per_video[video_id] = line_num
         per_video_rows[video_id].append(
-            {
-                "line": line_num,
-                "start": start_tc,
-                "end": end_tc,
-                "texts": texts,
-                "texts_portrait": texts_portrait,
-            }
+            TimedTextRow(line_num, start_tc, end_tc, texts, texts_portrait)
         )
     else:
         if line_num is None and (start_tc is not None or end_tc is not None):
@@ -373,13 +433,7 @@ def process_disclaimer_row(
         else:
             auto_line = line_num
         global_rows.append(
-            {
-                "line": line_num,
-                "start": start_tc,
-                "end": end_tc,
-                "texts": texts,
-                "texts_portrait": texts_portrait,
-            }
+            TimedTextRow(line_num, start_tc, end_tc, texts, texts_portrait)
         )
 
     if is_disclaimer_02:
@@ -396,8 +450,8 @@ def process_logo_row(
     line_num: Optional[int],
     start_tc: Optional[float],
     end_tc: Optional[float],
-    texts: Dict[str, str],
-    texts_portrait: Dict[str, str],
+    texts: CountryTexts,
+    texts_portrait: CountryTexts,
 ) -> bool:
     if video_id:
         if video_id not in state.per_video_logo_rows_raw:
@@ -411,13 +465,7 @@ def process_logo_row(
         else:
             state.auto_logo_line_per_video[video_id] = line_num
         state.per_video_logo_rows_raw[video_id].append(
-            {
-                "line": line_num,
-                "start": start_tc,
-                "end": end_tc,
-                "texts": texts,
-                "texts_portrait": texts_portrait,
-            }
+            TimedTextRow(line_num, start_tc, end_tc, texts, texts_portrait)
         )
     else:
         if line_num is None and (start_tc is not None or end_tc is not None):
@@ -427,13 +475,7 @@ def process_logo_row(
         else:
             state.auto_logo_line = line_num
         state.logo_rows_raw.append(
-            {
-                "line": line_num,
-                "start": start_tc,
-                "end": end_tc,
-                "texts": texts,
-                "texts_portrait": texts_portrait,
-            }
+            TimedTextRow(line_num, start_tc, end_tc, texts, texts_portrait)
         )
     return True
 
@@ -445,8 +487,8 @@ def process_endframe_row(
     line_num: Optional[int],
     start_tc: Optional[float],
     end_tc: Optional[float],
-    texts: Dict[str, str],
-    texts_portrait: Dict[str, str],
+    texts: CountryTexts,
+    texts_portrait: CountryTexts,
 ) -> bool:
     if video_id:
         if video_id not in state.per_video_endframe_rows_raw:
@@ -460,13 +502,7 @@ def process_endframe_row(
         else:
             state.auto_endframe_line_per_video[video_id] = line_num
         state.per_video_endframe_rows_raw[video_id].append(
-            {
-                "line": line_num,
-                "start": start_tc,
-                "end": end_tc,
-                "texts": texts,
-                "texts_portrait": texts_portrait,
-            }
+            TimedTextRow(line_num, start_tc, end_tc, texts, texts_portrait)
         )
     else:
         if line_num is None and (start_tc is not None or end_tc is not None):
@@ -476,13 +512,7 @@ def process_endframe_row(
         else:
             state.auto_endframe_line = line_num
         state.endframe_rows_raw.append(
-            {
-                "line": line_num,
-                "start": start_tc,
-                "end": end_tc,
-                "texts": texts,
-                "texts_portrait": texts_portrait,
-            }
+            TimedTextRow(line_num, start_tc, end_tc, texts, texts_portrait)
         )
     return True
 
@@ -494,8 +524,8 @@ def process_sub_row(
     line_num: Optional[int],
     start_tc: Optional[float],
     end_tc: Optional[float],
-    texts: Dict[str, str],
-    texts_portrait: Dict[str, str],
+    texts: CountryTexts,
+    texts_portrait: CountryTexts,
     start_line_index: int,
 ) -> bool:
     if not video_id:
@@ -509,13 +539,7 @@ def process_sub_row(
     else:
         state.auto_sub_line_per_video[video_id] = line_num + 1
     state.videos[video_id]["sub_rows"].append(
-        {
-            "line": line_num,
-            "start": start_tc,
-            "end": end_tc,
-            "texts": texts,
-            "texts_portrait": texts_portrait,
-        }
+        TimedTextRow(line_num, start_tc, end_tc, texts, texts_portrait)
     )
     return True
 
@@ -527,8 +551,8 @@ def process_super_a_row(
     line_num: Optional[int],
     start_tc: Optional[float],
     end_tc: Optional[float],
-    texts: Dict[str, str],
-    texts_portrait: Dict[str, str],
+    texts: CountryTexts,
+    texts_portrait: CountryTexts,
     start_line_index: int,
 ) -> bool:
     if not video_id:
@@ -542,13 +566,7 @@ def process_super_a_row(
     else:
         state.auto_super_a_line_per_video[video_id] = line_num + 1
     state.videos[video_id]["super_a_rows"].append(
-        {
-            "line": line_num,
-            "start": start_tc,
-            "end": end_tc,
-            "texts": texts,
-            "texts_portrait": texts_portrait,
-        }
+        TimedTextRow(line_num, start_tc, end_tc, texts, texts_portrait)
     )
     return True
 
@@ -560,8 +578,8 @@ def process_super_b_row(
     line_num: Optional[int],
     start_tc: Optional[float],
     end_tc: Optional[float],
-    texts: Dict[str, str],
-    texts_portrait: Dict[str, str],
+    texts: CountryTexts,
+    texts_portrait: CountryTexts,
     start_line_index: int,
 ) -> bool:
     if not video_id:
@@ -575,13 +593,7 @@ def process_super_b_row(
     else:
         state.auto_super_b_line_per_video[video_id] = line_num + 1
     state.videos[video_id]["super_b_rows"].append(
-        {
-            "line": line_num,
-            "start": start_tc,
-            "end": end_tc,
-            "texts": texts,
-            "texts_portrait": texts_portrait,
-        }
+        TimedTextRow(line_num, start_tc, end_tc, texts, texts_portrait)
     )
     return True
 
@@ -594,8 +606,8 @@ def process_controller_row(
     line_num: Optional[int],
     start_tc: Optional[float],
     end_tc: Optional[float],
-    texts: Dict[str, str],
-    texts_portrait: Dict[str, str],
+    texts: CountryTexts,
+    texts_portrait: CountryTexts,
     start_line_index: int,
 ) -> bool:
     state.controller_keys_seen.add(controller_key)
@@ -618,13 +630,7 @@ def process_controller_row(
                 line_num + 1
             )
         state.per_video_controller_rows_raw[controller_key][video_id].append(
-            {
-                "line": line_num,
-                "start": start_tc,
-                "end": end_tc,
-                "texts": texts,
-                "texts_portrait": texts_portrait,
-            }
+            TimedTextRow(line_num, start_tc, end_tc, texts, texts_portrait)
         )
     else:
         state.controller_rows_raw.setdefault(controller_key, [])
@@ -636,67 +642,46 @@ def process_controller_row(
         else:
             state.auto_controller_line_per_key[controller_key] = line_num + 1
         state.controller_rows_raw[controller_key].append(
-            {
-                "line": line_num,
-                "start": start_tc,
-                "end": end_tc,
-                "texts": texts,
-                "texts_portrait": texts_portrait,
-            }
+            TimedTextRow(line_num, start_tc, end_tc, texts, texts_portrait)
         )
     return True
 
 
-def _clone_timed_text_row(
-    row: Dict[str, Any],
-    countries: List[str],
-) -> Dict[str, Any]:
-    return {
-        "line": row["line"],
-        "start": row["start"],
-        "end": row["end"],
-        "texts": {c: row["texts"][c] for c in countries},
-        "texts_portrait": {
-            c: row.get("texts_portrait", {}).get(c, "") for c in countries
-        },
-    }
+def _append_line(cells: List[str], pos: int, extra: str) -> None:
+    cells[pos] = cells[pos] + "\n" + extra if cells[pos] else extra
 
 
 def merge_disclaimer_blocks(
-    rows_raw: List[Dict[str, Any]],
+    rows_raw: List[TimedTextRow],
     countries: List[str],
     merge_enabled: bool,
-) -> List[Dict[str, Any]]:
+) -> List[TimedTextRow]:
     if not merge_enabled:
         return rows_raw
 
-    merged: List[Dict[str, Any]] = []
-    current_block: Optional[Dict[str, Any]] = None
+    positions = _country_positions(rows_raw, countries)
+    merged: List[TimedTextRow] = []
+    current_block: Optional[TimedTextRow] = None
     for row in rows_raw:
-        if row["start"] is not None and row["end"] is not None:
+        if row.start is not None and row.end is not None:
             if current_block:
                 merged.append(current_block)
-            current_block = _clone_timed_text_row(row, countries)
+            current_block = row.copy()
             continue
 
         if not current_block:
-            current_block = _clone_timed_text_row(row, countries)
+            current_block = row.copy()
             continue
 
-        for c in countries:
-            extra = row["texts"][c]
-            if extra:
-                if current_block["texts"][c]:
-                    current_block["texts"][c] += "\n" + extra
-                else:
-                    current_block["texts"][c] = extra
-
-            extra_p = row.get("texts_portrait", {}).get(c, "")
-            if extra_p:
-                if current_block.get("texts_portrait", {}).get(c, ""):
-                    current_block["texts_portrait"][c] += "\n" + extra_p
-                else:
-                    current_block["texts_portrait"][c] = extra_p
+        block_land = current_block.texts.cells
+        block_port = current_block.texts_portrait.cells
+        row_land = row.texts.cells
+        row_port = row.texts_portrait.cells
+        for pos in positions:
+            if row_land[pos]:
+                _append_line(block_land, pos, row_land[pos])
+            if row_port[pos]:
+                _append_line(block_port, pos, row_port[pos])
 
     if current_block:
         merged.append(current_block)
@@ -704,11 +689,11 @@ def merge_disclaimer_blocks(
 
 
 def merge_disclaimer_rows_by_video(
-    per_video_rows_raw: Dict[str, List[Dict[str, Any]]],
+    per_video_rows_raw: Dict[str, List[TimedTextRow]],
     countries: List[str],
     merge_enabled: bool,
-) -> Dict[str, List[Dict[str, Any]]]:
-    result: Dict[str, List[Dict[str, Any]]] = {}
+) -> Dict[str, List[TimedTextRow]]:
+    result: Dict[str, List[TimedTextRow]] = {}
     for vid, rows_raw in per_video_rows_raw.items():
         result[vid] = merge_disclaimer_blocks(
             rows_raw=rows_raw,
@@ -719,39 +704,34 @@ def merge_disclaimer_rows_by_video(
 
 
 def merge_rows_with_same_line(
-    rows: List[Dict[str, Any]],
+    rows: List[TimedTextRow],
     countries: List[str],
     merge_enabled: bool,
-) -> List[Dict[str, Any]]:
+) -> List[TimedTextRow]:
     if not merge_enabled:
         return rows
 
-    merged: List[Dict[str, Any]] = []
-    prev: Optional[Dict[str, Any]] = None
+    positions = _country_positions(rows, countries)
+    merged: List[TimedTextRow] = []
+    prev: Optional[TimedTextRow] = None
     for row in rows:
         if (
             prev
-            and row["line"] == prev["line"]
+            and row.line == prev.line
             and (
-                (row["start"] is None and row["end"] is None)
-                or (row["start"] == prev["start"] and row["end"] == prev["end"])
+                (row.start is None and row.end is None)
+                or (row.start == prev.start and row.end == prev.end)
             )
         ):
-            for c in countries:
-                t = row["texts"][c]
-                if t:
-                    if prev["texts"][c]:
-                        prev["texts"][c] += "\n" + t
-                    else:
-                        prev["texts"][c] = t
-                t_p = row.get("texts_portrait", {}).get(c, "")
-                if t_p:
-                    if prev.get("texts_portrait", {}).get(c, ""):
-                        prev["texts_portrait"][c] += "\n" + t_p
-                    else:
-                        if "texts_portrait" not in prev:
-                            prev["texts_portrait"] = {}
-                        prev["texts_portrait"][c] = t_p
+            prev_land = prev.texts.cells
+            prev_port = prev.texts_portrait.cells
+            row_land = row.texts.cells
+            row_port = row.texts_portrait.cells
+            for pos in positions:
+                if row_land[pos]:
+                    _append_line(prev_land, pos, row_land[pos])
+                if row_port[pos]:
+                    _append_line(prev_port, pos, row_port[pos])
             continue
 
         if prev:
@@ -763,45 +743,40 @@ def merge_rows_with_same_line(
     return merged
 
 
+def _append_unique_line(cells: List[str], pos: int, extra: str) -> None:
+    existing = cells[pos]
+    if not existing:
+        cells[pos] = extra
+    elif extra not in existing.split("\n"):
+        cells[pos] = existing + "\n" + extra
+
+
 def deduplicate_rows_by_line_timing(
-    rows: List[Dict[str, Any]],
+    rows: List[TimedTextRow],
     countries: List[str],
-) -> List[Dict[str, Any]]:
-    grouped: Dict[Tuple[int, Optional[float], Optional[float]], Dict[str, Any]] = {}
-    order: List[Tuple[int, Optional[float], Optional[float]]] = []
+) -> List[TimedTextRow]:
+    positions = _country_positions(rows, countries)
+    grouped: Dict[
+        Tuple[Optional[int], Optional[float], Optional[float]], TimedTextRow
+    ] = {}
     for row in rows:
-        key = (row["line"], row["start"], row["end"])
-        if key not in grouped:
-            grouped[key] = {
-                "line": row["line"],
-                "start": row["start"],
-                "end": row["end"],
-                "texts": {c: row["texts"].get(c, "") for c in countries},
-                "texts_portrait": {
-                    c: row.get("texts_portrait", {}).get(c, "") for c in countries
-                },
-            }
-            order.append(key)
+        key = (row.line, row.start, row.end)
+        group = grouped.get(key)
+        if group is None:
+            grouped[key] = row.copy()
             continue
 
-        for c in countries:
-            extra_l = row["texts"].get(c, "")
-            if extra_l:
-                existing = grouped[key]["texts"][c]
-                if not existing:
-                    grouped[key]["texts"][c] = extra_l
-                elif extra_l not in existing.split("\n"):
-                    grouped[key]["texts"][c] += "\n" + extra_l
-
-            extra_p = row.get("texts_portrait", {}).get(c, "")
-            if extra_p:
-                existing_p = grouped[key]["texts_portrait"][c]
-                if not existing_p:
-                    grouped[key]["texts_portrait"][c] = extra_p
-                elif extra_p not in existing_p.split("\n"):
-                    grouped[key]["texts_portrait"][c] += "\n" + extra_p
+        group_land = group.texts.cells
+        group_port = group.texts_portrait.cells
+        row_land = row.texts.cells
+        row_port = row.texts_portrait.cells
+        for pos in positions:
+            if row_land[pos]:
+                _append_unique_line(group_land, pos, row_land[pos])
+            if row_port[pos]:
+                _append_unique_line(group_port, pos, row_port[pos])
 
-    return [grouped[k] for k in order]
+    return list(grouped.values())
 
 
 def merge_and_dedup_video_rows(
@@ -827,52 +802,46 @@ def merge_and_dedup_video_rows(
 
 
 def join_claim_rows_by_timing(
-    claims_rows: List[Dict[str, Any]],
+    claims_rows: List[TimedTextRow],
     countries: List[str],
-) -> List[Dict[str, Any]]:
-    grouped: Dict[Tuple[Optional[float], Optional[float]], Dict[str, Any]] = {}
+) -> List[TimedTextRow]:
+    positions = _country_positions(claims_rows, countries)
+    grouped: Dict[Tuple[Optional[float], Optional[float]], TimedTextRow] = {}
     for row in claims_rows:
         key = (
-            (row["start"], row["end"])
-            if (row["start"] is not None and row["end"] is not None)
+            (row.start, row.end)
+            if (row.start is not None and row.end is not None)
             else (None, None)
         )
-        if key not in grouped:
-            grouped[key] = {
-                "start": row["start"],
-                "end": row["end"],
-                "texts": {c: row["texts"].get(c, "") for c in countries},
-            }
+        group = grouped.get(key)
+        if group is None:
+            # Joined claims carry landscape texts only; portrait falls back to them.
+            grouped[key] = TimedTextRow(
+                None,
+                row.start,
+                row.end,
+                row.texts.copy(),
+                CountryTexts.empty(row.texts.index),
+            )
             continue
 
-        for c in countries:
-            t = row["texts"].get(c, "")
-            if t:
-                if grouped[key]["texts"][c]:
-                    grouped[key]["texts"][c] += "\n" + t
-                else:
-                    grouped[key]["texts"][c] = t
-
-    new_claims: List[Dict[str, Any]] = []
-    ln = 1
-    for _, data in grouped.items():
-        new_claims.append(
-            {
-                "line": ln,
-                "start": data["start"],
-                "end": data["end"],
-                "texts": data["texts"],
-            }
-        )
-        ln += 1
+        group_land = group.texts.cells
+        row_land = row.texts.cells
+        for pos in positions:
+            if row_land[pos]:
+                _append_line(group_land, pos, row_land[pos])
+
+    new_claims = list(grouped.values())
+    for ln, joined in enumerate(new_claims, start=1):
+        joined.line = ln
     return new_claims
 
 
 def join_claim_rows_by_timing_per_video(
-    per_video_claim_rows: Dict[str, List[Dict[str, Any]]],
+    per_video_claim_rows: Dict[str, List[TimedTextRow]],
     countries: List[str],
-) -> Dict[str, List[Dict[str, Any]]]:
-    joined: Dict[str, List[Dict[str, Any]]] = {}
+) -> Dict[str, List[TimedTextRow]]:
+    joined: Dict[str, List[TimedTextRow]] = {}
     for vid, rows_list in per_video_claim_rows.items():
         joined[vid] = join_claim_rows_by_timing(
             claims_rows=rows_list,
@@ -899,15 +868,9 @@ def _maybe_cast_metadata_value(value: Any, cast_metadata: bool) -> Any:
     return value
 
 
-def build_country_orientation_data(
+def iter_country_videos(
     *,
     country_code: str,
-    claims_rows: List[Dict[str, Any]],
-    disclaimers_rows_merged: List[Dict[str, Any]],
-    disclaimers_02_rows_merged: List[Dict[str, Any]],
-    logo_rows_raw: List[Dict[str, Any]],
-    controller_keys_sorted: List[str],
-    controller_rows_raw: Dict[str, List[Dict[str, Any]]],
     video_order: List[str],
     videos: Dict[str, Dict[str, Any]],
     global_flag_defaults_per_country: Dict[str, Dict[str, str]],
@@ -915,92 +878,33 @@ def build_country_orientation_data(
     per_video_meta_local_country: Dict[str, Dict[str, Dict[str, Any]]],
     skip_empty_text: bool,
     fmt_time: Callable[[float], Any],
-) -> Dict[str, Any]:
-    claim_landscape: List[str] = []
-    claim_portrait: List[str] = []
-    for row in claims_rows:
-        txt_l = (row["texts"].get(country_code, "") or "").rstrip()
-        txt_p = (row.get("texts_portrait", {}).get(country_code, "") or "").rstrip()
-        claim_landscape.append(txt_l)
-        claim_portrait.append(txt_p if txt_p else txt_l)
-
-    disc_landscape: List[str] = []
-    disc_portrait: List[str] = []
-    for row in disclaimers_rows_merged:
-        txt_l = (row["texts"].get(country_code, "") or "").rstrip()
-        txt_p = (row.get("texts_portrait", {}).get(country_code, "") or "").rstrip()
-        disc_landscape.append(txt_l)
-        disc_portrait.append(txt_p if txt_p else txt_l)
-    if not disc_landscape:
-        disc_landscape = [""]
-    if not disc_portrait and disc_landscape:
-        disc_portrait = disc_landscape.copy()
-
-    disc_02_landscape: List[str] = []
-    disc_02_portrait: List[str] = []
-    for row in disclaimers_02_rows_merged:
-        txt_l = (row["texts"].get(country_code, "") or "").rstrip()
-        txt_p = (row.get("texts_portrait", {}).get(country_code, "") or "").rstrip()
-        disc_02_landscape.append(txt_l)
-        disc_02_portrait.append(txt_p if txt_p else txt_l)
-    if not disc_02_landscape:
-        disc_02_landscape = [""]
-    if not disc_02_portrait and disc_02_landscape:
-        disc_02_portrait = disc_02_landscape.copy()
-
-    logo_landscape: List[str] = []
-    logo_portrait: List[str] = []
-    for row in logo_rows_raw:
-        txt_l = (row["texts"].get(country_code, "") or "").rstrip()
-        txt_p = (row.get("texts_portrait", {}).get(country_code, "") or "").rstrip()
-        logo_landscape.append(txt_l)
-        logo_portrait.append(txt_p if txt_p else txt_l)
-    if not logo_portrait and logo_landscape:
-        logo_portrait = logo_landscape.copy()
-
-    controller_top_land: Dict[str, List[str]] = {}
-    controller_top_port: Dict[str, List[str]] = {}
-    for gk in controller_keys_sorted:
-        g_land: List[str] = []
-        g_port: List[str] = []
-        for grow in controller_rows_raw.get(gk, []):
-            txt_l = (grow.get("texts", {}).get(country_code, "") or "").rstrip()
-            txt_p = (
-                grow.get("texts_portrait", {}).get(country_code, "") or ""
-            ).rstrip()
-            g_land.append(txt_l)
-            g_port.append(txt_p if txt_p else txt_l)
-        controller_top_land[gk] = g_land
-        controller_top_port[gk] = g_port
-
-    videos_list: List[Dict[str, Any]] = []
+) -> Iterator[Dict[str, Any]]:
+    """Yield the landscape and portrait video entries of each video in order."""
     for vid in video_order:
         vdata = videos[vid]
         subs_land: List[Dict[str, Any]] = []
         subs_port: List[Dict[str, Any]] = []
         for srow in vdata.get("sub_rows", []):
-            txt_l = (srow["texts"].get(country_code, "") or "").rstrip()
-            txt_p = (
-                srow.get("texts_portrait", {}).get(country_code, "") or ""
-            ).rstrip()
+            txt_l = (srow.texts.get(country_code, "") or "").rstrip()
+            txt_p = (srow.texts_portrait.get(country_code, "") or "").rstrip()
             if skip_empty_text and not txt_l:
                 continue
-            if srow["start"] is None or srow["end"] is None:
+            if srow.start is None or srow.end is None:
                 continue
             subs_land.append(
                 {
-                    "line": srow["line"],
-                    "in": fmt_time(srow["start"]),
-                    "out": fmt_time(srow["end"]),
+                    "line": srow.line,
+                    "in": fmt_time(srow.start),
+                    "out": fmt_time(srow.end),
                     "text": txt_l,
                 }
             )
             txt_port_final = txt_p if txt_p else txt_l
             subs_port.append(
                 {
-                    "line": srow["line"],
-                    "in": fmt_time(srow["start"]),
-                    "out": fmt_time(srow["end"]),
+                    "line": srow.line,
+                    "in": fmt_time(srow.start),
+                    "out": fmt_time(srow.end),
                     "text": txt_port_final,
                 }
             )
@@ -1010,55 +914,51 @@ def build_country_orientation_data(
         super_b_land: List[Dict[str, Any]] = []
         super_b_port: List[Dict[str, Any]] = []
         for sarow in vdata.get("super_a_rows", []):
-            txt_l = (sarow["texts"].get(country_code, "") or "").rstrip()
-            txt_p = (
-                sarow.get("texts_portrait", {}).get(country_code, "") or ""
-            ).rstrip()
+            txt_l = (sarow.texts.get(country_code, "") or "").rstrip()
+            txt_p = (sarow.texts_portrait.get(country_code, "") or "").rstrip()
             if skip_empty_text and not txt_l:
                 continue
-            if sarow["start"] is None or sarow["end"] is None:
+            if sarow.start is None or sarow.end is None:
                 continue
             super_a_land.append(
                 {
-                    "line": sarow["line"],
-                    "in": fmt_time(sarow["start"]),
-                    "out": fmt_time(sarow["end"]),
+                    "line": sarow.line,
+                    "in": fmt_time(sarow.start),
+                    "out": fmt_time(sarow.end),
                     "text": txt_l,
                 }
             )
             txt_port_final = txt_p if txt_p else txt_l
             super_a_port.append(
                 {
-                    "line": sarow["line"],
-                    "in": fmt_time(sarow["start"]),
-                    "out": fmt_time(sarow["end"]),
+                    "line": sarow.line,
+                    "in": fmt_time(sarow.start),
+                    "out": fmt_time(sarow.end),
                     "text": txt_port_final,
                 }
             )
 
         for sbrow in vdata.get("super_b_rows", []):
-            txt_l = (sbrow["texts"].get(country_code, "") or "").rstrip()
-            txt_p = (
-                sbrow.get("texts_portrait", {}).get(country_code, "") or ""
-            ).rstrip()
+            txt_l = (sbrow.texts.get(country_code, "") or "").rstrip()
+            txt_p = (sbrow.texts_portrait.get(country_code, "") or "").rstrip()
             if skip_empty_text and not txt_l and not txt_p:
                 continue
-            if sbrow["start"] is None or sbrow["end"] is None:
+            if sbrow.start is None or sbrow.end is None:
                 continue
             super_b_land.append(
                 {
-                    "line": sbrow["line"],
-                    "in": fmt_time(sbrow["start"]),
-                    "out": fmt_time(sbrow["end"]),
+                    "line": sbrow.line,
+                    "in": fmt_time(sbrow.start),
+                    "out": fmt_time(sbrow.end),
                     "text": txt_l,
                 }
             )
             txt_port_final_b = txt_p if txt_p else txt_l
             super_b_port.append(
                 {
-                    "line": sbrow["line"],
-                    "in": fmt_time(sbrow["start"]),
-                    "out": fmt_time(sbrow["end"]),
+                    "line": sbrow.line,
+                    "in": fmt_time(sbrow.start),
+                    "out": fmt_time(sbrow.end),
                     "text": txt_port_final_b,
                 }
             )
@@ -1087,7 +987,7 @@ def build_country_orientation_data(
         land_meta["orientation"] = "landscape"
         port_meta = base_meta.copy()
         port_meta["orientation"] = "portrait"
-        videos_list.append(
+        yield (
             {
                 "videoId": f"{vid}_landscape",
                 "metadata": land_meta,
@@ -1096,7 +996,7 @@ def build_country_orientation_data(
                 "super_B": super_b_land,
             }
         )
-        videos_list.append(
+        yield (
             {
                 "videoId": f"{vid}_portrait",
                 "metadata": port_meta,
@@ -1106,6 +1006,95 @@ def build_country_orientation_data(
             }
         )
 
+
+def build_country_orientation_data(
+    *,
+    country_code: str,
+    claims_rows: List[TimedTextRow],
+    disclaimers_rows_merged: List[TimedTextRow],
+    disclaimers_02_rows_merged: List[TimedTextRow],
+    logo_rows_raw: List[TimedTextRow],
+    controller_keys_sorted: List[str],
+    controller_rows_raw: Dict[str, List[TimedTextRow]],
+    video_order: List[str],
+    videos: Dict[str, Dict[str, Any]],
+    global_flag_defaults_per_country: Dict[str, Dict[str, str]],
+    global_flag_targeted_per_country: Dict[str, Dict[str, Dict[str, str]]],
+    per_video_meta_local_country: Dict[str, Dict[str, Dict[str, Any]]],
+    skip_empty_text: bool,
+    fmt_time: Callable[[float], Any],
+    with_videos: bool = True,
+) -> Dict[str, Any]:
+    claim_landscape: List[str] = []
+    claim_portrait: List[str] = []
+    for row in claims_rows:
+        txt_l = (row.texts.get(country_code, "") or "").rstrip()
+        txt_p = (row.texts_portrait.get(country_code, "") or "").rstrip()
+        claim_landscape.append(txt_l)
+        claim_portrait.append(txt_p if txt_p else txt_l)
+
+    disc_landscape: List[str] = []
+    disc_portrait: List[str] = []
+    for row in disclaimers_rows_merged:
+        txt_l = (row.texts.get(country_code, "") or "").rstrip()
+        txt_p = (row.texts_portrait.get(country_code, "") or "").rstrip()
+        disc_landscape.append(txt_l)
+        disc_portrait.append(txt_p if txt_p else txt_l)
+    if not disc_landscape:
+        disc_landscape = [""]
+    if not disc_portrait and disc_landscape:
+        disc_portrait = disc_landscape.copy()
+
+    disc_02_landscape: List[str] = []
+    disc_02_portrait: List[str] = []
+    for row in disclaimers_02_rows_merged:
+        txt_l = (row.texts.get(country_code, "") or "").rstrip()
+        txt_p = (row.texts_portrait.get(country_code, "") or "").rstrip()
+        disc_02_landscape.append(txt_l)
+        disc_02_portrait.append(txt_p if txt_p else txt_l)
+    if not disc_02_landscape:
+        disc_02_landscape = [""]
+    if not disc_02_portrait and disc_02_landscape:
+        disc_02_portrait = disc_02_landscape.copy()
+
+    logo_landscape: List[str] = []
+    logo_portrait: List[str] = []
+    for row in logo_rows_raw:
+        txt_l = (row.texts.get(country_code, "") or "").rstrip()
+        txt_p = (row.texts_portrait.get(country_code, "") or "").rstrip()
+        logo_landscape.append(txt_l)
+        logo_portrait.append(txt_p if txt_p else txt_l)
+    if not logo_portrait and logo_landscape:
+        logo_portrait = logo_landscape.copy()
+
+    controller_top_land: Dict[str, List[str]] = {}
+    controller_top_port: Dict[str, List[str]] = {}
+    for gk in controller_keys_sorted:
+        g_land: List[str] = []
+        g_port: List[str] = []
+        for grow in controller_rows_raw.get(gk, []):
+            txt_l = (grow.texts.get(country_code, "") or "").rstrip()
+            txt_p = (grow.texts_portrait.get(country_code, "") or "").rstrip()
+            g_land.append(txt_l)
+            g_port.append(txt_p if txt_p else txt_l)
+        controller_top_land[gk] = g_land
+        controller_top_port[gk] = g_port
+
+    videos_list: List[Dict[str, Any]] = []
+    if with_videos:
+        videos_list.extend(
+            iter_country_videos(
+                country_code=country_code,
+                video_order=video_order,
+                videos=videos,
+                global_flag_defaults_per_country=global_flag_defaults_per_country,
+                global_flag_targeted_per_country=global_flag_targeted_per_country,
+                per_video_meta_local_country=per_video_meta_local_country,
+                skip_empty_text=skip_empty_text,
+                fmt_time=fmt_time,
+            )
+        )
+
     return {
         "claim_landscape": claim_landscape,
         "claim_portrait": claim_portrait,
@@ -1121,27 +1110,27 @@ def build_country_orientation_data(
     }
 
 
-def populate_video_level_fields(
+def iter_video_level_fields(
     *,
     country_code: str,
-    videos_list: List[Dict[str, Any]],
-    claims_rows: List[Dict[str, Any]],
-    per_video_claim_rows: Dict[str, List[Dict[str, Any]]],
+    videos_list: Iterable[Dict[str, Any]],
+    claims_rows: List[TimedTextRow],
+    per_video_claim_rows: Dict[str, List[TimedTextRow]],
     claim_landscape: List[str],
     claim_portrait: List[str],
-    disclaimers_rows_merged: List[Dict[str, Any]],
-    per_video_disc_rows_raw: Dict[str, List[Dict[str, Any]]],
+    disclaimers_rows_merged: List[TimedTextRow],
+    per_video_disc_rows_raw: Dict[str, List[TimedTextRow]],
     merge_disclaimer: bool,
-    disclaimers_02_rows_merged: List[Dict[str, Any]],
-    per_video_disc_02_rows_raw: Dict[str, List[Dict[str, Any]]],
+    disclaimers_02_rows_merged: List[TimedTextRow],
+    per_video_disc_02_rows_raw: Dict[str, List[TimedTextRow]],
     merge_disclaimer_02: bool,
-    logo_rows_raw: List[Dict[str, Any]],
-    per_video_logo_rows_raw: Dict[str, List[Dict[str, Any]]],
-    endframe_rows_raw: List[Dict[str, Any]],
-    per_video_endframe_rows_raw: Dict[str, List[Dict[str, Any]]],
+    logo_rows_raw: List[TimedTextRow],
+    per_video_logo_rows_raw: Dict[str, List[TimedTextRow]],
+    endframe_rows_raw: List[TimedTextRow],
+    per_video_endframe_rows_raw: Dict[str, List[TimedTextRow]],
     controller_keys_sorted: List[str],
-    controller_rows_raw: Dict[str, List[Dict[str, Any]]],
-    per_video_controller_rows_raw: Dict[str, Dict[str, List[Dict[str, Any]]]],
+    controller_rows_raw: Dict[str, List[TimedTextRow]],
+    per_video_controller_rows_raw: Dict[str, Dict[str, List[TimedTextRow]]],
     controller_top_land: Dict[str, List[str]],
     controller_top_port: Dict[str, List[str]],
     prefer_local_claim_disclaimer: bool,
@@ -1149,16 +1138,21 @@ def populate_video_level_fields(
     claims_as_objects: bool,
     controller_always_emit: bool,
     fmt_time: Callable[[float], Any],
-) -> None:
-    def timing_key(r: Dict[str, Any]) -> Tuple[Optional[float], Optional[float]]:
-        return (r.get("start"), r.get("end"))
+) -> Iterator[Dict[str, Any]]:
+    """Fill the video-level fields of each entry and yield it once complete.
+
+    Entries are consumed lazily, so ``videos_list`` may itself be a generator.
+    """
+
+    def timing_key(r: TimedTextRow) -> Tuple[Optional[float], Optional[float]]:
+        return (r.start, r.end)
 
     global_claim_map_land = {
-        timing_key(r): (r["texts"].get(country_code, "") or "").strip()
+        timing_key(r): (r.texts.get(country_code, "") or "").strip()
         for r in claims_rows
     }
     global_claim_map_port = {
-        timing_key(r): (r.get("texts_portrait", {}).get(country_code, "") or "").strip()
+        timing_key(r): (r.texts_portrait.get(country_code, "") or "").strip()
         for r in claims_rows
     }
     global_controller_map_land: Dict[
@@ -1169,45 +1163,40 @@ def populate_video_level_fields(
     ] = {}
     for gk in controller_keys_sorted:
         global_controller_map_land[gk] = {
-            timing_key(r): (r.get("texts", {}).get(country_code, "") or "").strip()
+            timing_key(r): (r.texts.get(country_code, "") or "").strip()
             for r in controller_rows_raw.get(gk, [])
         }
         global_controller_map_port[gk] = {
-            timing_key(r): (
-                r.get("texts_portrait", {}).get(country_code, "") or ""
-            ).strip()
+            timing_key(r): (r.texts_portrait.get(country_code, "") or "").strip()
             for r in controller_rows_raw.get(gk, [])
         }
 
     global_disc_land = [
-        (r.get("texts", {}).get(country_code, "") or "").rstrip()
-        for r in disclaimers_rows_merged
+        (r.texts.get(country_code, "") or "").rstrip() for r in disclaimers_rows_merged
     ]
     global_disc_port = [
-        (r.get("texts_portrait", {}).get(country_code, "") or "").rstrip()
+        (r.texts_portrait.get(country_code, "") or "").rstrip()
         for r in disclaimers_rows_merged
     ]
     global_disc_02_land = [
-        (r.get("texts", {}).get(country_code, "") or "").rstrip()
+        (r.texts.get(country_code, "") or "").rstrip()
         for r in disclaimers_02_rows_merged
     ]
     global_disc_02_port = [
-        (r.get("texts_portrait", {}).get(country_code, "") or "").rstrip()
+        (r.texts_portrait.get(country_code, "") or "").rstrip()
         for r in disclaimers_02_rows_merged
     ]
     global_logo_land = [
-        (r.get("texts", {}).get(country_code, "") or "").strip() for r in logo_rows_raw
+        (r.texts.get(country_code, "") or "").strip() for r in logo_rows_raw
     ]
     global_logo_port = [
-        (r.get("texts_portrait", {}).get(country_code, "") or "").strip()
-        for r in logo_rows_raw
+        (r.texts_portrait.get(country_code, "") or "").strip() for r in logo_rows_raw
     ]
     global_endframe_land = [
-        (r.get("texts", {}).get(country_code, "") or "").strip()
-        for r in endframe_rows_raw
+        (r.texts.get(country_code, "") or "").strip() for r in endframe_rows_raw
     ]
     global_endframe_port = [
-        (r.get("texts_portrait", {}).get(country_code, "") or "").strip()
+        (r.texts_portrait.get(country_code, "") or "").strip()
         for r in endframe_rows_raw
     ]
 
@@ -1248,11 +1237,9 @@ def populate_video_level_fields(
         )
         for idx, row in enumerate(src_claims):
             txt_local = (
-                (
-                    row.get("texts_portrait", {})
-                    if orientation == "portrait"
-                    else row.get("texts", {})
-                ).get(country_code, "")
+                (row.texts_portrait if orientation == "portrait" else row.texts).get(
+                    country_code, ""
+                )
                 or ""
             ).rstrip()
             if (
@@ -1260,9 +1247,7 @@ def populate_video_level_fields(
                 and prefer_local_claim_disclaimer
                 and not txt_local
             ):
-                alt_land_local = (
-                    row.get("texts", {}).get(country_code, "") or ""
-                ).rstrip()
+                alt_land_local = (row.texts.get(country_code, "") or "").rstrip()
                 if alt_land_local:
                     txt_local = alt_land_local
             txt_global_timing = global_claim_map.get(timing_key(row), "")
@@ -1278,12 +1263,12 @@ def populate_video_level_fields(
             if test_mode and text_value:
                 text_value = f"{vid_full}_{text_value}"
             entry: Dict[str, Any] = {
-                "line": row.get("line", idx + 1),
+                "line": row.line,
                 "text": text_value,
             }
-            if row.get("start") is not None and row.get("end") is not None:
-                entry["in"] = fmt_time(row["start"])
-                entry["out"] = fmt_time(row["end"])
+            if row.start is not None and row.end is not None:
+                entry["in"] = fmt_time(row.start)
+                entry["out"] = fmt_time(row.end)
             claim_items.append(entry)
         if len(claim_items) == 1:
             base = claim_items[0]
@@ -1314,19 +1299,15 @@ def populate_video_level_fields(
         disc_items: List[Dict[str, Any]] = []
         for i, row in enumerate(src_discs):
             if orientation == "portrait":
-                txt_local = (
-                    row.get("texts_portrait", {}).get(country_code, "") or ""
-                ).rstrip()
+                txt_local = (row.texts_portrait.get(country_code, "") or "").rstrip()
             else:
-                txt_local = (row.get("texts", {}).get(country_code, "") or "").rstrip()
+                txt_local = (row.texts.get(country_code, "") or "").rstrip()
             if (
                 orientation == "portrait"
                 and prefer_local_claim_disclaimer
                 and not txt_local
             ):
-                alt_land_local = (
-                    row.get("texts", {}).get(country_code, "") or ""
-                ).rstrip()
+                alt_land_local = (row.texts.get(country_code, "") or "").rstrip()
                 if alt_land_local:
                     txt_local = alt_land_local
             txt_global = (
@@ -1344,10 +1325,10 @@ def populate_video_level_fields(
             )
             if test_mode and text_value:
                 text_value = f"{vid_full}_{text_value}"
-            entry = {"line": row.get("line", i + 1), "text": text_value}
-            if row.get("start") is not None and row.get("end") is not None:
-                entry["in"] = fmt_time(row["start"])
-                entry["out"] = fmt_time(row["end"])
+            entry = {"line": row.line, "text": text_value}
+            if row.start is not None and row.end is not None:
+                entry["in"] = fmt_time(row.start)
+                entry["out"] = fmt_time(row.end)
             else:
                 entry["in"] = None
                 entry["out"] = None
@@ -1360,19 +1341,15 @@ def populate_video_level_fields(
         disc_02_items: List[Dict[str, Any]] = []
         for i, row in enumerate(src_discs_02):
             if orientation == "portrait":
-                txt_local = (
-                    row.get("texts_portrait", {}).get(country_code, "") or ""
-                ).rstrip()
+                txt_local = (row.texts_portrait.get(country_code, "") or "").rstrip()
             else:
-                txt_local = (row.get("texts", {}).get(country_code, "") or "").rstrip()
+                txt_local = (row.texts.get(country_code, "") or "").rstrip()
             if (
                 orientation == "portrait"
                 and prefer_local_claim_disclaimer
                 and not txt_local
             ):
-                alt_land_local = (
-                    row.get("texts", {}).get(country_code, "") or ""
-                ).rstrip()
+                alt_land_local = (row.texts.get(country_code, "") or "").rstrip()
                 if alt_land_local:
                     txt_local = alt_land_local
             txt_global = (
@@ -1390,10 +1367,10 @@ def populate_video_level_fields(
             )
             if test_mode and text_value:
                 text_value = f"{vid_full}_{text_value}"
-            entry = {"line": row.get("line", i + 1), "text": text_value}
-            if row.get("start") is not None and row.get("end") is not None:
-                entry["in"] = fmt_time(row["start"])
-                entry["out"] = fmt_time(row["end"])
+            entry = {"line": row.line, "text": text_value}
+            if row.start is not None and row.end is not None:
+                entry["in"] = fmt_time(row.start)
+                entry["out"] = fmt_time(row.end)
             else:
                 entry["in"] = None
                 entry["out"] = None
@@ -1404,19 +1381,15 @@ def populate_video_level_fields(
         logo_items: List[Dict[str, Any]] = []
         for i, row in enumerate(src_logos):
             if orientation == "portrait":
-                txt_local = (
-                    row.get("texts_portrait", {}).get(country_code, "") or ""
-                ).rstrip()
+                txt_local = (row.texts_portrait.get(country_code, "") or "").rstrip()
             else:
-                txt_local = (row.get("texts", {}).get(country_code, "") or "").rstrip()
+                txt_local = (row.texts.get(country_code, "") or "").rstrip()
             if (
                 orientation == "portrait"
                 and prefer_local_claim_disclaimer
                 and not txt_local
             ):
-                alt_land_local = (
-                    row.get("texts", {}).get(country_code, "") or ""
-                ).rstrip()
+                alt_land_local = (row.texts.get(country_code, "") or "").rstrip()
                 if alt_land_local:
                     txt_local = alt_land_local
             txt_global = (
@@ -1434,10 +1407,10 @@ def populate_video_level_fields(
             )
             if test_mode and text_value:
                 text_value = f"{vid_full}_{text_value}"
-            entry = {"line": row.get("line", i + 1), "text": text_value}
-            if row.get("start") is not None and row.get("end") is not None:
-                entry["in"] = fmt_time(row["start"])
-                entry["out"] = fmt_time(row["end"])
+            entry = {"line": row.line, "text": text_value}
+            if row.start is not None and row.end is not None:
+                entry["in"] = fmt_time(row.start)
+                entry["out"] = fmt_time(row.end)
             else:
                 entry["in"] = None
                 entry["out"] = None
@@ -1448,19 +1421,15 @@ def populate_video_level_fields(
         end_items: List[Dict[str, Any]] = []
         for i, row in enumerate(src_end):
             if orientation == "portrait":
-                txt_local = (
-                    row.get("texts_portrait", {}).get(country_code, "") or ""
-                ).rstrip()
+                txt_local = (row.texts_portrait.get(country_code, "") or "").rstrip()
             else:
-                txt_local = (row.get("texts", {}).get(country_code, "") or "").rstrip()
+                txt_local = (row.texts.get(country_code, "") or "").rstrip()
             if (
                 orientation == "portrait"
                 and prefer_local_claim_disclaimer
                 and not txt_local
             ):
-                alt_land_local = (
-                    row.get("texts", {}).get(country_code, "") or ""
-                ).rstrip()
+                alt_land_local = (row.texts.get(country_code, "") or "").rstrip()
                 if alt_land_local:
                     txt_local = alt_land_local
             txt_global = (
@@ -1499,10 +1468,10 @@ def populate_video_level_fields(
             )
             if test_mode and text_value:
                 text_value = f"{vid_full}_{text_value}"
-            entry = {"line": row.get("line", i + 1), "text": text_value}
-            if row.get("start") is not None and row.get("end") is not None:
-                entry["in"] = fmt_time(row["start"])
-                entry["out"] = fmt_time(row["end"])
+            entry = {"line": row.line, "text": text_value}
+            if row.start is not None and row.end is not None:
+                entry["in"] = fmt_time(row.start)
+                entry["out"] = fmt_time(row.end)
             else:
                 entry["in"] = None
                 entry["out"] = None
@@ -1532,9 +1501,7 @@ def populate_video_level_fields(
             for idx, grow in enumerate(src_controller):
                 txt_local = (
                     (
-                        grow.get("texts_portrait", {})
-                        if orientation == "portrait"
-                        else grow.get("texts", {})
+                        grow.texts_portrait if orientation == "portrait" else grow.texts
                     ).get(country_code, "")
                     or ""
                 ).rstrip()
@@ -1543,9 +1510,7 @@ def populate_video_level_fields(
                     and prefer_local_claim_disclaimer
                     and not txt_local
                 ):
-                    alt_land_local = (
-                        grow.get("texts", {}).get(country_code, "") or ""
-                    ).rstrip()
+                    alt_land_local = (grow.texts.get(country_code, "") or "").rstrip()
                     if alt_land_local:
                         txt_local = alt_land_local
                 txt_global_timing = global_controller_map.get(timing_key(grow), "")
@@ -1561,12 +1526,54 @@ def populate_video_level_fields(
                 )
                 if test_mode and text_value:
                     text_value = f"{vid_full}_{text_value}"
-                entry = {"line": grow.get("line", idx + 1), "text": text_value}
-                if grow.get("start") is not None and grow.get("end") is not None:
-                    entry["in"] = fmt_time(grow["start"])
-                    entry["out"] = fmt_time(grow["end"])
+                entry = {"line": grow.line, "text": text_value}
+                if grow.start is not None and grow.end is not None:
+                    entry["in"] = fmt_time(grow.start)
+                    entry["out"] = fmt_time(grow.end)
                 controller_items.append(entry)
             vobj[gk] = controller_items
+        yield vobj
+
+
+def populate_video_level_fields(**kwargs: Any) -> None:
+    """Fill video-level fields in place; see ``iter_video_level_fields``."""
+    for _ in iter_video_level_fields(**kwargs):
+        pass
+
+
+def _cast_video_entry(
+    vobj: Dict[str, Any],
+    *,
+    controller_keys_sorted: List[str],
+    cast_metadata: bool,
+    claims_as_objects: bool,
+) -> Dict[str, Any]:
+    meta_cast = {
+        k: _maybe_cast_metadata_value(v, cast_metadata)
+        for k, v in vobj["metadata"].items()
+    }
+    base = {
+        "videoId": vobj["videoId"],
+        "metadata": meta_cast,
+        "subtitles": vobj["subtitles"],
+        "super_A": vobj.get("super_A", []),
+        "super_B": vobj.get("super_B", []),
+        "claim": vobj.get("claim", []),
+        "disclaimer": vobj.get("disclaimer", []),
+        "disclaimer_02": vobj.get("disclaimer_02", []),
+        "logo": vobj.get("logo", []),
+        "endFrame": vobj.get("endFrame", []),
+    }
+    for gk in controller_keys_sorted:
+        base[gk] = vobj.get(gk, [])
+    if claims_as_objects:
+        for k, val in vobj.items():
+            if isinstance(k, str) and k.startswith("claim_"):
+                base[k] = val
+        base.pop("claim", None)
+    else:
+        base["claim"] = vobj.get("claim", [])
+    return base
 
 
 def build_country_payload(
@@ -1577,7 +1584,7 @@ def build_country_payload(
     global_flag_targeted_per_country: Dict[str, Dict[str, Dict[str, str]]],
     job_number_per_country: Dict[str, str],
     language_per_country: Dict[str, str],
-    videos_list: List[Dict[str, Any]],
+    videos_list: Iterable[Dict[str, Any]],
     controller_keys_sorted: List[str],
     controller_top_land: Dict[str, List[str]],
     controller_top_port: Dict[str, List[str]],
@@ -1635,34 +1642,18 @@ def build_country_payload(
     gm_cast["language"] = language_per_country.get(country_code, "")
     gm_cast.pop("orientation", None)
 
-    vlist_cast: List[Dict[str, Any]] = []
-    for vobj in videos_list:
-        meta_cast = {
-            k: _maybe_cast_metadata_value(v, cast_metadata)
-            for k, v in vobj["metadata"].items()
-        }
-        base = {
-            "videoId": vobj["videoId"],
-            "metadata": meta_cast,
-            "subtitles": vobj["subtitles"],
-            "super_A": vobj.get("super_A", []),
-            "super_B": vobj.get("super_B", []),
-            "claim": vobj.get("claim", []),
-            "disclaimer": vobj.get("disclaimer", []),
-            "disclaimer_02": vobj.get("disclaimer_02", []),
-            "logo": vobj.get("logo", []),
-            "endFrame": vobj.get("endFrame", []),
-        }
-        for gk in controller_keys_sorted:
-            base[gk] = vobj.get(gk, [])
-        if claims_as_objects:
-            for k, val in vobj.items():
-                if isinstance(k, str) and k.startswith("claim_"):
-                    base[k] = val
-            base.pop("claim", None)
-        else:
-            base["claim"] = vobj.get("claim", [])
-        vlist_cast.append(base)
+    # A generator ``videos_list`` (streamed split writes) stays a generator.
+    vlist_cast: Any = (
+        _cast_video_entry(
+            vobj,
+            controller_keys_sorted=controller_keys_sorted,
+            cast_metadata=cast_metadata,
+            claims_as_objects=claims_as_objects,
+        )
+        for vobj in videos_list
+    )
+    if isinstance(videos_list, list):
+        vlist_cast = list(vlist_cast)
 
     if "schemaVersion" not in gm_cast:
         gm_cast["schemaVersion"] = schema_version
@@ -1704,16 +1695,166 @@ def build_country_payload(
     return payload
 
 
+def build_country_payload_from_state(
+    c: str,
+    *,
+    controller_keys_sorted: List[str],
+    claims_rows: List[TimedTextRow],
+    disclaimers_rows_merged: List[TimedTextRow],
+    disclaimers_02_rows_merged: List[TimedTextRow],
+    logo_rows_raw: List[TimedTextRow],
+    controller_rows_raw: Dict[str, List[TimedTextRow]],
+    video_order: List[str],
+    videos: Dict[str, Dict[str, Any]],
+    global_flag_defaults_per_country: Dict[str, Dict[str, str]],
+    global_flag_targeted_per_country: Dict[str, Dict[str, Dict[str, str]]],
+    per_video_meta_local_country: Dict[str, Dict[str, Dict[str, Any]]],
+    skip_empty_text: bool,
+    fmt_time: Callable[[float], Any],
+    per_video_claim_rows: Dict[str, List[TimedTextRow]],
+    per_video_disc_rows_raw: Dict[str, List[TimedTextRow]],
+    merge_disclaimer: bool,
+    per_video_disc_02_rows_raw: Dict[str, List[TimedTextRow]],
+    merge_disclaimer_02: bool,
+    per_video_logo_rows_raw: Dict[str, List[TimedTextRow]],
+    endframe_rows_raw: List[TimedTextRow],
+    per_video_endframe_rows_raw: Dict[str, List[TimedTextRow]],
+    per_video_controller_rows_raw: Dict[str, Dict[str, List[TimedTextRow]]],
+    prefer_local_claim_disclaimer: bool,
+    test_mode: bool,
+    claims_as_objects: bool,
+    controller_always_emit: bool,
+    global_meta: Dict[str, Any],
+    job_number_per_country: Dict[str, str],
+    language_per_country: Dict[str, str],
+    cast_metadata: bool,
+    flags_overview_object_always: bool,
+    schema_version: str,
+    no_orientation: bool,
+    payload_interner: Optional[PayloadInterner] = None,
+    stream_videos: bool = False,
+) -> Dict[str, Any]:
+    """Build one country's payload from the merged unified state.
+
+    Module-level (not a closure) so a ``functools.partial`` over it can be
+    pickled and sent to ``--jobs`` worker processes. With ``stream_videos``
+    the payload's ``videos`` is a one-shot generator: each entry is built,
+    filled and cast only when a streaming writer reaches it.
+    """
+    country_data = build_country_orientation_data(
+        country_code=c,
+        claims_rows=claims_rows,
+        disclaimers_rows_merged=disclaimers_rows_merged,
+        disclaimers_02_rows_merged=disclaimers_02_rows_merged,
+        logo_rows_raw=logo_rows_raw,
+        controller_keys_sorted=controller_keys_sorted,
+        controller_rows_raw=controller_rows_raw,
+        video_order=video_order,
+        videos=videos,
+        global_flag_defaults_per_country=global_flag_defaults_per_country,
+        global_flag_targeted_per_country=global_flag_targeted_per_country,
+        per_video_meta_local_country=per_video_meta_local_country,
+        skip_empty_text=skip_empty_text,
+        fmt_time=fmt_time,
+        with_videos=not stream_videos,
+    )
+    claim_landscape = country_data["claim_landscape"]
+    claim_portrait = country_data["claim_portrait"]
+    disc_landscape = country_data["disc_landscape"]
+    disc_portrait = country_data["disc_portrait"]
+    disc_02_landscape = country_data["disc_02_landscape"]
+    disc_02_portrait = country_data["disc_02_portrait"]
+    logo_landscape = country_data["logo_landscape"]
+    logo_portrait = country_data["logo_portrait"]
+    controller_top_land = country_data["controller_top_land"]
+    controller_top_port = country_data["controller_top_port"]
+    videos_list: Iterable[Dict[str, Any]] = country_data["videos_list"]
+    if stream_videos:
+        videos_list = iter_country_videos(
+            country_code=c,
+            video_order=video_order,
+            videos=videos,
+            global_flag_defaults_per_country=global_flag_defaults_per_country,
+            global_flag_targeted_per_country=global_flag_targeted_per_country,
+            per_video_meta_local_country=per_video_meta_local_country,
+            skip_empty_text=skip_empty_text,
+            fmt_time=fmt_time,
+        )
+
+    populated_videos = iter_video_level_fields(
+        country_code=c,
+        videos_list=videos_list,
+        claims_rows=claims_rows,
+        per_video_claim_rows=per_video_claim_rows,
+        claim_landscape=claim_landscape,
+        claim_portrait=claim_portrait,
+        disclaimers_rows_merged=disclaimers_rows_merged,
+        per_video_disc_rows_raw=per_video_disc_rows_raw,
+        merge_disclaimer=merge_disclaimer,
+        disclaimers_02_rows_merged=disclaimers_02_rows_merged,
+        per_video_disc_02_rows_raw=per_video_disc_02_rows_raw,
+        merge_disclaimer_02=merge_disclaimer_02,
+        logo_rows_raw=logo_rows_raw,
+        per_video_logo_rows_raw=per_video_logo_rows_raw,
+        endframe_rows_raw=endframe_rows_raw,
+        per_video_endframe_rows_raw=per_video_endframe_rows_raw,
+        controller_keys_sorted=controller_keys_sorted,
+        controller_rows_raw=controller_rows_raw,
+        per_video_controller_rows_raw=per_video_controller_rows_raw,
+        controller_top_land=controller_top_land,
+        controller_top_port=controller_top_port,
+        prefer_local_claim_disclaimer=prefer_local_claim_disclaimer,
+        test_mode=test_mode,
+        claims_as_objects=claims_as_objects,
+        controller_always_emit=controller_always_emit,
+        fmt_time=fmt_time,
+    )
+    if stream_videos:
+        videos_list = populated_videos
+    else:
+        for _ in populated_videos:
+            pass
+
+    payload = build_country_payload(
+        country_code=c,
+        global_meta=global_meta,
+        global_flag_defaults_per_country=global_flag_defaults_per_country,
+        global_flag_targeted_per_country=global_flag_targeted_per_country,
+        job_number_per_country=job_number_per_country,
+        language_per_country=language_per_country,
+        videos_list=videos_list,
+        controller_keys_sorted=controller_keys_sorted,
+        controller_top_land=controller_top_land,
+        controller_top_port=controller_top_port,
+        claim_landscape=claim_landscape,
+        claim_portrait=claim_portrait,
+        disc_landscape=disc_landscape,
+        disc_portrait=disc_portrait,
+        disc_02_landscape=disc_02_landscape,
+        disc_02_portrait=disc_02_portrait,
+        logo_landscape=logo_landscape,
+        logo_portrait=logo_portrait,
+        cast_metadata=cast_metadata,
+        claims_as_objects=claims_as_objects,
+        flags_overview_object_always=flags_overview_object_always,
+        schema_version=schema_version,
+        no_orientation=no_orientation,
+    )
+    if payload_interner is not None:
+        payload = share_country_payload(payload, payload_interner)
+    return payload
+
+
 def build_unified_multi_country_output(
     *,
     countries: List[str],
     country_variant_counts: Dict[str, int],
     controller_keys_seen: set[str],
-    claims_rows: List[Dict[str, Any]],
-    disclaimers_rows_merged: List[Dict[str, Any]],
-    disclaimers_02_rows_merged: List[Dict[str, Any]],
-    logo_rows_raw: List[Dict[str, Any]],
-    controller_rows_raw: Dict[str, List[Dict[str, Any]]],
+    claims_rows: List[TimedTextRow],
+    disclaimers_rows_merged: List[TimedTextRow],
+    disclaimers_02_rows_merged: List[TimedTextRow],
+    logo_rows_raw: List[TimedTextRow],
+    controller_rows_raw: Dict[str, List[TimedTextRow]],
     video_order: List[str],
     videos: Dict[str, Dict[str, Any]],
     global_flag_defaults_per_country: Dict[str, Dict[str, str]],
@@ -1721,15 +1862,15 @@ def build_unified_multi_country_output(
     per_video_meta_local_country: Dict[str, Dict[str, Dict[str, Any]]],
     skip_empty_text: bool,
     fmt_time: Callable[[float], Any],
-    per_video_claim_rows: Dict[str, List[Dict[str, Any]]],
-    per_video_disc_rows_raw: Dict[str, List[Dict[str, Any]]],
+    per_video_claim_rows: Dict[str, List[TimedTextRow]],
+    per_video_disc_rows_raw: Dict[str, List[TimedTextRow]],
     merge_disclaimer: bool,
-    per_video_disc_02_rows_raw: Dict[str, List[Dict[str, Any]]],
+    per_video_disc_02_rows_raw: Dict[str, List[TimedTextRow]],
     merge_disclaimer_02: bool,
-    per_video_logo_rows_raw: Dict[str, List[Dict[str, Any]]],
-    endframe_rows_raw: List[Dict[str, Any]],
-    per_video_endframe_rows_raw: Dict[str, List[Dict[str, Any]]],
-    per_video_controller_rows_raw: Dict[str, Dict[str, List[Dict[str, Any]]]],
+    per_video_logo_rows_raw: Dict[str, List[TimedTextRow]],
+    endframe_rows_raw: List[TimedTextRow],
+    per_video_endframe_rows_raw: Dict[str, List[TimedTextRow]],
+    per_video_controller_rows_raw: Dict[str, Dict[str, List[TimedTextRow]]],
     prefer_local_claim_disclaimer: bool,
     test_mode: bool,
     claims_as_objects: bool,
@@ -1741,6 +1882,8 @@ def build_unified_multi_country_output(
     flags_overview_object_always: bool,
     schema_version: str,
     no_orientation: bool,
+    payload_interner: Optional[PayloadInterner] = None,
+    instrumentation: Optional[Instrumentation] = None,
 ) -> Dict[str, Any]:
     def _controller_sort_key(key_name: str) -> int:
         match = re.search(r"(\d+)$", key_name)
@@ -1753,90 +1896,58 @@ def build_unified_multi_country_output(
         key=_controller_sort_key,
     )
 
-    by_country: Dict[str, Any] = {}
-    for c in countries:
-        country_data = build_country_orientation_data(
-            country_code=c,
-            claims_rows=claims_rows,
-            disclaimers_rows_merged=disclaimers_rows_merged,
-            disclaimers_02_rows_merged=disclaimers_02_rows_merged,
-            logo_rows_raw=logo_rows_raw,
-            controller_keys_sorted=controller_keys_sorted,
-            controller_rows_raw=controller_rows_raw,
-            video_order=video_order,
-            videos=videos,
-            global_flag_defaults_per_country=global_flag_defaults_per_country,
-            global_flag_targeted_per_country=global_flag_targeted_per_country,
-            per_video_meta_local_country=per_video_meta_local_country,
-            skip_empty_text=skip_empty_text,
-            fmt_time=fmt_time,
-        )
-        claim_landscape = country_data["claim_landscape"]
-        claim_portrait = country_data["claim_portrait"]
-        disc_landscape = country_data["disc_landscape"]
-        disc_portrait = country_data["disc_portrait"]
-        disc_02_landscape = country_data["disc_02_landscape"]
-        disc_02_portrait = country_data["disc_02_portrait"]
-        logo_landscape = country_data["logo_landscape"]
-        logo_portrait = country_data["logo_portrait"]
-        controller_top_land = country_data["controller_top_land"]
-        controller_top_port = country_data["controller_top_port"]
-        videos_list = country_data["videos_list"]
-
-        populate_video_level_fields(
-            country_code=c,
-            videos_list=videos_list,
-            claims_rows=claims_rows,
-            per_video_claim_rows=per_video_claim_rows,
-            claim_landscape=claim_landscape,
-            claim_portrait=claim_portrait,
-            disclaimers_rows_merged=disclaimers_rows_merged,
-            per_video_disc_rows_raw=per_video_disc_rows_raw,
-            merge_disclaimer=merge_disclaimer,
-            disclaimers_02_rows_merged=disclaimers_02_rows_merged,
-            per_video_disc_02_rows_raw=per_video_disc_02_rows_raw,
-            merge_disclaimer_02=merge_disclaimer_02,
-            logo_rows_raw=logo_rows_raw,
-            per_video_logo_rows_raw=per_video_logo_rows_raw,
-            endframe_rows_raw=endframe_rows_raw,
-            per_video_endframe_rows_raw=per_video_endframe_rows_raw,
-            controller_keys_sorted=controller_keys_sorted,
-            controller_rows_raw=controller_rows_raw,
-            per_video_controller_rows_raw=per_video_controller_rows_raw,
-            controller_top_land=controller_top_land,
-            controller_top_port=controller_top_port,
-            prefer_local_claim_disclaimer=prefer_local_claim_disclaimer,
-            test_mode=test_mode,
-            claims_as_objects=claims_as_objects,
-            controller_always_emit=controller_always_emit,
-            fmt_time=fmt_time,
-        )
+    builder = functools.partial(
+        build_country_payload_from_state,
+        controller_keys_sorted=controller_keys_sorted,
+        claims_rows=claims_rows,
+        disclaimers_rows_merged=disclaimers_rows_merged,
+        disclaimers_02_rows_merged=disclaimers_02_rows_merged,
+        logo_rows_raw=logo_rows_raw,
+        controller_rows_raw=controller_rows_raw,
+        video_order=video_order,
+        videos=videos,
+        global_flag_defaults_per_country=global_flag_defaults_per_country,
+        global_flag_targeted_per_country=global_flag_targeted_per_country,
+        per_video_meta_local_country=per_video_meta_local_country,
+        skip_empty_text=skip_empty_text,
+        fmt_time=fmt_time,
+        per_video_claim_rows=per_video_claim_rows,
+        per_video_disc_rows_raw=per_video_disc_rows_raw,
+        merge_disclaimer=merge_disclaimer,
+        per_video_disc_02_rows_raw=per_video_disc_02_rows_raw,
+        merge_disclaimer_02=merge_disclaimer_02,
+        per_video_logo_rows_raw=per_video_logo_rows_raw,
+        endframe_rows_raw=endframe_rows_raw,
+        per_video_endframe_rows_raw=per_video_endframe_rows_raw,
+        per_video_controller_rows_raw=per_video_controller_rows_raw,
+        prefer_local_claim_disclaimer=prefer_local_claim_disclaimer,
+        test_mode=test_mode,
+        claims_as_objects=claims_as_objects,
+        controller_always_emit=controller_always_emit,
+        global_meta=global_meta,
+        job_number_per_country=job_number_per_country,
+        language_per_country=language_per_country,
+        cast_metadata=cast_metadata,
+        flags_overview_object_always=flags_overview_object_always,
+        schema_version=schema_version,
+        no_orientation=no_orientation,
+        payload_interner=payload_interner,
+    )
 
-        by_country[c] = build_country_payload(
-            country_code=c,
-            global_meta=global_meta,
-            global_flag_defaults_per_country=global_flag_defaults_per_country,
-            global_flag_targeted_per_country=global_flag_targeted_per_country,
-            job_number_per_country=job_number_per_country,
-            language_per_country=language_per_country,
-            videos_list=videos_list,
-            controller_keys_sorted=controller_keys_sorted,
-            controller_top_land=controller_top_land,
-            controller_top_port=controller_top_port,
-            claim_landscape=claim_landscape,
-            claim_portrait=claim_portrait,
-            disc_landscape=disc_landscape,
-            disc_portrait=disc_portrait,
-            disc_02_landscape=disc_02_landscape,
-            disc_02_portrait=disc_02_portrait,
-            logo_landscape=logo_landscape,
-            logo_portrait=logo_portrait,
-            cast_metadata=cast_metadata,
-            claims_as_objects=claims_as_objects,
-            flags_overview_object_always=flags_overview_object_always,
-            schema_version=schema_version,
-            no_orientation=no_orientation,
-        )
+    # Shared payloads must be materialized to be interned.
+    stream_builder = (
+        functools.partial(builder, stream_videos=True)
+        if payload_interner is None
+        else None
+    )
+    if instrumentation is not None and instrumentation.enabled:
+        builder = timed_country_builder(builder, instrumentation)
+        if stream_builder is not None:
+            stream_builder = timed_country_builder(stream_builder, instrumentation)
+
+    # Payloads are built on first access, so selecting one country only pays
+    # for that country.
+    by_country = LazyCountryPayloads(countries, builder, stream_builder=stream_builder)
 
     return {
         "_multi": True,
@@ -0,0 +1,277 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from operator import itemgetter
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from .unified_processors import CountryTexts
+
+# Optional unified-schema columns, in the order they appear in UnifiedRow.
+_OPTIONAL_FIELDS = (
+    "video_id",
+    "line",
+    "start",
+    "end",
+    "key",
+    "target_duration",
+    "country_scope",
+    "metadata",
+)
+
+
+class UnifiedRow(NamedTuple):
+    """Compact per-row record extracted by ``UnifiedRowPlan.extract``."""
+
+    record_type: str
+    video_id: str
+    line_num: Optional[int]
+    start_tc: Optional[float]
+    end_tc: Optional[float]
+    key_name: str
+    target_duration: str
+    country_scope_raw: str
+    country_scope: str
+    metadata: str
+    cells: List[str]
+
+
+@dataclass(frozen=True)
+class CountryTextPlan:
+    """Fixed landscape/portrait column indices for one country variant."""
+
+    countries: Tuple[str, ...]
+    landscape_cols: Tuple[Optional[int], ...]
+    portrait_cols: Tuple[Optional[int], ...]
+    # Shared by every CountryTexts this plan produces.
+    _index: Dict[str, int] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self, "_index", {c: pos for pos, c in enumerate(self.countries)}
+        )
+
+    def orientation_cols(self) -> Dict[str, Dict[str, Optional[int]]]:
+        return {
+            c: {"landscape": land, "portrait": port}
+            for c, land, port in zip(
+                self.countries, self.landscape_cols, self.portrait_cols
+            )
+        }
+
+    def collect(self, cells: List[str]) -> Tuple[CountryTexts, CountryTexts]:
+        """Per-country texts of a row already padded to the header width."""
+        return (
+            CountryTexts(
+                self._index,
+                [
+                    cells[i].replace("\r", "").rstrip() if i is not None else ""
+                    for i in self.landscape_cols
+                ],
+            ),
+            CountryTexts(
+                self._index,
+                [
+                    cells[i].replace("\r", "").rstrip() if i is not None else ""
+                    for i in self.portrait_cols
+                ],
+            ),
+        )
+
+
+def _parse_positive_fps(raw_value: Any) -> Optional[float]:
+    token = str(raw_value).strip() if raw_value is not None else ""
+    if not token:
+        return None
+    try:
+        parsed = float(token)
+    except (TypeError, ValueError):
+        return None
+    return parsed if parsed > 0 else None
+
+
+@dataclass(frozen=True)
+class UnifiedRowPlan:
+    """Column layout of a unified-schema sheet, compiled once from its headers.
+
+    ``extract`` turns a raw row into a ``UnifiedRow`` using a single prebound
+    ``itemgetter`` over the present columns instead of per-field index checks.
+    """
+
+    width: int
+    idx_record_type: int
+    indices: Dict[str, Optional[int]]
+    country_start_idx: int
+    countries: Tuple[str, ...]
+    country_occurrences: Dict[str, Tuple[int, ...]]
+    country_variant_counts: Dict[str, int]
+    _getter: Callable[[List[str]], Tuple[str, ...]] = field(
+        init=False, repr=False, compare=False
+    )
+    _positions: Tuple[int, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        present = [self.idx_record_type]
+        positions: List[int] = []
+        for name in _OPTIONAL_FIELDS:
+            idx = self.indices.get(name)
+            if idx is None:
+                # -1 points at the "" sentinel appended to every extracted tuple.
+                positions.append(-1)
+            else:
+                positions.append(len(present))
+                present.append(idx)
+        if len(present) == 1:
+            only = present[0]
+            object.__setattr__(self, "_getter", lambda cells: (cells[only],))
+        else:
+            object.__setattr__(self, "_getter", itemgetter(*present))
+        object.__setattr__(self, "_positions", tuple(positions))
+
+    def text_plan(self, variant_index: int = 0) -> CountryTextPlan:
+        # Select which (landscape, portrait) pair to use; countries without
+        # that many pairs fall back to their first pair.
+        vi = variant_index
+        land_cols: List[Optional[int]] = []
+        port_cols: List[Optional[int]] = []
+        for c in self.countries:
+            occ = self.country_occurrences.get(c, ())
+            land_cols.append(
+                occ[2 * vi] if len(occ) > 2 * vi else (occ[0] if occ else None)
+            )
+            port_cols.append(
+                occ[2 * vi + 1]
+                if len(occ) > 2 * vi + 1
+                else (occ[1] if len(occ) > 1 else None)
+            )
+        return CountryTextPlan(
+            countries=self.countries,
+            landscape_cols=tuple(land_cols),
+            portrait_cols=tuple(port_cols),
+        )
+
+    def extract(
+        self,
+        row: List[str],
+        parse_time: Callable[[str], Optional[float]],
+    ) -> Optional[UnifiedRow]:
+        """Return the row record, or None for rows without a record type."""
+        if len(row) < self.width:
+            row = row + [""] * (self.width - len(row))
+        values = [v.strip() if v else "" for v in self._getter(row)]
+        rt = values[0].lower()
+        if not rt:
+            return None
+        values.append("")
+        (
+            pos_video,
+            pos_line,
+            pos_start,
+            pos_end,
+            pos_key,
+            pos_target,
+            pos_scope,
+            pos_meta,
+        ) = self._positions
+        line_raw = values[pos_line]
+        try:
+            line_num = int(line_raw) if line_raw else None
+        except Exception:
+            line_num = None
+        start_raw = values[pos_start]
+        end_raw = values[pos_end]
+        country_scope_raw = values[pos_scope]
+        return UnifiedRow(
+            record_type=rt,
+            video_id=values[pos_video],
+            line_num=line_num,
+            start_tc=parse_time(start_raw) if start_raw else None,
+            end_tc=parse_time(end_raw) if end_raw else None,
+            key_name=values[pos_key],
+            target_duration=values[pos_target],
+            country_scope_raw=country_scope_raw,
+            country_scope=country_scope_raw.upper(),
+            metadata=values[pos_meta],
+            cells=row,
+        )
+
+    def meta_global_fps(self, row: List[str]) -> Optional[float]:
+        """FPS defined by a ``meta_global`` ``fps`` row, or None for other rows."""
+        idx_key = self.indices.get("key")
+        if idx_key is None:
+            return None
+        rt_idx = self.idx_record_type
+        rt_value = (
+            row[rt_idx].strip().lower() if rt_idx < len(row) and row[rt_idx] else ""
+        )
+        if rt_value not in ("meta_global", "meta-global"):
+            return None
+        key_value = (
+            row[idx_key].strip().lower() if idx_key < len(row) and row[idx_key] else ""
+        )
+        if key_value != "fps":
+            return None
+
+        # Prefer canonical metadata cell first.
+        idx_metadata_val = self.indices.get("metadata")
+        if idx_metadata_val is not None and idx_metadata_val < len(row):
+            parsed_meta = _parse_positive_fps(row[idx_metadata_val])
+            if parsed_meta is not None:
+                return parsed_meta
+
+        # Then try country text columns (first valid wins).
+        for col_idx in range(self.country_start_idx, self.width):
+            if col_idx >= len(row):
+                continue
+            parsed_country = _parse_positive_fps(row[col_idx])
+            if parsed_country is not None:
+                return parsed_country
+        return None
+
+
+def build_unified_row_plan(headers: List[str]) -> Optional[UnifiedRowPlan]:
+    """Compile the unified-schema column plan, or None without ``record_type``."""
+    lower_headers = [h.strip().lower() for h in headers]
+    if "record_type" not in lower_headers:
+        return None
+
+    def _index(name: str) -> Optional[int]:
+        return lower_headers.index(name) if name in lower_headers else None
+
+    indices = {name: _index(name) for name in _OPTIONAL_FIELDS}
+    idx_end = indices["end"]
+    idx_key = indices["key"]
+    idx_country_scope = indices["country_scope"]
+    idx_metadata_val = indices["metadata"]
+
+    # Country columns: all columns after metadata value column (if present) else after country_scope
+    if idx_metadata_val is not None:
+        country_start_idx = idx_metadata_val + 1
+    elif idx_country_scope is not None:
+        country_start_idx = idx_country_scope + 1
+    else:
+        country_start_idx = (
+            max([c for c in [idx_end, idx_key] if c is not None] or [0]) + 1
+        )
+
+    # Support duplicate country codes for orientation (landscape/portrait)
+    country_occurrences: Dict[str, List[int]] = {}
+    for i in range(country_start_idx, len(headers)):
+        code = headers[i].strip()
+        if not code:
+            continue
+        country_occurrences.setdefault(code, []).append(i)
+    countries = tuple(country_occurrences)
+    # Count how many orientation pairs (variants) exist per country (pairs of columns)
+    country_variant_counts = {
+        c: max(1, (len(occ) + 1) // 2) for c, occ in country_occurrences.items()
+    }
+
+    return UnifiedRowPlan(
+        width=len(headers),
+        idx_record_type=lower_headers.index("record_type"),
+        indices=indices,
+        country_start_idx=country_start_idx,
+        countries=countries,
+        country_occurrences={c: tuple(o) for c, o in country_occurrences.items()},
+        country_variant_counts=country_variant_counts,
+    )
@@ -0,0 +1,290 @@
+from __future__ import annotations
+
+import functools
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+_DISABLED_KEY_TOKENS = ("", '""', "none", "off", "disable", "disabled")
+
+
+def parse_required_global_keys(raw: str) -> List[str]:
+    """``--required-global-keys`` value as a key list (empty when disabled)."""
+    raw_keys = raw.strip()
+    if raw_keys in _DISABLED_KEY_TOKENS:
+        return []
+    parts = []
+    for segment in raw_keys.split(","):
+        seg = segment.strip().strip('"').strip("'")
+        if seg:
+            parts.append(seg)
+    return parts
+
+
+@dataclass(frozen=True)
+class TimedListRule:
+    """A list of ``{"in", "out"}`` items: ``in <= out`` and no overlap with
+    the previous item. ``not_list`` is the message template for non-lists.
+    """
+
+    key: str
+    not_list: str = "{path} is not a list"
+
+
+@dataclass(frozen=True)
+class PayloadSchema:
+    """Declarative structural rules for one converter output payload.
+
+    Legacy payloads (top-level timed arrays, no ``videos``) only get
+    ``legacy_timed`` checks. v2 payloads get the orientation arrays (a list
+    each with ``no_orientation``), the required ``metadataGlobal`` keys and
+    per-video orientation/timing checks. ``summary_arrays`` are counted for
+    ``--check`` reports in the same traversal.
+    """
+
+    legacy_timed: Tuple[TimedListRule, ...] = (
+        TimedListRule("subtitles"),
+        TimedListRule("claim"),
+        TimedListRule("disclaimer"),
+        TimedListRule("disclaimer_02"),
+    )
+    orientation_arrays: Tuple[str, ...] = (
+        "claim",
+        "disclaimer",
+        "disclaimer_02",
+        "logo",
+    )
+    orientations: Tuple[str, ...] = ("landscape", "portrait")
+    video_timed: TimedListRule = TimedListRule("subtitles", "{path} not a list")
+    summary_arrays: Tuple[str, ...] = ("claim", "disclaimer", "disclaimer_02", "logo")
+    required_global_keys: Tuple[str, ...] = ()
+    missing_keys_warn: bool = False
+    no_orientation: bool = False
+
+
+Validator = Callable[[Dict[str, Any]], Dict[str, Any]]
+
+
+def _check_timed_items(arr: List[Any], path: str, errs: List[str]) -> None:
+    prev_out: Optional[float] = None
+    for i, item in enumerate(arr):
+        if not isinstance(item, dict):
+            errs.append(f"{path}[{i}] not an object")
+            continue
+        tin = item.get("in")
+        tout = item.get("out")
+        try:
+            if tin is not None and tout is not None:
+                ftin = float(tin)
+                ftout = float(tout)
+                if ftin > ftout:
+                    errs.append(f"{path}[{i}] in > out ({tin} > {tout})")
+                if prev_out is not None and ftin < prev_out:
+                    errs.append(
+                        f"{path}[{i}] overlaps previous (start {ftin} < prev end {prev_out})"
+                    )
+                prev_out = ftout
+        except Exception:
+            pass
+
+
+def _sized_len(value: Any) -> int:
+    try:
+        return len(value)
+    except TypeError:
+        return 0
+
+
+@functools.lru_cache(maxsize=32)
+def compile_validator(schema: PayloadSchema) -> Validator:
+    """Compile ``schema`` into ``validate(payload) -> {"errors", "warnings", "summary"}``.
+
+    The returned function walks each payload once. ``summary`` carries the
+    ``--check`` counters: ``videos`` (``videoId``/``subtitleCount`` per video
+    object), ``subtitleLines`` and ``<name>Lines`` per summary array.
+    """
+    legacy_keys = tuple(rule.key for rule in schema.legacy_timed)
+    legacy_rules = tuple((rule.key, rule.not_list) for rule in schema.legacy_timed)
+    orientation_arrays = schema.orientation_arrays
+    orientations = schema.orientations
+    first_orientation, second_orientation = orientations
+    suffixes = tuple(f"_{o}" for o in orientations)
+    video_key = schema.video_timed.key
+    video_not_list = schema.video_timed.not_list
+    summary_arrays = tuple((name, f"{name}Lines") for name in schema.summary_arrays)
+    required_keys = schema.required_global_keys
+    missing_keys_warn = schema.missing_keys_warn
+    no_orientation = schema.no_orientation
+    not_object_msg = (
+        f"{{name}} must be an object with {first_orientation}/{second_orientation} keys"
+    )
+
+    def _summary(obj: Dict[str, Any], videos: List[Dict[str, Any]]) -> Dict[str, Any]:
+        summary: Dict[str, Any] = {
+            "videos": videos,
+            "subtitleLines": sum(v["subtitleCount"] for v in videos),
+        }
+        for name, label in summary_arrays:
+            summary[label] = _sized_len(obj.get(name, []))
+        return summary
+
+    def _orientation_array(
+        name: str, val: Any, errs: List[str], warnings: List[str]
+    ) -> None:
+        if not isinstance(val, dict):
+            errs.append(not_object_msg.format(name=name))
+            return
+        for key in orientations:
+            if key not in val:
+                errs.append(f"{name}.{key} missing")
+        for key in orientations:
+            arr = val.get(key)
+            if arr is None:
+                continue
+            if not isinstance(arr, list):
+                errs.append(f"{name}.{key} not a list")
+            else:
+                for i, elem in enumerate(arr):
+                    if not isinstance(elem, str):
+                        errs.append(f"{name}.{key}[{i}] not a string")
+        land = val.get(first_orientation)
+        port = val.get(second_orientation)
+        if isinstance(land, list) and isinstance(port, list):
+            if land and not port:
+                warnings.append(
+                    f"{name}: {second_orientation} empty while {first_orientation} has data (expected mirror)"
+                )
+            if land and port and len(port) != len(land):
+                warnings.append(
+                    f"{name}: {first_orientation}/{second_orientation} length mismatch {len(land)}!={len(port)}"
+                )
+
+    def validate(obj: Dict[str, Any]) -> Dict[str, Any]:
+        errs: List[str] = []
+        warnings: List[str] = []
+        if "videos" not in obj and any(k in obj for k in legacy_keys):
+            for key, not_list in legacy_rules:
+                arr = obj.get(key)
+                if arr is None:
+                    continue
+                if not isinstance(arr, list):
+                    errs.append(not_list.format(path=key))
+                    continue
+                _check_timed_items(arr, key, errs)
+            return {"errors": errs, "warnings": warnings, "summary": _summary(obj, [])}
+
+        for name in orientation_arrays:
+            val = obj.get(name)
+            if val is None:
+                continue
+            if no_orientation:
+                if not isinstance(val, list):
+                    errs.append(f"{name} must be a list in --no-orientation mode")
+            else:
+                _orientation_array(name, val, errs, warnings)
+
+        gm = obj.get("metadataGlobal", {})
+        if gm and isinstance(gm, dict) and required_keys:
+            for k in required_keys:
+                if k not in gm:
+                    message = f"metadataGlobal missing required key '{k}'"
+                    (warnings if missing_keys_warn else errs).append(message)
+
+        video_summaries: List[Dict[str, Any]] = []
+        videos = obj.get("videos")
+        if videos is not None and not isinstance(videos, list):
+            errs.append("videos is not a list")
+        elif videos is not None:
+            for v_index, v in enumerate(videos):
+                if not isinstance(v, dict):
+                    errs.append(f"videos[{v_index}] not an object")
+                    continue
+                vid = v.get("videoId")
+                subs = v.get(video_key)
+                video_summaries.append(
+                    {
+                        "videoId": vid,
+                        "subtitleCount": _sized_len(subs) if subs is not None else 0,
+                    }
+                )
+                oriented = isinstance(vid, str) and vid.endswith(suffixes)
+                if isinstance(vid, str) and not oriented:
+                    warnings.append(
+                        f"videos[{v_index}].videoId missing orientation suffix"
+                    )
+                meta = v.get("metadata", {})
+                if isinstance(meta, dict):
+                    if oriented:
+                        expected = (
+                            first_orientation
+                            if vid.endswith(suffixes[0])
+                            else second_orientation
+                        )
+                        orient = meta.get("orientation")
+                        if orient != expected:
+                            errs.append(
+                                f"videos[{v_index}].metadata.orientation '{orient}' != expected '{expected}'"
+                            )
+                    if "orientation" not in meta:
+                        warnings.append(
+                            f"videos[{v_index}].metadata missing orientation"
+                        )
+                if subs is None:
+                    continue
+                path = f"videos[{v_index}].{video_key}"
+                if not isinstance(subs, list):
+                    errs.append(video_not_list.format(path=path))
+                    continue
+                _check_timed_items(subs, path, errs)
+        return {
+            "errors": errs,
+            "warnings": warnings,
+            "summary": _summary(obj, video_summaries),
+        }
+
+    return validate
+
+
+def build_schema(
+    *,
+    required_global_keys: Sequence[str] = (),
+    missing_keys_warn: bool = False,
+    no_orientation: bool = False,
+) -> PayloadSchema:
+    """Default v2 schema with the CLI validation options applied."""
+    return PayloadSchema(
+        required_global_keys=tuple(required_global_keys),
+        missing_keys_warn=missing_keys_warn,
+        no_orientation=no_orientation,
+    )
+
+
+def build_validator(
+    *,
+    required_global_keys: Sequence[str] = (),
+    missing_keys_warn: bool = False,
+    no_orientation: bool = False,
+) -> Validator:
+    """Compiled validator for the default v2 schema with the CLI options."""
+    return compile_validator(
+        build_schema(
+            required_global_keys=required_global_keys,
+            missing_keys_warn=missing_keys_warn,
+            no_orientation=no_orientation,
+        )
+    )
+
+
+def validate_structure(
+    obj: Dict[str, Any],
+    *,
+    required_global_keys: Sequence[str] = (),
+    missing_keys_warn: bool = False,
+    no_orientation: bool = False,
+) -> Dict[str, List[str]]:
+    """Structural checks of one output payload: ``{"errors", "warnings"}``."""
+    res = build_validator(
+        required_global_keys=required_global_keys,
+        missing_keys_warn=missing_keys_warn,
+        no_orientation=no_orientation,
+    )(obj)
+    return {"errors": res["errors"], "warnings": res["warnings"]}
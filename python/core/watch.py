@@ -0,0 +1,160 @@
+"""Watch mode (``--watch``): reconvert when the input or its side configs change.
+
+The watcher polls the input, ``--layer-config`` and ``--media-config`` files
+and reruns the conversion in the same (warm) process. Input edits are
+narrowed down to the countries they can affect: the sheet is digested per
+country column, and only the touched countries' split outputs are rebuilt
+(via ``--only-countries``). Changes to shared columns, ``ALL``-scope rows,
+``meta_global`` rows or the config files rebuild every country.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from typing import Callable, List, Optional, Sequence, Tuple
+
+from .cli_runner import build_cli_parser
+from .input_digest import InputDigest, digest_input, touched_countries
+from .serve import RunCallable
+
+WATCH_DEFAULT_INTERVAL = 0.5
+
+FileSignature = Optional[Tuple[int, int]]
+
+
+def _positive_float(value: str) -> float:
+    try:
+        number = float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid float value: '{value}'")
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"must be > 0, got {number}")
+    return number
+
+
+def _build_watch_parser() -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(add_help=False, allow_abbrev=False)
+    p.add_argument("--watch", action="store_true")
+    p.add_argument(
+        "--watch-interval", type=_positive_float, default=WATCH_DEFAULT_INTERVAL
+    )
+    return p
+
+
+def file_signature(path: str) -> FileSignature:
+    """``(mtime_ns, size)`` of ``path``, or None when it does not exist."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _selected_country(args: argparse.Namespace, countries: Sequence[str]) -> str:
+    # Same selection as the single-output branch of run_cli.
+    if args.country_column and 1 <= args.country_column <= len(countries):
+        return countries[args.country_column - 1]
+    return countries[-1] if countries else ""
+
+
+def watch_loop(
+    argv: List[str],
+    run: RunCallable,
+    *,
+    interval: float = WATCH_DEFAULT_INTERVAL,
+    max_polls: Optional[int] = None,
+    sleep: Callable[[float], None] = time.sleep,
+) -> int:
+    """Convert once, then poll every ``interval`` seconds and reconvert on change.
+
+    A change is acted on once the file signatures are stable for one more
+    interval (editors often save in several steps). ``max_polls`` bounds the
+    loop (tests); by default it runs until interrupted.
+    """
+    args = build_cli_parser().parse_args(argv)
+    watched = [args.input] + [
+        p for p in (args.layer_config, args.media_config) if p and p != args.input
+    ]
+
+    def _digest() -> Optional[InputDigest]:
+        try:
+            return digest_input(
+                args.input,
+                encoding=args.encoding,
+                delimiter=args.delimiter,
+                xlsx_sheet=args.xlsx_sheet,
+            )
+        except Exception:
+            # Unreadable mid-save; the conversion reports the actual error.
+            return None
+
+    signatures = {p: file_signature(p) for p in watched}
+    digest = _digest()
+    exit_code = run(list(argv))
+    print(f"Watching {', '.join(watched)} for changes (Ctrl+C to stop)...")
+    polls = 0
+    try:
+        while max_polls is None or polls < max_polls:
+            polls += 1
+            sleep(interval)
+            current = {p: file_signature(p) for p in watched}
+            changed = [p for p in watched if current[p] != signatures[p]]
+            if not changed:
+                continue
+            sleep(interval)
+            if {p: file_signature(p) for p in watched} != current:
+                continue  # still being written; retried on the next poll
+            signatures = current
+
+            run_argv = list(argv)
+            if changed == [args.input]:
+                previous, digest = digest, _digest()
+                # After a failed run every output may be stale: rebuild all.
+                touched = (
+                    touched_countries(previous, digest) if exit_code == 0 else None
+                )
+                if touched is not None and digest is not None:
+                    countries = list(digest.countries)
+                    if not args.split_by_country:
+                        selected = _selected_country(args, countries)
+                        touched = [c for c in touched if c == selected]
+                    if not touched:
+                        print(
+                            f"Change detected in {args.input}: no output affected, skipped."
+                        )
+                        continue
+                    if args.split_by_country:
+                        run_argv += ["--only-countries", ",".join(touched)]
+                    print(
+                        f"Change detected in {args.input}: reconverting "
+                        f"{len(touched)} of {len(countries)} countries ({', '.join(touched)})"
+                    )
+                else:
+                    print(
+                        f"Change detected in {args.input}: reconverting all countries"
+                    )
+            else:
+                if args.input in changed:
+                    digest = _digest()
+                print(
+                    f"Change detected in {', '.join(changed)}: reconverting all countries"
+                )
+            exit_code = run(run_argv)
+    except KeyboardInterrupt:
+        print("Watch stopped.")
+        return 0
+    return exit_code
+
+
+def dispatch_watch_flags(argv: List[str], run: RunCallable) -> Optional[int]:
+    """Handle ``--watch [--watch-interval SECONDS]``; None otherwise."""
+    if "--watch" not in argv:
+        return None
+    opts, rest = _build_watch_parser().parse_known_args(argv)
+    if "--check" in rest:
+        print("Error: --watch cannot be combined with --check", file=sys.stderr)
+        return 2
+    return watch_loop(rest, run, interval=opts.watch_interval)
@@ -0,0 +1,281 @@
+"""Parsed-worksheet cache shared by the converter and the XLSX tools.
+
+One pipeline run can read the same campaign workbook several times: the
+converter reads the ``data`` sheet, ``--media-config`` the ``media`` sheet
+(``media_converter.read_csv``) and ``--layer-config`` the layer sheets
+(``config_converter.convert_workbook``). ``open_cached_workbook`` hands each
+consumer the sheets it asks for, keyed by path, mtime and size:
+
+- sheet names are read once per workbook revision;
+- with ``retain=True`` (media/layer config) a sheet is parsed on first use
+  and its cell values are kept, so it is never parsed twice;
+- with ``retain=False`` (the converter's data sheet) rows are streamed from
+  the file (``xlsx_reader``, openpyxl fallback) unless another consumer
+  already cached that sheet.
+
+Kept sheets are evicted least recently used once their estimated size
+exceeds ``_MAX_CACHE_BYTES``. With ``JSON_CONVERTER_WORKBOOK_CACHE=<dir>``
+kept sheets are also pickled into ``<dir>`` and reused by later processes
+while the file is unchanged. Only point it at a directory you own: cache
+files are unpickled.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+import sys
+from collections import OrderedDict
+from itertools import islice
+from typing import Any, Callable, Iterator, List, Optional, Tuple
+
+from .xlsx_reader import open_values_workbook
+
+WORKBOOK_CACHE_ENV = "JSON_CONVERTER_WORKBOOK_CACHE"
+WORKBOOK_CACHE_FORMAT = 2
+
+# Budget for kept sheets (estimated from the row tuples and their strings).
+_MAX_CACHE_BYTES = 64 * 1024 * 1024
+_NAMES_ENTRY_BYTES = 1024
+
+Row = Tuple[Any, ...]
+WorkbookKey = Tuple[str, int, int]
+# (all sheet names, names of sheets with cell values)
+SheetNames = Tuple[List[str], List[str]]
+
+# (workbook key, sheet title or None for the names) -> (value, size)
+_MEMO: "OrderedDict[Tuple[WorkbookKey, Optional[str]], Tuple[Any, int]]" = OrderedDict()
+_memo_bytes = 0
+
+
+def _memo_get(entry: Tuple[WorkbookKey, Optional[str]]) -> Any:
+    hit = _MEMO.get(entry)
+    if hit is None:
+        return None
+    _MEMO.move_to_end(entry)
+    return hit[0]
+
+
+def _memo_put(entry: Tuple[WorkbookKey, Optional[str]], value: Any, size: int) -> None:
+    global _memo_bytes
+    if size > _MAX_CACHE_BYTES:
+        return
+    old = _MEMO.pop(entry, None)
+    if old is not None:
+        _memo_bytes -= old[1]
+    _MEMO[entry] = (value, size)
+    _memo_bytes += size
+    while _memo_bytes > _MAX_CACHE_BYTES:
+        _, (_, evicted) = _MEMO.popitem(last=False)
+        _memo_bytes -= evicted
+
+
+def _drop_stale(key: WorkbookKey) -> None:
+    """Forget other revisions of the same file (--watch/--serve runs)."""
+    global _memo_bytes
+    for entry in [e for e in _MEMO if e[0][0] == key[0] and e[0] != key]:
+        _memo_bytes -= _MEMO.pop(entry)[1]
+
+
+def _rows_size(rows: List[Row]) -> int:
+    size = sys.getsizeof(rows)
+    for row in rows:
+        size += sys.getsizeof(row)
+        for value in row:
+            if isinstance(value, str):
+                size += sys.getsizeof(value)
+            elif value is not None:
+                size += 32
+    return size
+
+
+def workbook_cache_key(path: str) -> WorkbookKey:
+    st = os.stat(path)
+    return (os.path.abspath(path), st.st_mtime_ns, st.st_size)
+
+
+def default_workbook_cache_dir() -> Optional[str]:
+    """On-disk cache directory from the env variable, or None (disabled)."""
+    env_val = os.getenv(WORKBOOK_CACHE_ENV)
+    if env_val is None or env_val.strip().lower() in ("", "0", "off", "false", "no"):
+        return None
+    return env_val
+
+
+def _disk_cache_path(cache_dir: str, abs_path: str, sheet: Optional[str]) -> str:
+    digest = hashlib.sha256(abs_path.encode("utf-8")).hexdigest()[:32]
+    if sheet is None:
+        return os.path.join(cache_dir, f"workbook-{digest}.pickle")
+    sheet_digest = hashlib.sha256(sheet.encode("utf-8")).hexdigest()[:16]
+    return os.path.join(cache_dir, f"workbook-{digest}-{sheet_digest}.pickle")
+
+
+def _load_pickled(path: str, key: WorkbookKey) -> Any:
+    try:
+        with open(path, "rb") as f:
+            data = pickle.load(f)
+    except Exception:
+        return None
+    if (
+        not isinstance(data, dict)
+        or data.get("format") != WORKBOOK_CACHE_FORMAT
+        or tuple(data.get("key") or ()) != key
+    ):
+        return None
+    return data.get("value")
+
+
+def _save_pickled(path: str, key: WorkbookKey, value: Any) -> None:
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    data = {"format": WORKBOOK_CACHE_FORMAT, "key": list(key), "value": value}
+    try:
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(tmp_path, "wb") as f:
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except (OSError, pickle.PicklingError):
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+def _read_sheet_rows(source: Any, title: str) -> List[Row]:
+    return list(source[title].iter_rows(values_only=True))
+
+
+class CachedSheet:
+    """One worksheet of a ``CachedWorkbook`` (the read-only ``iter_rows`` subset)."""
+
+    def __init__(self, workbook: "CachedWorkbook", title: str) -> None:
+        self.parent = workbook
+        self.title = title
+
+    def iter_rows(
+        self,
+        min_row: Optional[int] = None,
+        max_row: Optional[int] = None,
+        values_only: bool = True,
+    ) -> Iterator[Row]:
+        if not values_only:
+            raise ValueError("cached worksheets only hold cell values")
+        return self.parent._iter_sheet(self.title, min_row, max_row)
+
+
+class CachedWorkbook:
+    """Sheets of one workbook revision; ``close()`` releases the open file.
+
+    The file itself is opened only when a sheet is not cached yet.
+    """
+
+    def __init__(
+        self,
+        key: WorkbookKey,
+        names: SheetNames,
+        source: Any,
+        fallback: Optional[Callable[..., Any]],
+        cache_dir: Optional[str],
+        retain: bool,
+    ) -> None:
+        self.key = key
+        self.sheetnames = names[0]
+        self.worksheets = [CachedSheet(self, title) for title in names[1]]
+        self._by_name = {ws.title: ws for ws in self.worksheets}
+        self._source = source
+        self._fallback = fallback
+        self._cache_dir = cache_dir
+        self._retain = retain
+
+    def __getitem__(self, name: str) -> CachedSheet:
+        try:
+            return self._by_name[name]
+        except KeyError:
+            raise KeyError(f"Worksheet {name} does not exist.") from None
+
+    def close(self) -> None:
+        source, self._source = self._source, None
+        if source is not None:
+            source.close()
+
+    def _open_source(self) -> Any:
+        if self._source is None:
+            self._source = open_values_workbook(self.key[0], self._fallback)
+        return self._source
+
+    def _cached_rows(self, title: str) -> Optional[List[Row]]:
+        rows = _memo_get((self.key, title))
+        if rows is None and self._cache_dir:
+            rows = _load_pickled(
+                _disk_cache_path(self._cache_dir, self.key[0], title), self.key
+            )
+            if rows is not None:
+                _memo_put((self.key, title), rows, _rows_size(rows))
+        return rows
+
+    def _iter_sheet(
+        self, title: str, min_row: Optional[int], max_row: Optional[int]
+    ) -> Iterator[Row]:
+        start = (min_row or 1) - 1
+        rows = self._cached_rows(title)
+        if rows is None and self._retain:
+            rows = _read_sheet_rows(self._open_source(), title)
+            _memo_put((self.key, title), rows, _rows_size(rows))
+            if self._cache_dir:
+                _save_pickled(
+                    _disk_cache_path(self._cache_dir, self.key[0], title),
+                    self.key,
+                    rows,
+                )
+        if rows is not None:
+            return iter(rows[start:max_row])
+        streamed = self._open_source()[title].iter_rows(values_only=True)
+        if start or max_row is not None:
+            return islice(streamed, start, max_row)
+        return streamed
+
+
+def open_cached_workbook(
+    path: str,
+    fallback: Optional[Callable[..., Any]] = None,
+    cache_dir: Optional[str] = None,
+    retain: bool = True,
+) -> CachedWorkbook:
+    """Workbook handle for ``path`` whose sheets come from the cache if possible.
+
+    ``fallback`` is openpyxl's ``load_workbook`` for workbooks the fast
+    reader does not support; ``cache_dir`` defaults to the env variable.
+    ``retain=False`` streams sheets that are not cached instead of keeping
+    them (see module docstring).
+    """
+    key = workbook_cache_key(path)
+    _drop_stale(key)
+    if cache_dir is None:
+        cache_dir = default_workbook_cache_dir()
+    names: Optional[SheetNames] = _memo_get((key, None))
+    if names is None and cache_dir:
+        names = _load_pickled(_disk_cache_path(cache_dir, key[0], None), key)
+    source = None
+    if names is None:
+        source = open_values_workbook(path, fallback)
+        try:
+            sheetnames = list(source.sheetnames)
+            # Chartsheets (openpyxl fallback only) have no cell values.
+            names = (
+                sheetnames,
+                [n for n in sheetnames if hasattr(source[n], "iter_rows")],
+            )
+        except Exception:
+            source.close()
+            raise
+        if cache_dir:
+            _save_pickled(_disk_cache_path(cache_dir, key[0], None), key, names)
+    _memo_put((key, None), names, _NAMES_ENTRY_BYTES)
+    return CachedWorkbook(key, names, source, fallback, cache_dir, retain)
+
+
+def clear_workbook_cache() -> None:
+    """Drop the per-process cache (the on-disk cache is kept)."""
+    global _memo_bytes
+    _MEMO.clear()
+    _memo_bytes = 0
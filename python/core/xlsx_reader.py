@@ -0,0 +1,505 @@
+"""Lightweight, values-only XLSX reader (``zipfile`` + ``ElementTree``).
+
+``load_workbook(path)`` is a stand-in for
+``openpyxl.load_workbook(path, read_only=True, data_only=True)`` for callers
+that only iterate ``ws.iter_rows(values_only=True)``: the sheet XML is fed in
+chunks to an ``XMLParser`` whose target collects cell values straight into
+row tuples, without elements, cell objects or full style parsing. Values,
+row padding and row counts follow openpyxl's read-only reader: shared/inline
+strings, ints/floats, booleans, error codes and date-formatted serials
+(``datetime``/``time``/``timedelta``).
+
+Workbooks it does not handle the same way (chartsheets, missing sheet parts,
+unparsable dimensions, strict OOXML) raise ``XlsxUnsupportedError`` from
+``load_workbook``, so callers can fall back to openpyxl before any row is read.
+"""
+
+from __future__ import annotations
+
+import posixpath
+import re
+import zipfile
+from datetime import datetime, time, timedelta
+from typing import IO, Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
+from xml.etree.ElementTree import XMLParser, fromstring, iterparse
+
+_MAIN_NS = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+_REL_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+_PKG_REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+_CT_NS = "http://schemas.openxmlformats.org/package/2006/content-types"
+_SHARED_STRINGS_CT = (
+    "application/vnd.openxmlformats-officedocument.spreadsheetml.sharedStrings+xml"
+)
+_OFFICE_DOCUMENT_REL = _REL_NS + "/officeDocument"
+
+_ROW = f"{{{_MAIN_NS}}}row"
+_CELL = f"{{{_MAIN_NS}}}c"
+_VALUE = f"{{{_MAIN_NS}}}v"
+_INLINE = f"{{{_MAIN_NS}}}is"
+_TEXT = f"{{{_MAIN_NS}}}t"
+_RUN = f"{{{_MAIN_NS}}}r"
+_SI = f"{{{_MAIN_NS}}}si"
+_DIMENSION = f"{{{_MAIN_NS}}}dimension"
+_SHEET_DATA = f"{{{_MAIN_NS}}}sheetData"
+
+WINDOWS_EPOCH = datetime(1899, 12, 30)
+MAC_EPOCH = datetime(1904, 1, 1)
+_SECS_PER_DAY = 86400
+_CHUNK_SIZE = 1 << 16
+
+# Built-in number formats openpyxl treats as dates / durations.
+_BUILTIN_DATE_FORMATS = frozenset({14, 15, 16, 17, 18, 19, 20, 21, 22, 45, 46, 47})
+_BUILTIN_TIMEDELTA_FORMATS = frozenset({46})
+_FORMAT_STRIP_RE = re.compile(r'".*?"|\[(?!hh?\]|mm?\]|ss?\])[^\]]*\]')
+_DATE_TOKEN_RE = re.compile(r"(?<![_\\])[dmhysDMHYS]")
+_TIMEDELTA_RE = re.compile(
+    r"\[hh?\](:mm(:ss(\.0*)?)?)?|\[mm?\](:ss(\.0*)?)?|\[ss?\](\.0*)?", re.I
+)
+_RANGE_RE = re.compile(
+    r"^\$?([A-Za-z]{1,3})?\$?(\d+)?(:)?(?:\$?([A-Za-z]{1,3})?\$?(\d+)?)?$"
+)
+_CELL_REF_RE = re.compile(r"^\$?([A-Za-z]{1,3})\$?(\d+)$")
+
+
+class XlsxUnsupportedError(Exception):
+    """The workbook needs the full (openpyxl) reader."""
+
+
+def _column_index(letters: str) -> int:
+    index = 0
+    for ch in letters.upper():
+        index = index * 26 + (ord(ch) - 64)
+    return index
+
+
+def _range_boundaries(ref: str) -> Tuple[Optional[int], ...]:
+    """``(min_col, min_row, max_col, max_row)`` like openpyxl's range_boundaries."""
+    m = _RANGE_RE.match(ref)
+    if not m:
+        raise XlsxUnsupportedError(f"unsupported dimension '{ref}'")
+    min_col, min_row, sep, max_col, max_row = m.groups()
+    if sep:
+        cols, rows = (min_col, max_col), (min_row, max_row)
+        if not (
+            all(cols + rows)
+            or (all(cols) and not any(rows))
+            or (all(rows) and not any(cols))
+        ):
+            raise XlsxUnsupportedError(f"unsupported dimension '{ref}'")
+    min_c = _column_index(min_col) if min_col else None
+    min_r = int(min_row) if min_row else None
+    max_c = _column_index(max_col) if max_col else min_c
+    max_r = int(max_row) if max_row else min_r
+    return min_c, min_r, max_c, max_r
+
+
+def _is_date_format(fmt: Optional[str]) -> bool:
+    if fmt is None:
+        return False
+    fmt = _FORMAT_STRIP_RE.sub("", fmt.split(";")[0])
+    return _DATE_TOKEN_RE.search(fmt) is not None
+
+
+def _is_timedelta_format(fmt: Optional[str]) -> bool:
+    if fmt is None:
+        return False
+    return _TIMEDELTA_RE.search(fmt.split(";")[0]) is not None
+
+
+def _from_excel(value: float, epoch: datetime, as_timedelta: bool) -> Any:
+    if as_timedelta:
+        td = timedelta(days=value)
+        if td.microseconds:
+            td = timedelta(
+                seconds=td.total_seconds() // 1,
+                microseconds=round(td.microseconds, -3),
+            )
+        return td
+    day, fraction = divmod(value, 1)
+    diff = timedelta(milliseconds=round(fraction * _SECS_PER_DAY * 1000))
+    if 0 <= value < 1 and diff.days == 0:
+        mins, seconds = divmod(diff.seconds, 60)
+        hours, mins = divmod(mins, 60)
+        return time(hours, mins, seconds, diff.microseconds)
+    if 0 < value < 60 and epoch == WINDOWS_EPOCH:
+        day += 1
+    return epoch + timedelta(days=day) + diff
+
+
+def _from_iso8601(value: str) -> Any:
+    try:
+        from openpyxl.utils.datetime import from_ISO8601
+    except Exception:
+        return datetime.fromisoformat(value.rstrip("Zz"))
+    return from_ISO8601(value)
+
+
+def _cast_number(value: str) -> Any:
+    if "." in value or "E" in value or "e" in value:
+        return float(value)
+    return int(value)
+
+
+def _text_content(node: Any) -> str:
+    """Plain ``<t>`` plus rich-text run texts (phonetic runs are skipped).
+
+    As in openpyxl, the last ``<t>`` wins where several are given.
+    """
+    snippets: List[str] = []
+    for parent in (node, *node.iterfind(_RUN)):
+        texts = parent.findall(_TEXT)
+        if texts and texts[-1].text is not None:
+            snippets.append(texts[-1].text)
+    return "".join(snippets)
+
+
+def _part_path(base_dir: str, target: str) -> str:
+    if target.startswith("/"):
+        return target[1:]
+    return posixpath.normpath(posixpath.join(base_dir, target))
+
+
+class XlsxSheet:
+    """One worksheet; iterate with ``iter_rows(values_only=True)``."""
+
+    def __init__(self, workbook: "XlsxWorkbook", title: str, part: str) -> None:
+        self.parent = workbook
+        self.title = title
+        self._part = part
+        self.max_column: Optional[int] = None
+        self.max_row: Optional[int] = None
+        with workbook._archive.open(part) as src:
+            for event, element in iterparse(src, events=("start",)):
+                if element.tag == _DIMENSION:
+                    ref = element.get("ref")
+                    if ref is None:
+                        raise XlsxUnsupportedError("dimension without ref")
+                    _, _, self.max_column, self.max_row = _range_boundaries(ref)
+                    break
+                if element.tag == _SHEET_DATA:
+                    break
+
+    def iter_rows(self, values_only: bool = True) -> Iterator[Tuple[Any, ...]]:
+        if not values_only:
+            raise XlsxUnsupportedError("only values_only=True is supported")
+        return self._iter_values(self.max_column, self.max_row)
+
+    def _iter_values(
+        self, max_col: Optional[int], max_row: Optional[int]
+    ) -> Iterator[Tuple[Any, ...]]:
+        empty_row: Tuple[Any, ...] = (None,) * max_col if max_col else ()
+        counter = 1
+        idx = 1
+        with self.parent._archive.open(self._part) as src:
+            for idx, cells in self._parse_rows(src):
+                if max_row is not None and idx > max_row:
+                    break
+                while counter < idx:
+                    counter += 1
+                    yield empty_row
+                if counter <= idx:
+                    counter += 1
+                    if not cells and not max_col:
+                        yield ()
+                        continue
+                    width = max_col or cells[-1][0]
+                    row: List[Any] = [None] * width
+                    for column, value in cells:
+                        if 1 <= column <= width:
+                            row[column - 1] = value
+                    yield tuple(row)
+        if max_row is not None and max_row < idx:
+            for _ in range(counter, max_row + 1):
+                yield empty_row
+
+    def _parse_rows(
+        self, src: IO[bytes]
+    ) -> Iterator[Tuple[int, List[Tuple[int, Any]]]]:
+        target = _SheetRowsTarget(self.parent)
+        parser = XMLParser(target=target)
+        rows = target.rows
+        while True:
+            chunk = src.read(_CHUNK_SIZE)
+            if not chunk:
+                break
+            parser.feed(chunk)
+            if rows:
+                yield from rows
+                rows.clear()
+        parser.close()
+        yield from rows
+
+
+class _SheetRowsTarget:
+    """``XMLParser`` target turning ``<row>``/``<c>`` events into value rows.
+
+    No elements are built: only cell values are collected, and finished rows
+    are appended to ``rows`` as ``(row_index, [(column, value), ...])``.
+    """
+
+    def __init__(self, workbook: "XlsxWorkbook") -> None:
+        self.rows: List[Tuple[int, List[Tuple[int, Any]]]] = []
+        self._shared = workbook.shared_strings
+        self._date_styles = workbook.date_styles
+        self._timedelta_styles = workbook.timedelta_styles
+        self._epoch = workbook.epoch
+        self._columns: Dict[str, int] = {}
+        self._stack: List[str] = []
+        self._row_counter = 0
+        self._col_counter = 0
+        self._cells: List[Tuple[int, Any]] = []
+        self._cell: Optional[Tuple[str, Optional[str]]] = None
+        self._value: Optional[List[str]] = None
+        self._text: Optional[List[str]] = None
+        # Depth of the cell's first <is>; -1 once it is closed. Only its
+        # plain <t> and the <t> of each run are read (_text_content).
+        self._inline = 0
+        self._plain: Optional[List[str]] = None
+        self._runs: List[List[str]] = []
+
+    def _column(self, coordinate: str) -> int:
+        letters = coordinate.rstrip("0123456789")
+        column = self._columns.get(letters)
+        if column is None or letters == coordinate:
+            m = _CELL_REF_RE.match(coordinate)
+            if m is None:
+                raise ValueError(f"Invalid cell coordinates ({coordinate})")
+            column = self._columns[letters] = _column_index(m.group(1))
+        return column
+
+    def start(self, tag: str, attrib: Dict[str, str]) -> None:
+        stack = self._stack
+        parent = stack[-1] if stack else None
+        stack.append(tag)
+        # Like Element.text: only the text before the first child counts.
+        self._text = None
+        if tag == _CELL:
+            if parent != _ROW:
+                return
+            coordinate = attrib.get("r")
+            if coordinate:
+                self._col_counter = self._column(coordinate)
+            else:
+                self._col_counter += 1
+            self._cell = (attrib.get("t", "n"), attrib.get("s"))
+            self._value = None
+            self._inline = 0
+            self._plain = None
+            self._runs = []
+        elif tag == _ROW:
+            r = attrib.get("r")
+            if r is not None:
+                try:
+                    self._row_counter = int(r)
+                except ValueError:
+                    number = float(r)
+                    if not number.is_integer():
+                        raise ValueError(f"{r} is not a valid row number")
+                    self._row_counter = int(number)
+            else:
+                self._row_counter += 1
+            self._col_counter = 0
+            self._cells = []
+        elif self._cell is None:
+            return
+        elif tag == _VALUE:
+            if parent == _CELL and self._value is None:
+                self._value = self._text = []
+        elif self._inline <= 0:
+            if tag == _INLINE and parent == _CELL and self._inline == 0:
+                self._inline = len(stack)
+        elif tag == _TEXT:
+            depth = len(stack) - self._inline
+            if depth == 1:
+                self._plain = self._text = []
+            elif depth == 2 and parent == _RUN:
+                self._runs[-1] = self._text = []
+        elif tag == _RUN and len(stack) - self._inline == 1:
+            self._runs.append([])
+
+    def data(self, text: str) -> None:
+        if self._text is not None:
+            self._text.append(text)
+
+    def end(self, tag: str) -> None:
+        stack = self._stack
+        self._text = None
+        if tag == _CELL and self._cell is not None and len(stack) > 1:
+            if stack[-2] == _ROW:
+                self._cells.append((self._col_counter, self._cell_value()))
+                self._cell = None
+        elif tag == _ROW:
+            self.rows.append((self._row_counter, self._cells))
+            self._cells = []
+        elif tag == _INLINE and len(stack) == self._inline:
+            self._inline = -1
+        stack.pop()
+
+    def _cell_value(self) -> Any:
+        data_type, style = self._cell  # type: ignore[misc]
+        if data_type == "inlineStr":
+            if self._inline == 0:
+                return None
+            return "".join(self._plain or ()) + "".join(map("".join, self._runs))
+        raw = "".join(self._value) if self._value is not None else None
+        if not raw:
+            return None
+        if data_type == "n":
+            value = _cast_number(raw)
+            style_id = int(style) if style else 0
+            if style_id in self._date_styles:
+                try:
+                    return _from_excel(
+                        value, self._epoch, style_id in self._timedelta_styles
+                    )
+                except (OverflowError, ValueError):
+                    return "#VALUE!"
+            return value
+        if data_type == "s":
+            return self._shared[int(raw)]
+        if data_type == "b":
+            return bool(int(raw))
+        if data_type == "d":
+            return _from_iso8601(raw)
+        return raw
+
+
+class XlsxWorkbook:
+    """Sheet names and sheets of an open workbook (close when done)."""
+
+    def __init__(self, path: str) -> None:
+        self._archive = zipfile.ZipFile(path)
+        try:
+            self._load()
+        except Exception:
+            self._archive.close()
+            raise
+
+    def _read_xml(self, name: str) -> Any:
+        return fromstring(self._archive.read(name))
+
+    def _load(self) -> None:
+        names = set(self._archive.namelist())
+        workbook_part = "xl/workbook.xml"
+        if "_rels/.rels" in names:
+            for rel in self._read_xml("_rels/.rels").iter(
+                f"{{{_PKG_REL_NS}}}Relationship"
+            ):
+                if rel.get("Type") == _OFFICE_DOCUMENT_REL:
+                    workbook_part = _part_path("", rel.get("Target", ""))
+                    break
+        workbook = self._read_xml(workbook_part)
+        if workbook.tag != f"{{{_MAIN_NS}}}workbook":
+            raise XlsxUnsupportedError(
+                f"unsupported workbook namespace: {workbook.tag}"
+            )
+        pr = workbook.find(f"{{{_MAIN_NS}}}workbookPr")
+        date1904 = pr is not None and pr.get("date1904", "").lower() in ("1", "true")
+        self.epoch = MAC_EPOCH if date1904 else WINDOWS_EPOCH
+
+        base_dir = posixpath.dirname(workbook_part)
+        rels_part = posixpath.join(
+            base_dir, "_rels", posixpath.basename(workbook_part) + ".rels"
+        )
+        targets: Dict[str, Tuple[str, str]] = {}
+        for rel in self._read_xml(rels_part).iter(f"{{{_PKG_REL_NS}}}Relationship"):
+            if rel.get("TargetMode") == "External":
+                continue
+            targets[rel.get("Id", "")] = (
+                rel.get("Type", ""),
+                _part_path(base_dir, rel.get("Target", "")),
+            )
+
+        self.shared_strings = self._read_shared_strings(names)
+        self.date_styles, self.timedelta_styles = self._read_date_styles(names)
+
+        self._sheets: Dict[str, XlsxSheet] = {}
+        self.sheetnames: List[str] = []
+        sheets = workbook.find(f"{{{_MAIN_NS}}}sheets")
+        for sheet in sheets if sheets is not None else ():
+            rel_id = sheet.get(f"{{{_REL_NS}}}id")
+            name = sheet.get("name", "")
+            if not rel_id or rel_id not in targets:
+                raise XlsxUnsupportedError(f"sheet '{name}' has no part")
+            rel_type, part = targets[rel_id]
+            if part not in names or "chartsheet" in rel_type:
+                raise XlsxUnsupportedError(f"sheet '{name}' is not a plain worksheet")
+            self._sheets[name] = XlsxSheet(self, name, part)
+            self.sheetnames.append(name)
+
+    def _read_shared_strings(self, names: Set[str]) -> List[str]:
+        if "[Content_Types].xml" not in names:
+            return []
+        part = None
+        for override in self._read_xml("[Content_Types].xml").iter(
+            f"{{{_CT_NS}}}Override"
+        ):
+            if override.get("ContentType") == _SHARED_STRINGS_CT:
+                part = override.get("PartName", "")[1:]
+                break
+        if part is None:
+            return []
+        strings: List[str] = []
+        with self._archive.open(part) as src:
+            for _, node in iterparse(src):
+                if node.tag == _SI:
+                    strings.append(_text_content(node).replace("x005F_", ""))
+                    node.clear()
+        return strings
+
+    def _read_date_styles(self, names: Set[str]) -> Tuple[Set[int], Set[int]]:
+        # openpyxl reads the stylesheet from this fixed location.
+        if "xl/styles.xml" not in names:
+            return set(), set()
+        styles = self._read_xml("xl/styles.xml")
+        custom: Dict[int, str] = {}
+        num_fmts = styles.find(f"{{{_MAIN_NS}}}numFmts")
+        for fmt in num_fmts if num_fmts is not None else ():
+            try:
+                custom[int(fmt.get("numFmtId", ""))] = fmt.get("formatCode", "")
+            except ValueError:
+                continue
+        date_styles: Set[int] = set()
+        timedelta_styles: Set[int] = set()
+        cell_xfs = styles.find(f"{{{_MAIN_NS}}}cellXfs")
+        for idx, xf in enumerate(cell_xfs if cell_xfs is not None else ()):
+            num_fmt_id = int(xf.get("numFmtId", "0"))
+            if num_fmt_id in custom:
+                fmt = custom[num_fmt_id]
+                is_date, is_timedelta = _is_date_format(fmt), _is_timedelta_format(fmt)
+            else:
+                is_date = num_fmt_id in _BUILTIN_DATE_FORMATS
+                is_timedelta = num_fmt_id in _BUILTIN_TIMEDELTA_FORMATS
+            if is_date:
+                date_styles.add(idx)
+            if is_timedelta:
+                timedelta_styles.add(idx)
+        return date_styles, timedelta_styles
+
+    def __getitem__(self, name: str) -> XlsxSheet:
+        return self._sheets[name]
+
+    def close(self) -> None:
+        self._archive.close()
+
+
+def load_workbook(path: str) -> XlsxWorkbook:
+    """Open ``path`` for values-only reading (see module docstring)."""
+    return XlsxWorkbook(path)
+
+
+def open_values_workbook(
+    path: str, fallback: Optional[Callable[..., Any]] = None
+) -> Any:
+    """This reader for ``path``, or ``fallback`` (openpyxl's ``load_workbook``)
+    in read-only/data-only mode when the workbook is not supported.
+
+    Errors of the fast reader are not surfaced: when both fail, the error is
+    the one openpyxl raises for the file.
+    """
+    try:
+        return load_workbook(path)
+    except Exception:
+        if fallback is None:
+            raise
+    return fallback(path, data_only=True, read_only=True)
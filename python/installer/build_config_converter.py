@@ -27,6 +27,7 @@ def build_pyinstaller_args(
         "--hidden-import=openpyxl",
         "--hidden-import=python.tools.config_converter",
         "--hidden-import=python.tools.sheet_names_config",
+        "--hidden-import=python.tools.xlsx_values",
         "--hidden-import=python.tools.merge_config_into_preset",
     ]
 
@@ -34,6 +35,10 @@ def build_pyinstaller_args(
     if sheet_names_tool.is_file():
         args.append(f"--add-data={sheet_names_tool}:tools")
 
+    xlsx_values_tool = config_tool.parent / "xlsx_values.py"
+    if xlsx_values_tool.is_file():
+        args.append(f"--add-data={xlsx_values_tool}:tools")
+
     merge_tool = config_tool.parent / "merge_config_into_preset.py"
     if merge_tool.is_file():
         args.append(f"--add-data={merge_tool}:tools")
@@ -125,22 +125,42 @@ def build_pyinstaller_args(
         "--hidden-import=python.tools.media_converter",
         "--hidden-import=python.tools.config_converter",
         "--hidden-import=python.tools.sheet_names_config",
+        "--hidden-import=python.tools.xlsx_values",
         # "--hidden-import=python.tools.generate_config_template",
         # "--hidden-import=python.tools.merge_config_into_preset",
         "--hidden-import=python.core",
-        "--hidden-import=python.core.columns",
+        "--hidden-import=python.core.batch",
+        "--hidden-import=python.core.build_cache",
+        "--hidden-import=python.core.check_cache",
         "--hidden-import=python.core.cli_runner",
+        "--hidden-import=python.core.columns",
         "--hidden-import=python.core.converter_engine",
+        "--hidden-import=python.core.country_checks",
         "--hidden-import=python.core.generation_metadata",
+        "--hidden-import=python.core.input_digest",
+        "--hidden-import=python.core.instrumentation",
         "--hidden-import=python.core.integration_injections",
+        "--hidden-import=python.core.json_stream",
+        "--hidden-import=python.core.lazy_payloads",
         "--hidden-import=python.core.optional_tools",
         "--hidden-import=python.core.output_paths",
+        "--hidden-import=python.core.payload_sharing",
+        "--hidden-import=python.core.profiling",
+        "--hidden-import=python.core.provenance",
+        "--hidden-import=python.core.record_dispatch",
         "--hidden-import=python.core.sectioned_mode",
+        "--hidden-import=python.core.serve",
         "--hidden-import=python.core.simple_mode",
+        "--hidden-import=python.core.split_writer",
         "--hidden-import=python.core.table_reader",
         "--hidden-import=python.core.timecode",
         "--hidden-import=python.core.unified_processors",
+        "--hidden-import=python.core.unified_row_plan",
+        "--hidden-import=python.core.validation",
         "--hidden-import=python.core.validation_reports",
+        "--hidden-import=python.core.watch",
+        "--hidden-import=python.core.workbook_cache",
+        "--hidden-import=python.core.xlsx_reader",
     ]
     sheet_names_tool = config_tool.parent / "sheet_names_config.py"
     if sheet_names_tool.is_file():
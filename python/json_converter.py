@@ -5,9 +5,13 @@ CSV -> JSON subtitle converter entrypoint.
 
 from __future__ import annotations
 
-from typing import List, Optional
+import functools
+import multiprocessing
+import sys
+from typing import Any, List, Optional
 
 try:
+    from python.core.batch import dispatch_batch_flags as _core_dispatch_batch_flags
     from python.core.cli_runner import run_cli as _core_run_cli
     from python.core.converter_engine import (
         _normalize_header_map,
@@ -20,10 +24,14 @@ try:
         safe_int,
     )
     from python.core.optional_tools import (
+        DeferredTool as _CoreDeferredTool,
         load_layer_config_converter as _core_load_layer_config_converter,
         load_media_tools as _core_load_media_tools,
     )
+    from python.core.serve import dispatch_serve_flags as _core_dispatch_serve_flags
+    from python.core.watch import dispatch_watch_flags as _core_dispatch_watch_flags
 except ModuleNotFoundError:
+    from core.batch import dispatch_batch_flags as _core_dispatch_batch_flags
     from core.cli_runner import run_cli as _core_run_cli
     from core.converter_engine import (
         _normalize_header_map,
@@ -36,14 +44,35 @@ except ModuleNotFoundError:
         safe_int,
     )
     from core.optional_tools import (
+        DeferredTool as _CoreDeferredTool,
         load_layer_config_converter as _core_load_layer_config_converter,
         load_media_tools as _core_load_media_tools,
     )
+    from core.serve import dispatch_serve_flags as _core_dispatch_serve_flags
+    from core.watch import dispatch_watch_flags as _core_dispatch_watch_flags
 
-media_read_csv, media_group_by_country_language, media_convert_rows = (
-    _core_load_media_tools(__file__)
+_MEDIA_TOOL_NAMES = (
+    "media_read_csv",
+    "media_group_by_country_language",
+    "media_convert_rows",
 )
-layercfg_convert_workbook = _core_load_layer_config_converter(__file__)
+
+
+def __getattr__(name: str) -> Any:
+    # Media/layer-config tools (and openpyxl behind them) load on first
+    # access, so plain CSV runs never import them.
+    if name in _MEDIA_TOOL_NAMES:
+        globals().update(zip(_MEDIA_TOOL_NAMES, _core_load_media_tools(__file__)))
+        return globals()[name]
+    if name == "layercfg_convert_workbook":
+        globals()[name] = _core_load_layer_config_converter(__file__)
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _deferred_tool(name: str) -> Any:
+    return _CoreDeferredTool(functools.partial(getattr, sys.modules[__name__], name))
+
 
 # Public compatibility surface retained for legacy imports.
 __all__ = [
@@ -59,17 +88,36 @@ __all__ = [
 ]
 
 
-def main(argv: Optional[List[str]] = None) -> int:
+def _run(argv: Optional[List[str]] = None) -> int:
     return _core_run_cli(
         argv,
         convert_csv_to_json=convert_csv_to_json,
         script_file_path=__file__,
-        layercfg_convert_workbook=layercfg_convert_workbook,
-        media_read_csv=media_read_csv,
-        media_group_by_country_language=media_group_by_country_language,
-        media_convert_rows=media_convert_rows,
+        layercfg_convert_workbook=_deferred_tool("layercfg_convert_workbook"),
+        media_read_csv=_deferred_tool("media_read_csv"),
+        media_group_by_country_language=_deferred_tool(
+            "media_group_by_country_language"
+        ),
+        media_convert_rows=_deferred_tool("media_convert_rows"),
     )
 
 
+def main(argv: Optional[List[str]] = None) -> int:
+    args_list = sys.argv[1:] if argv is None else list(argv)
+    served = _core_dispatch_serve_flags(args_list, _run)
+    if served is not None:
+        return served
+    batched = _core_dispatch_batch_flags(args_list, _run)
+    if batched is not None:
+        return batched
+    watched = _core_dispatch_watch_flags(args_list, _run)
+    if watched is not None:
+        return watched
+    return _run(argv)
+
+
 if __name__ == "__main__":
+    # --jobs/--batch-jobs/--check pools start worker processes; in the frozen
+    # (PyInstaller) build they must not re-run main().
+    multiprocessing.freeze_support()
     raise SystemExit(main())
@@ -0,0 +1,35 @@
+"""Shared input fixtures for the json_converter CLI tests."""
+
+import contextlib
+import os
+import tempfile
+from typing import Iterator, Sequence, Tuple
+
+UNIFIED_HEADER = (
+    "record_type;video_id;line;start;end;key;is_global;country_scope;metadata"
+)
+
+
+def unified_csv(countries: Sequence[str], *rows: str) -> str:
+    """Semicolon unified CSV: header with one text column per entry of ``countries``."""
+    return "".join(
+        f"{line}\n" for line in (";".join([UNIFIED_HEADER, *countries]), *rows)
+    )
+
+
+# Smallest two-country sheet: one fps row and one subtitle (GBL "a", FRA "b").
+GBL_FRA_CSV = unified_csv(
+    ("GBL", "FRA"),
+    "meta_global;;;;;fps;Y;ALL;25;;",
+    "sub;V1;1;00:00:00:00;00:00:01:00;;;;;a;b",
+)
+
+
+@contextlib.contextmanager
+def csv_input(content: str, name: str = "in.csv") -> Iterator[Tuple[str, str]]:
+    """Write ``content`` into a fresh temp dir; yields ``(csv_path, temp_dir)``."""
+    with tempfile.TemporaryDirectory() as td:
+        path = os.path.join(td, name)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(content)
+        yield path, td
@@ -192,3 +192,40 @@ class ControllerTimedKeysTests(unittest.TestCase):
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
+
+
+class RecordDispatchTests(unittest.TestCase):
+    def test_controller_resolution_is_cached(self):
+        from python.core import record_dispatch
+
+        handler = record_dispatch.resolve_record_handler("controller_7")
+        self.assertIs(record_dispatch.resolve_record_handler("controller_7"), handler)
+        self.assertEqual(handler.keywords, {"controller_key": "controller_07"})
+        self.assertIsNone(record_dispatch.resolve_record_handler("unknown_type"))
+
+    def test_register_custom_record_type(self):
+        from python.core import record_dispatch
+
+        seen = []
+
+        def handle_note(state, row, texts, texts_portrait, ctx):
+            seen.append((row.video_id, texts["GBL"], ctx.countries))
+            state.global_meta["note"] = texts["GBL"]
+
+        record_dispatch.register_record_type("Note", handle_note)
+        self.addCleanup(record_dispatch.unregister_record_type, "note")
+        with self.assertRaises(ValueError):
+            record_dispatch.register_record_type("note", handle_note)
+
+        csv_content = (
+            "record_type;video_id;line;start;end;key;is_global;country_scope;metadata;GBL\n"
+            "note;VID_A;;;;;;;;remember\n"
+            "sub;VID_A;1;00:00:00:00;00:00:01:00;;;;;hello\n"
+        )
+        path = tmp_csv(csv_content)
+        try:
+            out = mod.convert_csv_to_json(path, fps=25)
+        finally:
+            os.remove(path)
+        self.assertEqual(seen, [("VID_A", "remember", ["GBL"])])
+        self.assertEqual(out["byCountry"]["GBL"]["metadataGlobal"]["note"], "remember")
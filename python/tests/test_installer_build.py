@@ -52,6 +52,12 @@ class InstallerBuildArgsTests(unittest.TestCase):
         self.assertIn("--hidden-import=openpyxl", args)
         self.assertIn("--hidden-import=python.tools.media_converter", args)
         self.assertIn("--hidden-import=python.tools.config_converter", args)
+        self.assertIn("--hidden-import=python.tools.xlsx_values", args)
+        # Core modules imported lazily (worker pools, optional modes) must be
+        # bundled explicitly.
+        for module_file in sorted((python_dir / "core").glob("*.py")):
+            if module_file.stem != "__init__":
+                self.assertIn(f"--hidden-import=python.core.{module_file.stem}", args)
         self.assertIn(
             f"--runtime-hook={build_root / 'work' / 'runtime_hook_converter_version.py'}",
             args,
@@ -100,6 +106,10 @@ class InstallerBuildArgsTests(unittest.TestCase):
         self.assertIn("--hidden-import=openpyxl", args)
         self.assertIn("--hidden-import=python.tools.config_converter", args)
         self.assertIn("--hidden-import=python.tools.sheet_names_config", args)
+        self.assertIn("--hidden-import=python.tools.xlsx_values", args)
+        self.assertIn(
+            f"--add-data={python_dir / 'tools' / 'xlsx_values.py'}:tools", args
+        )
         self.assertIn("--hidden-import=python.tools.merge_config_into_preset", args)
 
     def test_build_merge_config_into_preset_args_contains_required_paths_and_hidden_imports(
@@ -306,6 +306,55 @@ class LogoAnimFlagTests(unittest.TestCase):
         finally:
             shutil.rmtree(tmpdir, ignore_errors=True)
 
+    def test_overview_disabled_in_split_variant_files(self):
+        """--no-logo-anim-overview also strips the overview from out_<CC>_<LANG>.json variants."""
+        tmpdir = tempfile.mkdtemp(prefix="logo_anim_flag_variants_")
+        try:
+            # BEL has two text pairs (FR/NL variants); GBL only one.
+            csv_path = os.path.join(tmpdir, "variants.csv")
+            csv_content = (
+                "record_type;video_id;line;start;end;key;is_global;country_scope;metadata;GBL;GBL;BEL;BEL;BEL;BEL\n"
+                "meta_global;;;;;schemaVersion;Y;ALL;53;;;;;;\n"
+                "meta_global;;;;;briefVersion;Y;ALL;53;;;;;;\n"
+                "meta_global;;;;;fps;Y;ALL;25;;;;;;\n"
+                "meta_global;;;;;logo_anim_flag;;120;N;;;;;;\n"
+                "meta_global;;;;;language;Y;;;EN;EN;FR;FR;NL;NL\n"
+                "meta_local;WTA_120s;;;;duration;N;ALL;120;;;;;;\n"
+                "sub;WTA_120s;1;00:00:01:00;00:00:02:00;;;;;Hello;;Salut;;Hoi;\n"
+            )
+            with open(csv_path, "w", encoding="utf-8") as f:
+                f.write(csv_content)
+            out_pattern = os.path.join(tmpdir, "out_{country}.json")
+            run(
+                [
+                    sys.executable,
+                    CONVERTER,
+                    csv_path,
+                    os.path.join(tmpdir, "out.json"),
+                    "--split-by-country",
+                    "--output-pattern",
+                    out_pattern,
+                    "--no-logo-anim-overview",
+                ]
+            )
+            for name in ("out_BEL_FR.json", "out_BEL_NL.json", "out_GBL_EN.json"):
+                data = load_json(os.path.join(tmpdir, name))
+                self.assertNotIn(
+                    "logo_anim_flag",
+                    data.get("metadataGlobal", {}),
+                    f"Overview should be removed from {name}",
+                )
+                video = data["videos"][0]
+                self.assertIn(
+                    "logo_anim_flag",
+                    video["metadata"],
+                    f"Per-video flag missing in {name}",
+                )
+            nl = load_json(os.path.join(tmpdir, "out_BEL_NL.json"))
+            self.assertEqual(nl["videos"][0]["subtitles"][0]["text"], "Hoi")
+        finally:
+            shutil.rmtree(tmpdir, ignore_errors=True)
+
     def test_trimmed_overview_no_nested_objects(self):
         tmpdir = tempfile.mkdtemp(prefix="logo_anim_flag_trim_")
         try:
@@ -11,6 +11,7 @@ except Exception:
     Workbook = None
 
 from python import json_converter as mod
+from python.core import workbook_cache
 from python.tools.sheet_names_config import SHEETS_BY_KEY
 
 ITEMS_SHEET = SHEETS_BY_KEY["LAYER_NAME_CONFIG_items"].default_sheet_name
@@ -234,6 +235,78 @@ class MediaIntegrationTests(unittest.TestCase):
             except Exception:
                 pass
 
+    @unittest.skipUnless(Workbook is not None, "openpyxl is required for XLSX tests")
+    def test_campaign_workbook_parsed_once_for_data_media_and_layer_config(self):
+        path = tmp_file(".xlsx")
+        self._write_layer_config_xlsx(path)
+        from openpyxl import load_workbook
+
+        wb = load_workbook(path)
+        ws_data = wb.create_sheet("data")
+        for row in (
+            "record_type;video_id;line;start;end;key;is_global;country_scope;metadata;GBL",
+            "meta_global;;;;;briefVersion;Y;ALL;6;",
+            "meta_global;;;;;fps;Y;ALL;25;",
+            "meta_local;V;;;;title;N;ALL;T;",
+            "sub;V;1;00:00:00:00;00:00:01:00;;;;;x",
+        ):
+            ws_data.append(row.split(";"))
+        ws_media = wb.create_sheet("media")
+        ws_media.append(
+            [
+                "AspectRatio",
+                "Dimensions",
+                "Creative",
+                "Media",
+                "Template",
+                "Template_name",
+                "Country",
+                "Language",
+            ]
+        )
+        ws_media.append(["1x1", "640x640", "06sC1", "TikTok", "regular", "", "GBL", ""])
+        wb.save(path)
+        wb.close()
+
+        try:
+            with (
+                tempfile.TemporaryDirectory() as td,
+                mock.patch.object(
+                    workbook_cache,
+                    "_read_sheet_rows",
+                    wraps=workbook_cache._read_sheet_rows,
+                ) as read_sheet,
+            ):
+                rc = mod.main(
+                    [
+                        path,
+                        os.path.join(td, "out-{country}.json"),
+                        "--split-by-country",
+                        "--media-config",
+                        path,
+                        "--layer-config",
+                        path,
+                    ]
+                )
+                self.assertEqual(rc, 0)
+                # Media and layer sheets are parsed once each; the data
+                # sheet is streamed and never kept.
+                read_titles = [c.args[1] for c in read_sheet.call_args_list]
+                self.assertNotIn("data", read_titles)
+                self.assertEqual(len(read_titles), len(set(read_titles)))
+                self.assertIn("media", read_titles)
+                with open(os.path.join(td, "out-GBL.json"), encoding="utf-8") as f:
+                    payload = json.load(f)
+                add_layers = payload["config"]["addLayers"]
+                self.assertEqual(add_layers["TIMING_BEHAVIOR"].get("logo"), "timed")
+                self.assertEqual(payload["videos"][0]["subtitles"][0]["text"], "x")
+                self.assertIn(
+                    "1x1|06s", payload["config"]["pack"]["EXTRA_OUTPUT_COMPS"]
+                )
+        finally:
+            workbook_cache.clear_workbook_cache()
+            os.remove(path)
+
     @unittest.skipUnless(Workbook is not None, "openpyxl is required for XLSX tests")
     def test_layer_config_replaces_existing_add_layers(self):
         csv_content = (
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import builtins
 import importlib
+import subprocess
+import sys
 from pathlib import Path
 
 from python.core.optional_tools import load_layer_config_converter
@@ -55,3 +57,33 @@ def test_load_layer_config_converter_missing_file_returns_none(monkeypatch):
 
     converter = load_layer_config_converter("/tmp/does/not/exist/json_converter.py")
     assert converter is None
+
+
+def test_csv_conversion_never_imports_openpyxl(tmp_path):
+    """CSV runs and importing the XLSX-capable tools must not load openpyxl."""
+    repo_root = Path(__file__).resolve().parents[2]
+    in_csv = tmp_path / "in.csv"
+    in_csv.write_text(
+        "record_type;video_id;line;start;end;key;is_global;country_scope;metadata;GBL\n"
+        "meta_global;;;;;fps;Y;ALL;25;\n"
+        "sub;V;1;00:00:00:00;00:00:01:00;;;;;hello\n",
+        encoding="utf-8",
+    )
+    script = (
+        "import sys\n"
+        "from python import json_converter\n"
+        "import python.tools.media_converter, python.tools.config_converter\n"
+        "import python.tools.xlsx_styling, python.tools.srt_csv.xlsx_output\n"
+        "import python.tools.srt_csv.csv_to_srt\n"
+        f"rc = json_converter.main([{str(in_csv)!r}, {str(tmp_path / 'out.json')!r}])\n"
+        "loaded = sorted(m for m in sys.modules if m.split('.')[0] == 'openpyxl')\n"
+        "print(rc, loaded)\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=repo_root,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip().splitlines()[-1] == "0 []"
@@ -3,6 +3,7 @@ import tempfile
 import subprocess
 import sys
 import math
+import pstats
 
 import pytest
 
@@ -463,3 +464,32 @@ def test_xlsx_template_flag_invalid_path_reports_clear_error():
             os.rmdir(in_dir)
         except Exception:
             pass
+
+
+def test_profile_and_trace_memory_flags(tmp_path):
+    srt = tmp_path / "a.srt"
+    srt.write_text("1\n00:00:00,000 --> 00:00:01,000\nHello\n", encoding="utf-8")
+    out_csv = tmp_path / "a.csv"
+    prof = tmp_path / "run.prof"
+    proc = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "python.tools.srt_to_csv",
+            str(srt),
+            str(out_csv),
+            "--profile",
+            str(prof),
+            "--trace-memory",
+        ],
+        capture_output=True,
+        text=True,
+    )
+    assert proc.returncode == 0, proc.stderr
+    assert out_csv.read_text(encoding="utf-8").splitlines()[0] == (
+        "Start Time,End Time,Text"
+    )
+    assert f"Profile written to {prof}" in proc.stderr
+    assert "Memory => peak=" in proc.stderr
+    assert "\n  run:\n" in proc.stderr
+    assert pstats.Stats(str(prof)).total_calls > 0  # type: ignore[attr-defined]
@@ -3,6 +3,10 @@ import subprocess
 import sys
 import tempfile
 
+import pytest
+
+from python.tools.srt_csv.csv_to_srt import _rows_to_reverse_records
+
 
 def _write(path: str, content: str) -> None:
     with open(path, "w", encoding="utf-8", newline="") as f:
@@ -468,3 +472,20 @@ def test_reverse_joined_multi_country_emits_marker_and_iso_suffixes():
                 os.rmdir(folder)
             except Exception:
                 pass
+
+
+def test_reverse_frames_rows_reject_non_frame_timecodes():
+    rows = [
+        ["00:00:01:00", "00:00:02:00", "a"],
+        ["00:00:03:00", "00:00:04:12", "b"],
+    ]
+    assert _rows_to_reverse_records(rows, 0, 1, 2, "frames", 25.0) == [
+        (1.0, 2.0, "a"),
+        (3.0, 4.48, "b"),
+    ]
+
+    # Seconds and HH:MM:SS tokens are valid for the batch parser but not in
+    # a frames file: they must still raise instead of converting quietly.
+    for bad_row in (["3", "4.5", "b"], ["00:00:05:00", "00:00:06", "c"]):
+        with pytest.raises(ValueError):
+            _rows_to_reverse_records([rows[0], bad_row], 0, 1, 2, "frames", 25.0)
@@ -0,0 +1,71 @@
+import contextlib
+import io
+import json
+import os
+import unittest
+
+from python import json_converter as mod
+from python.tests.cli_fixtures import GBL_FRA_CSV, csv_input
+
+
+class BatchModeTests(unittest.TestCase):
+    def test_batch_mode_converts_manifest_and_glob_inputs(self):
+        with csv_input(GBL_FRA_CSV, "a.csv") as (a_path, td):
+            with open(os.path.join(td, "b.csv"), "w", encoding="utf-8") as f:
+                f.write(GBL_FRA_CSV)
+            manifest = os.path.join(td, "manifest.json")
+            with open(manifest, "w", encoding="utf-8") as f:
+                json.dump(
+                    [
+                        [a_path, os.path.join(td, "a.json")],
+                        {
+                            "argv": ["missing.csv", "m.json"],
+                            "cwd": td,
+                        },
+                    ],
+                    f,
+                )
+            out, err = io.StringIO(), io.StringIO()
+            with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+                rc = mod.main(["--batch-manifest", manifest])
+            self.assertEqual(rc, 1)
+            self.assertEqual(
+                out.getvalue().splitlines(),
+                [
+                    f"[1/2] {a_path}",
+                    "Conversion complete: Files written: 1, Errors: 0",
+                    "[2/2] missing.csv",
+                    "Conversion complete: Files written: 0, Errors: 1",
+                    "Batch complete: Inputs: 2, Failed: 1, Files written: 1, Errors: 1",
+                ],
+            )
+            self.assertIn("missing.csv", err.getvalue())
+
+            out = io.StringIO()
+            with contextlib.redirect_stdout(out):
+                rc = mod.main(
+                    [
+                        "--batch-glob",
+                        os.path.join(td, "*.csv"),
+                        "--batch-jobs",
+                        "2",
+                        os.path.join(td, "out", "{stem}_{country}.json"),
+                        "--split-by-country",
+                    ]
+                )
+            self.assertEqual(rc, 0)
+            lines = out.getvalue().splitlines()
+            self.assertEqual(lines[0], f"[1/2] {a_path}")
+            self.assertEqual(lines[2], f"[2/2] {os.path.join(td, 'b.csv')}")
+            self.assertEqual(
+                lines[-1],
+                "Batch complete: Inputs: 2, Failed: 0, Files written: 4, Errors: 0",
+            )
+            self.assertEqual(
+                sorted(os.listdir(os.path.join(td, "out"))),
+                ["a_FRA.json", "a_GBL.json", "b_FRA.json", "b_GBL.json"],
+            )
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
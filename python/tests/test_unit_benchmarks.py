@@ -0,0 +1,66 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from python.benchmarks import bench_converter
+from python.benchmarks.synthetic import SheetSpec, write_unified_sheet
+from python.core.converter_engine import convert_csv_to_json
+
+SMALL_SPEC = SheetSpec(rows=120, countries=3, variants=2, videos=3, controller_keys=2)
+
+
+class BenchmarkSuiteTests(unittest.TestCase):
+    def test_stage_pipeline_matches_converter_output(self):
+        with tempfile.TemporaryDirectory() as td:
+            sheet = write_unified_sheet(os.path.join(td, "sheet.csv"), SMALL_SPEC)
+            expected = convert_csv_to_json(sheet, all_variants=True)
+
+            headers, rows, _delim = bench_converter._read_table(sheet)
+            parsed = bench_converter._stage_rows(headers, rows)
+            merged = bench_converter._stage_merge(parsed)
+            payloads = bench_converter._stage_build(parsed, merged)
+
+        self.assertEqual(len(payloads), 6)
+        for country, vi, payload in payloads:
+            if vi == 0:
+                self.assertEqual(payload, expected["byCountry"][country])
+            else:
+                self.assertEqual(payload, expected["_variantsByIndex"][vi][country])
+        self.assertEqual(bench_converter._stage_validate(payloads), 0)
+
+    def test_generator_is_deterministic(self):
+        with tempfile.TemporaryDirectory() as td:
+            a = write_unified_sheet(os.path.join(td, "a.csv"), SMALL_SPEC)
+            b = write_unified_sheet(os.path.join(td, "b.csv"), SMALL_SPEC)
+            with open(a, "rb") as fa, open(b, "rb") as fb:
+                self.assertEqual(fa.read(), fb.read())
+
+    def test_baseline_comparison_flags_regressions(self):
+        with tempfile.TemporaryDirectory() as td:
+            baseline_path = os.path.join(td, "baseline.json")
+            tiny = ["--rows", "20", "--countries", "2", "--repeat", "1"]
+            with mock.patch("builtins.print"):
+                rc = bench_converter.main(
+                    tiny + ["--baseline", baseline_path, "--update-baseline"]
+                )
+            self.assertEqual(rc, 0)
+            with open(baseline_path, encoding="utf-8") as f:
+                baselines = json.load(f)
+            (key,) = baselines
+            stored = baselines[key]
+            self.assertEqual(set(stored["stages"]), set(bench_converter.STAGES))
+
+            slower = json.loads(json.dumps(stored))
+            slower["stages"]["build"]["median"] = (
+                stored["stages"]["build"]["median"] * 2 + 0.01
+            )
+            regressions = bench_converter.compare_to_baseline(slower, stored)
+            self.assertEqual(len(regressions), 1)
+            self.assertTrue(regressions[0].startswith("build:"))
+            self.assertEqual(bench_converter.compare_to_baseline(stored, stored), [])
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -1,9 +1,14 @@
+import contextlib
+import io
 import os
 import json
 import tempfile
 import unittest
+from unittest import mock
 
 from python import json_converter as mod
+from python.core import converter_engine, unified_processors
+from python.tests.cli_fixtures import csv_input, unified_csv
 
 
 def tmp_csv(content: str) -> str:
@@ -147,6 +152,213 @@ class CliOutputTests(unittest.TestCase):
         finally:
             os.remove(path)
 
+    def test_split_variants_read_input_once(self):
+        # BEL has two orientation pairs (variants); GBL only one.
+        csv_content = (
+            "record_type;video_id;line;start;end;key;is_global;country_scope;metadata;GBL;GBL;BEL;BEL;BEL;BEL\n"
+            "meta_global;;;;;briefVersion;Y;ALL;53;;;;;;\n"
+            "meta_global;;;;;fps;Y;ALL;25;;;;;;\n"
+            "meta_global;;;;;language;Y;;;EN;EN;FR;FR;NL;NL\n"
+            "sub;V5;1;00:00:00:00;00:00:01:00;;;;;hi;;salut;;hoi;\n"
+        )
+        real_stream_table = converter_engine._stream_table
+        with csv_input(csv_content) as (path, td):
+            out = os.path.join(td, "out.json")
+            with mock.patch.object(
+                converter_engine, "_stream_table", side_effect=real_stream_table
+            ) as read_spy:
+                rc = mod.main([path, out, "--split-by-country", "--no-generation-meta"])
+            self.assertEqual(rc, 0)
+            self.assertEqual(read_spy.call_count, 1)
+            with open(os.path.join(td, "out_BEL_NL.json"), encoding="utf-8") as f:
+                bel_nl = json.load(f)
+            expected = mod.convert_csv_to_json(
+                path, country_variant_index=1, schema_version="v2"
+            )
+            self.assertEqual(bel_nl, expected["byCountry"]["BEL"])
+            self.assertEqual(bel_nl["videos"][0]["subtitles"][0]["text"], "hoi")
+            self.assertTrue(os.path.isfile(os.path.join(td, "out_BEL_FR.json")))
+            self.assertTrue(os.path.isfile(os.path.join(td, "out_GBL_EN.json")))
+
+    def test_single_country_export_builds_only_selected_payload(self):
+        csv_content = (
+            "record_type;video_id;line;start;end;key;is_global;country_scope;metadata;GBL;FRA;DEU\n"
+            "meta_global;;;;;briefVersion;Y;ALL;53;;;\n"
+            "meta_global;;;;;fps;Y;ALL;25;;;\n"
+            "sub;V6;1;00:00:00:00;00:00:01:00;;;;;a;b;c\n"
+        )
+        real_build = unified_processors.build_country_payload
+        with csv_input(csv_content) as (path, td):
+            out = os.path.join(td, "out.json")
+            with mock.patch.object(
+                unified_processors, "build_country_payload", side_effect=real_build
+            ) as build_spy:
+                rc = mod.main([path, out, "--country-column", "2"])
+            self.assertEqual(rc, 0)
+            self.assertEqual(build_spy.call_count, 1)
+            self.assertEqual(build_spy.call_args.kwargs["country_code"], "FRA")
+            with open(out, encoding="utf-8") as f:
+                data = json.load(f)
+            self.assertEqual(data["metadataGlobal"]["country"], "FRA")
+            # Generation metadata is applied when the payload is built.
+            self.assertIn("generatedAt", data["metadataGlobal"])
+
+    def test_split_with_jobs_matches_serial_output(self):
+        csv_content = (
+            "record_type;video_id;line;start;end;key;is_global;country_scope;metadata;GBL;GBL;BEL;BEL;BEL;BEL;DEU;DEU\n"
+            "meta_global;;;;;briefVersion;Y;ALL;53;;;;;;;;\n"
+            "meta_global;;;;;fps;Y;ALL;25;;;;;;;;\n"
+            "meta_global;;;;;language;Y;;;EN;EN;FR;FR;NL;NL;DE;DE\n"
+            "sub;V7;1;00:00:00:00;00:00:01:00;;;;;hi;;salut;;hoi;;hallo;\n"
+            "claim;;1;00:00:01:00;00:00:02:00;;;ALL;;C;;;;;;;\n"
+        )
+        with csv_input(csv_content) as (path, _):
+            outputs = {}
+            for jobs in ("1", "2"):
+                with tempfile.TemporaryDirectory() as td:
+                    out = os.path.join(td, "out.json")
+                    rc = mod.main(
+                        [
+                            path,
+                            out,
+                            "--split-by-country",
+                            "--sample",
+                            "--no-generation-meta",
+                            "--jobs",
+                            jobs,
+                        ]
+                    )
+                    self.assertEqual(rc, 0)
+                    files = {}
+                    for name in sorted(os.listdir(td)):
+                        with open(os.path.join(td, name), encoding="utf-8") as f:
+                            files[name] = f.read()
+                    outputs[jobs] = files
+            self.assertEqual(outputs["1"], outputs["2"])
+            self.assertIn("out_BEL_NL.json", outputs["2"])
+            self.assertIn("out_DEU_DE_sample.json", outputs["2"])
+
+    def test_check_with_jobs_matches_serial_check(self):
+        csv_content = (
+            "record_type;video_id;line;start;end;key;is_global;country_scope;metadata;GBL;GBL;BEL;BEL;DEU;DEU\n"
+            "meta_global;;;;;briefVersion;Y;ALL;53;;;;;;\n"
+            "meta_global;;;;;fps;Y;ALL;25;;;;;;\n"
+            "sub;V7;1;00:00:00:00;00:00:01:00;;;;;hi;;salut;;hallo;\n"
+            "sub;V7;2;00:00:00:12;00:00:02:00;;;;;;;;;wieder;\n"
+        )
+        with csv_input(csv_content) as (path, _):
+            stdout = {}
+            reports = {}
+            for jobs in ("1", "2"):
+                with tempfile.TemporaryDirectory() as td:
+                    report_path = os.path.join(td, "report.json")
+                    buf = io.StringIO()
+                    with contextlib.redirect_stdout(buf):
+                        rc = mod.main(
+                            [
+                                path,
+                                os.path.join(td, "out.json"),
+                                "--split-by-country",
+                                "--check",
+                                "--validation-report",
+                                report_path,
+                                "--jobs",
+                                jobs,
+                            ]
+                        )
+                    self.assertEqual(rc, 0)
+                    self.assertEqual(os.listdir(td), ["report.json"])
+                    stdout[jobs] = buf.getvalue().replace(td, "TD")
+                    with open(report_path, encoding="utf-8") as f:
+                        reports[jobs] = json.load(f)
+            self.assertEqual(stdout["1"], stdout["2"])
+            self.assertIn("DEU: videos[0].subtitles[1] overlaps previous", stdout["2"])
+            for report in reports.values():
+                self.assertEqual(
+                    [c["country"] for c in report["countries"]], ["GBL", "BEL", "DEU"]
+                )
+                for country in report["countries"]:
+                    timings = country.pop("timings")
+                    self.assertGreaterEqual(timings["buildSeconds"], 0)
+                    self.assertGreaterEqual(timings["validateSeconds"], 0)
+            self.assertEqual(reports["1"], reports["2"])
+            self.assertEqual(reports["2"]["summary"]["errors"], 2)
+
+    def test_jobs_must_be_positive(self):
+        with self.assertRaises(SystemExit):
+            mod.main(["in.csv", "out.json", "--jobs", "0"])
+
+    def test_only_countries_requires_split_by_country(self):
+        err = io.StringIO()
+        with contextlib.redirect_stderr(err), self.assertRaises(SystemExit) as cm:
+            mod.main(["in.csv", "out.json", "--only-countries", "DEU"])
+        self.assertEqual(cm.exception.code, 2)
+        self.assertIn("--only-countries requires --split-by-country", err.getvalue())
+
+    def test_skip_unchanged_uses_build_cache(self):
+        csv_content = (
+            "record_type;video_id;line;start;end;key;is_global;country_scope;metadata;GBL;FRA;DEU\n"
+            "meta_global;;;;;briefVersion;Y;ALL;53;;;\n"
+            "meta_global;;;;;fps;Y;ALL;25;;;\n"
+            "sub;V8;1;00:00:00:00;00:00:01:00;;;;;a;b;c\n"
+        )
+        with csv_input(csv_content) as (path, _):
+            with tempfile.TemporaryDirectory() as td:
+                out = os.path.join(td, "out.json")
+                argv = [path, out, "--split-by-country", "--skip-unchanged"]
+                with mock.patch("builtins.print") as first:
+                    self.assertEqual(mod.main(argv), 0)
+                first.assert_any_call(
+                    "Conversion complete: Files written: 3, Errors: 0"
+                )
+                self.assertTrue(
+                    os.path.isfile(os.path.join(td, ".json_converter_cache.json"))
+                )
+
+                with mock.patch.object(converter_engine, "_stream_table") as read:
+                    with mock.patch("builtins.print") as second:
+                        self.assertEqual(mod.main(argv + ["--jobs", "2"]), 0)
+                read.assert_not_called()
+                second.assert_any_call(
+                    "Conversion complete: Files written: 0, Errors: 0"
+                )
+
+                # Only the country whose content changed is rewritten.
+                with open(path, "w", encoding="utf-8") as f:
+                    f.write(csv_content.replace(";a;b;c", ";a;B;c"))
+                gbl_path = os.path.join(td, "out_GBL.json")
+                os.utime(gbl_path, (1, 1))
+                with mock.patch("builtins.print") as third:
+                    self.assertEqual(mod.main(argv), 0)
+                third.assert_any_call(
+                    "Conversion complete: Files written: 1, Errors: 0"
+                )
+                self.assertEqual(os.path.getmtime(gbl_path), 1)
+                with open(os.path.join(td, "out_FRA.json"), encoding="utf-8") as f:
+                    fra = json.load(f)
+                self.assertEqual(fra["videos"][0]["subtitles"][0]["text"], "B")
+
+    def test_only_countries_run_keeps_other_build_cache_entries(self):
+        csv_content = unified_csv(
+            ("GBL", "FRA", "DEU"),
+            "meta_global;;;;;fps;Y;ALL;25;;;",
+            "sub;V8;1;00:00:00:00;00:00:01:00;;;;;a;b;c",
+        )
+        with csv_input(csv_content) as (path, _):
+            with tempfile.TemporaryDirectory() as td:
+                out = os.path.join(td, "out.json")
+                argv = [path, out, "--split-by-country", "--skip-unchanged"]
+                with mock.patch("builtins.print"):
+                    self.assertEqual(mod.main(argv), 0)
+                    self.assertEqual(mod.main(argv + ["--only-countries", "FRA"]), 0)
+                gbl_path = os.path.join(td, "out_GBL.json")
+                os.utime(gbl_path, (1, 1))
+                # The full run still knows GBL's fingerprint and skips it.
+                with mock.patch("builtins.print") as full:
+                    self.assertEqual(mod.main(argv), 0)
+                full.assert_any_call("Conversion complete: Files written: 0, Errors: 0")
+                self.assertEqual(os.path.getmtime(gbl_path), 1)
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
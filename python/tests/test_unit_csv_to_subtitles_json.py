@@ -1,13 +1,20 @@
+import math
 import os
 import tempfile
 import unittest
+from datetime import datetime
+from unittest import mock
 
 try:
-    from openpyxl import Workbook
+    from openpyxl import Workbook, load_workbook
 except Exception:
     Workbook = None
 
 from python import json_converter as mod
+from python.core.table_reader import _stream_table
+from python.core import timecode, workbook_cache, xlsx_reader
+from python.core.timecode import clear_timecode_cache, parse_timecodes
+from python.core.unified_row_plan import build_unified_row_plan
 
 
 class ParseTimecodeTests(unittest.TestCase):
@@ -34,6 +41,36 @@ class ParseTimecodeTests(unittest.TestCase):
         with self.assertRaises(ValueError):
             mod.parse_timecode("bad:format", 25)
 
+    def test_fast_path_and_cache_keep_semantics(self):
+        clear_timecode_cache()
+        self.assertEqual(mod.parse_timecode("01;02;03;05", 25), 3723.2)
+        self.assertEqual(mod.parse_timecode("1:02:03:05", 25), 3723.2)
+        # Same value, different fps must not share a cache entry.
+        self.assertEqual(mod.parse_timecode("00:00:01:12", 24), 1.5)
+        self.assertEqual(mod.parse_timecode("00:00:01:12", 25), 1.48)
+        for _ in range(2):
+            with self.assertRaisesRegex(ValueError, "fps must be > 0"):
+                mod.parse_timecode("00:00:01:12", 0)
+            with self.assertRaises(ValueError):
+                mod.parse_timecode("00:00:0x:12", 25)
+
+    def test_parse_timecodes_batch_reports_invalid_mask(self):
+        values = ["00:00:01:12", " 01;02;03;05 ", "12,5", "", "bad", None, "02:03.5"]
+        backends = ["python"] + (["numpy"] if timecode._np is not None else [])
+        for backend in backends:
+            batch = parse_timecodes(values, 24, backend=backend)
+            self.assertEqual(
+                batch.invalid, [False, False, False, True, True, True, False]
+            )
+            for value, seconds, invalid in zip(values, batch.seconds, batch.invalid):
+                if invalid:
+                    self.assertTrue(math.isnan(seconds))
+                else:
+                    self.assertEqual(seconds, mod.parse_timecode(value, 24))
+        self.assertTrue(all(parse_timecodes(values[:2], 0).invalid))
+        with self.assertRaises(ValueError):
+            parse_timecodes(values, 24, backend="gpu")
+
 
 class SniffDelimiterTests(unittest.TestCase):
     def test_preferred_named_mapping(self):
@@ -82,6 +119,107 @@ class ConvertMinimalTests(unittest.TestCase):
             os.remove(path)
 
 
+class StreamTableTests(unittest.TestCase):
+    def test_stream_matches_read_table_and_closes(self):
+        csv_content = "a;b;c\n1;2;3\n4;5\n"
+        with tempfile.NamedTemporaryFile("w+", delete=False, suffix=".csv") as f:
+            f.write(csv_content)
+            path = f.name
+        try:
+            headers, rows, delim = mod._read_table(path)
+            with _stream_table(path) as table:
+                self.assertEqual(table.headers, headers)
+                self.assertEqual(table.delimiter, delim)
+                rows_iter = iter(table)
+                self.assertEqual(next(rows_iter), rows[0])
+                self.assertEqual(list(rows_iter), rows[1:])
+            with self.assertRaises(ValueError):
+                next(iter(table))
+        finally:
+            os.remove(path)
+
+    def test_unified_fps_row_after_timed_rows(self):
+        # The meta_global fps row comes after a timed row; it must still apply.
+        csv_content = (
+            "record_type;video_id;line;start;end;key;is_global;country_scope;metadata;GBL\n"
+            "sub;V;1;00:00:01:25;00:00:02:00;;;;;hello\n"
+            "meta_global;;;;;fps;Y;ALL;50;\n"
+        )
+        with tempfile.NamedTemporaryFile("w+", delete=False, suffix=".csv") as f:
+            f.write(csv_content)
+            path = f.name
+        try:
+            out = mod.convert_csv_to_json(path)
+        finally:
+            os.remove(path)
+        sub = out["byCountry"]["GBL"]["videos"][0]["subtitles"][0]
+        self.assertEqual(sub["in"], 1.5)
+
+
+class UnifiedRowPlanTests(unittest.TestCase):
+    HEADERS = [
+        "record_type",
+        "video_id",
+        "line",
+        "start",
+        "end",
+        "key",
+        "is_global",
+        "country_scope",
+        "metadata",
+        "GBR",
+        "GBR",
+        "DEU",
+        "DEU",
+        "DEU",
+        "DEU",
+    ]
+
+    def test_non_unified_headers(self):
+        self.assertIsNone(build_unified_row_plan(["Start Time", "End Time", "Text"]))
+
+    def test_columns_and_variants(self):
+        plan = build_unified_row_plan(self.HEADERS)
+        self.assertEqual(plan.countries, ("GBR", "DEU"))
+        self.assertEqual(plan.country_variant_counts, {"GBR": 1, "DEU": 2})
+        self.assertIsNone(plan.indices["target_duration"])
+        self.assertEqual(
+            plan.text_plan(1).orientation_cols(),
+            {
+                "GBR": {"landscape": 9, "portrait": 10},
+                "DEU": {"landscape": 13, "portrait": 14},
+            },
+        )
+
+    def test_extract_pads_and_parses(self):
+        plan = build_unified_row_plan(self.HEADERS)
+        row = plan.extract(
+            [" SUB ", "V1", "3", "00:00:01:00", "", "", "", " all ", "", "hi\r "],
+            lambda v: mod.parse_timecode(v, 25.0),
+        )
+        self.assertEqual(row.record_type, "sub")
+        self.assertEqual(row.line_num, 3)
+        self.assertEqual(row.start_tc, 1.0)
+        self.assertIsNone(row.end_tc)
+        self.assertEqual(row.target_duration, "")
+        self.assertEqual((row.country_scope_raw, row.country_scope), ("all", "ALL"))
+        self.assertEqual(len(row.cells), len(self.HEADERS))
+        texts, texts_portrait = plan.text_plan(0).collect(row.cells)
+        self.assertEqual(texts, {"GBR": "hi", "DEU": ""})
+        self.assertEqual(texts_portrait, {"GBR": "", "DEU": ""})
+        self.assertIsNone(plan.extract(["", "V1"], lambda v: None))
+
+    def test_meta_global_fps(self):
+        plan = build_unified_row_plan(self.HEADERS)
+        self.assertEqual(
+            plan.meta_global_fps(
+                ["meta_global", "", "", "", "", "fps", "", "", "", "30"]
+            ),
+            30.0,
+        )
+        self.assertIsNone(plan.meta_global_fps(["sub", "", "", "", "", "fps"]))
+
+
 @unittest.skipUnless(Workbook is not None, "openpyxl is required for XLSX tests")
 class ConvertXlsxTests(unittest.TestCase):
     def test_simple_xlsx_convert(self):
@@ -125,6 +263,151 @@ class ConvertXlsxTests(unittest.TestCase):
         finally:
             os.remove(path)
 
+    def test_xlsx_reader_matches_openpyxl_values(self):
+        with tempfile.NamedTemporaryFile(delete=False, suffix=".xlsx") as f:
+            path = f.name
+        try:
+            wb = Workbook()
+            ws = wb.active
+            ws.title = "data"
+            ws.append(["Start Time", "End Time", "Text", "Flag"])
+            ws.append([0, 1.25, "Hello", True])
+            ws.append([])
+            ws.append([2, None, datetime(2024, 5, 6, 7, 8, 9), False])
+            ws["F7"] = "far"
+            wb.save(path)
+            wb.close()
+
+            expected_wb = load_workbook(path, read_only=True, data_only=True)
+            fast_wb = xlsx_reader.load_workbook(path)
+            try:
+                self.assertEqual(fast_wb.sheetnames, expected_wb.sheetnames)
+                self.assertEqual(
+                    list(fast_wb["data"].iter_rows(values_only=True)),
+                    list(expected_wb["data"].iter_rows(values_only=True)),
+                )
+            finally:
+                fast_wb.close()
+                expected_wb.close()
+        finally:
+            os.remove(path)
+
+    def test_stream_table_falls_back_to_openpyxl(self):
+        with tempfile.NamedTemporaryFile(delete=False, suffix=".xlsx") as f:
+            path = f.name
+        try:
+            wb = Workbook()
+            ws = wb.active
+            ws.title = "data"
+            ws.append(["Start Time", "End Time", "Text"])
+            ws.append([0, 1.5, "Fallback"])
+            wb.save(path)
+            wb.close()
+
+            fast = _stream_table(path)
+            with fast:
+                fast_rows = [fast.headers] + list(fast)
+            unsupported = xlsx_reader.XlsxUnsupportedError("strict OOXML")
+            with mock.patch.object(
+                xlsx_reader, "load_workbook", side_effect=unsupported
+            ):
+                slow = _stream_table(path)
+                with slow:
+                    slow_rows = [slow.headers] + list(slow)
+            self.assertEqual(fast_rows, slow_rows)
+            self.assertEqual(fast_rows[1], ["0", "1.5", "Fallback"])
+        finally:
+            os.remove(path)
+
+    def test_workbook_cache_reuses_pickled_sheets_until_file_changes(self):
+        with tempfile.TemporaryDirectory() as td:
+            path = os.path.join(td, "brief.xlsx")
+            wb = Workbook()
+            ws = wb.active
+            ws.title = "data"
+            ws.append(["Start Time", "End Time", "Text"])
+            ws.append([0, 1, "Cached"])
+            wb.create_sheet("media").append(["Country"])
+            wb.save(path)
+            wb.close()
+
+            cache_dir = os.path.join(td, "cache")
+            env = {workbook_cache.WORKBOOK_CACHE_ENV: cache_dir}
+            try:
+                with mock.patch.dict(os.environ, env):
+                    first = workbook_cache.open_cached_workbook(path)
+                    self.assertEqual(
+                        list(first["data"].iter_rows(min_row=2)), [(0, 1, "Cached")]
+                    )
+                    first.close()
+                    workbook_cache.clear_workbook_cache()
+                    with mock.patch.object(
+                        workbook_cache,
+                        "open_values_workbook",
+                        side_effect=AssertionError("parsed again"),
+                    ):
+                        reloaded = workbook_cache.open_cached_workbook(path)
+                        self.assertEqual(reloaded.sheetnames, ["data", "media"])
+                        self.assertEqual(
+                            list(reloaded["data"].iter_rows(min_row=2)),
+                            [(0, 1, "Cached")],
+                        )
+                    # Only the sheet that was asked for is cached.
+                    self.assertEqual(
+                        list(reloaded["media"].iter_rows()), [("Country",)]
+                    )
+                    reloaded.close()
+
+                    wb = load_workbook(path)
+                    wb["data"]["C2"] = "Changed text"
+                    wb.save(path)
+                    wb.close()
+                    changed = workbook_cache.open_cached_workbook(path)
+                    self.assertEqual(
+                        list(changed["data"].iter_rows(min_row=2, max_row=2)),
+                        [(0, 1, "Changed text")],
+                    )
+                    changed.close()
+            finally:
+                workbook_cache.clear_workbook_cache()
+
+    def test_workbook_cache_streams_unretained_sheets_and_caps_size(self):
+        with tempfile.TemporaryDirectory() as td:
+            path = os.path.join(td, "brief.xlsx")
+            wb = Workbook()
+            ws = wb.active
+            ws.title = "data"
+            for i in range(50):
+                ws.append([i, f"row {i}"])
+            wb.create_sheet("media").append(["Country"])
+            wb.save(path)
+            wb.close()
+
+            try:
+                streamed = workbook_cache.open_cached_workbook(path, retain=False)
+                self.assertEqual(len(list(streamed["data"].iter_rows())), 50)
+                streamed.close()
+                self.assertNotIn(
+                    (streamed.key, "data"), workbook_cache._MEMO, "data sheet kept"
+                )
+
+                kept = workbook_cache.open_cached_workbook(path)
+                self.assertEqual(len(list(kept["data"].iter_rows())), 50)
+                kept.close()
+                self.assertIn((kept.key, "data"), workbook_cache._MEMO)
+
+                workbook_cache.clear_workbook_cache()
+                with mock.patch.object(workbook_cache, "_MAX_CACHE_BYTES", 2048):
+                    capped = workbook_cache.open_cached_workbook(path)
+                    self.assertEqual(len(list(capped["data"].iter_rows())), 50)
+                    list(capped["media"].iter_rows())
+                    capped.close()
+                    self.assertNotIn((capped.key, "data"), workbook_cache._MEMO)
+                    self.assertIn((capped.key, "media"), workbook_cache._MEMO)
+                    self.assertLessEqual(workbook_cache._memo_bytes, 2048)
+            finally:
+                workbook_cache.clear_workbook_cache()
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
@@ -858,3 +858,41 @@ class FlagsAndMergingTests(unittest.TestCase):
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
+
+
+class TimedTextRowMergeTests(unittest.TestCase):
+    def _row(self, index, line, start, end, land, port):
+        from python.core.unified_processors import CountryTexts, TimedTextRow
+
+        return TimedTextRow(
+            line, start, end, CountryTexts(index, land), CountryTexts(index, port)
+        )
+
+    def test_dedupe_and_disclaimer_merge_on_shared_index(self):
+        from python.core.unified_processors import (
+            deduplicate_rows_by_line_timing,
+            merge_disclaimer_blocks,
+        )
+
+        index = {"GBR": 0, "DEU": 1}
+        rows = [
+            self._row(index, 1, 0.0, 1.0, ["a", ""], ["", "p"]),
+            self._row(index, 1, 0.0, 1.0, ["a", "b"], ["", "q"]),
+        ]
+        deduped = deduplicate_rows_by_line_timing(rows, ["GBR", "DEU"])
+        self.assertEqual(len(deduped), 1)
+        self.assertEqual(deduped[0].texts, {"GBR": "a", "DEU": "b"})
+        self.assertEqual(deduped[0].texts_portrait, {"GBR": "", "DEU": "p\nq"})
+        self.assertIs(deduped[0].texts.index, index)
+        # Source rows are not modified.
+        self.assertEqual(rows[0].texts.cells, ["a", ""])
+
+        discs = [
+            self._row(index, 1, 0.0, 1.0, ["x", "y"], ["", ""]),
+            self._row(index, 2, None, None, ["x2", ""], ["", "yp"]),
+        ]
+        merged = merge_disclaimer_blocks(discs, ["GBR", "DEU"], merge_enabled=True)
+        self.assertEqual(len(merged), 1)
+        self.assertEqual(merged[0].texts.cells, ["x\nx2", "y"])
+        self.assertEqual(merged[0].texts_portrait.cells, ["", "yp"])
+        self.assertEqual(discs[0].texts.cells, ["x", "y"])
@@ -0,0 +1,92 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+
+from python import json_converter as mod
+from python.core.json_stream import dump_json_stream, iter_json_chunks
+
+
+def tmp_csv(content: str) -> str:
+    f = tempfile.NamedTemporaryFile("w+", delete=False, suffix=".csv")
+    f.write(content)
+    f.flush()
+    f.close()
+    return f.name
+
+
+SAMPLE_VALUE = {
+    "metadataGlobal": {"country": "DEU", "fps": 25, "ratio": -0.0, "x": None},
+    "claim": {"landscape": ["Größe ✓", ""], "portrait": []},
+    "empty": {},
+    "videos": [
+        {"videoId": "V_landscape", "subtitles": [{"in": 0.0, "text": 'a\n"b"'}]},
+        {"videoId": "V_portrait", "subtitles": [], "flags": [True, False, 1e20]},
+    ],
+}
+
+
+def _expected(value) -> bytes:
+    return json.dumps(value, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+class JsonStreamTests(unittest.TestCase):
+    def test_plain_values_match_json_dump(self):
+        for value in (SAMPLE_VALUE, [], {}, [[]], "x", 1.5, None):
+            buf = io.StringIO()
+            dump_json_stream(value, buf)
+            self.assertEqual(buf.getvalue().encode("utf-8"), _expected(value))
+
+    def test_generators_are_written_as_arrays(self):
+        def lazy(value):
+            out = dict(value)
+            out["videos"] = (v for v in value["videos"])
+            out["claim"] = {"landscape": iter(value["claim"]["landscape"])}
+            out["empty"] = iter(())
+            return out
+
+        streamed = "".join(iter_json_chunks(lazy(SAMPLE_VALUE))).encode("utf-8")
+        materialized = dict(SAMPLE_VALUE)
+        materialized["claim"] = {"landscape": SAMPLE_VALUE["claim"]["landscape"]}
+        materialized["empty"] = []
+        self.assertEqual(streamed, _expected(materialized))
+
+    def test_split_files_are_byte_identical_to_json_dump(self):
+        csv_content = (
+            "record_type;video_id;line;start;end;key;is_global;country_scope;metadata;GBR;GBR;DEU;DEU\n"
+            "meta_global;;;;;briefVersion;Y;ALL;53;;;;\n"
+            "meta_global;;;;;fps;Y;ALL;25;;;;\n"
+            "meta_local;V;;;;duration;N;ALL;30;;;;\n"
+            "sub;V;1;00:00:00:00;00:00:01:00;;;;;hello;hello p;Grüße;\n"
+            "sub;V;2;00:00:01:00;00:00:02:00;;;ALL;;same;;;\n"
+            "claim;;1;00:00:02:00;00:00:03:00;;;ALL;;C;;;\n"
+            "disclaimer;;1;00:00:02:00;00:00:03:00;;;;;D;;E;\n"
+        )
+        path = tmp_csv(csv_content)
+        try:
+            expected = mod.convert_csv_to_json(path, schema_version="v2")
+            with tempfile.TemporaryDirectory() as td:
+                out = os.path.join(td, "out.json")
+                rc = mod.main(
+                    [
+                        path,
+                        out,
+                        "--split-by-country",
+                        "--no-generation-meta",
+                        "--schema-version",
+                        "v2",
+                    ]
+                )
+                self.assertEqual(rc, 0)
+                for country in ("GBR", "DEU"):
+                    with open(os.path.join(td, f"out_{country}.json"), "rb") as f:
+                        self.assertEqual(
+                            f.read(), _expected(expected["byCountry"][country])
+                        )
+        finally:
+            os.remove(path)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
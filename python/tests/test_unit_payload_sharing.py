@@ -0,0 +1,80 @@
+import json
+import os
+import tempfile
+import unittest
+
+from python import json_converter as mod
+from python.core.payload_sharing import PayloadInterner, detach
+
+
+def tmp_csv(content: str) -> str:
+    f = tempfile.NamedTemporaryFile("w+", delete=False, suffix=".csv")
+    f.write(content)
+    f.flush()
+    f.close()
+    return f.name
+
+
+CSV_CONTENT = (
+    "record_type;video_id;line;start;end;key;is_global;country_scope;metadata;GBR;DEU;FRA\n"
+    "meta_global;;;;;briefVersion;Y;ALL;53;;;\n"
+    "meta_global;;;;;fps;Y;ALL;25;;;\n"
+    "meta_local;V;;;;title;N;ALL;T;;;\n"
+    "sub;V;1;00:00:00:00;00:00:01:00;;;ALL;;same;;\n"
+    "sub;V;2;00:00:01:00;00:00:02:00;;;;;hello;hallo;hello\n"
+    "claim;;1;00:00:02:00;00:00:03:00;;;ALL;;C;;\n"
+)
+
+
+class PayloadSharingTests(unittest.TestCase):
+    def test_shared_payloads_match_and_share_identical_subtrees(self):
+        path = tmp_csv(CSV_CONTENT)
+        try:
+            plain = mod.convert_csv_to_json(path, schema_version="v2")
+            shared = mod.convert_csv_to_json(
+                path, schema_version="v2", shared_payloads=True
+            )
+        finally:
+            os.remove(path)
+
+        self.assertEqual(json.dumps(plain), json.dumps(shared))
+        gbr, deu, fra = (shared["byCountry"][c] for c in ("GBR", "DEU", "FRA"))
+        self.assertIs(gbr["claim"], deu["claim"])
+        self.assertIs(gbr["videos"], fra["videos"])
+        self.assertIsNot(gbr["videos"], deu["videos"])
+        # Country-specific subtitle differs, but the ALL-scope one is shared.
+        self.assertIs(
+            gbr["videos"][0]["subtitles"][0], deu["videos"][0]["subtitles"][0]
+        )
+        self.assertIsNot(gbr["metadataGlobal"], fra["metadataGlobal"])
+
+    def test_detach_copies_before_mutation(self):
+        path = tmp_csv(CSV_CONTENT)
+        try:
+            shared = mod.convert_csv_to_json(
+                path, schema_version="v2", shared_payloads=True
+            )
+        finally:
+            os.remove(path)
+
+        gbr, fra = shared["byCountry"]["GBR"], shared["byCountry"]["FRA"]
+        subs = detach(gbr, "videos", 0, "subtitles")
+        subs[0]["text"] = "changed"
+        self.assertEqual(gbr["videos"][0]["subtitles"][0]["text"], "changed")
+        self.assertEqual(fra["videos"][0]["subtitles"][0]["text"], "same")
+        self.assertIsNot(gbr["videos"], fra["videos"])
+        self.assertIs(gbr["videos"][1], fra["videos"][1])
+
+    def test_interner_keeps_json_distinct_values_apart(self):
+        interner = PayloadInterner()
+        values = interner.intern([0.0, -0.0, 1, 1.0, True, "1", [1], {"a": 1}])
+        self.assertEqual(
+            json.dumps(values), '[0.0, -0.0, 1, 1.0, true, "1", [1], {"a": 1}]'
+        )
+        again = interner.intern([{"a": 1}, [1]])
+        self.assertIs(again[0], values[7])
+        self.assertIs(again[1], values[6])
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,49 @@
+import os
+import pstats
+import unittest
+from unittest import mock
+
+from python import json_converter as mod
+from python.tests.cli_fixtures import GBL_FRA_CSV, csv_input
+
+
+class ProfilingTests(unittest.TestCase):
+    def test_profile_and_trace_memory_report_per_stage(self):
+        with csv_input(GBL_FRA_CSV) as (path, td):
+            out = os.path.join(td, "out.json")
+            prof_path = os.path.join(td, "run.prof")
+            with mock.patch("builtins.print") as mock_print:
+                rc = mod.main(
+                    [
+                        path,
+                        out,
+                        "--split-by-country",
+                        "--profile",
+                        prof_path,
+                        "--trace-memory",
+                    ]
+                )
+            self.assertEqual(rc, 0)
+            mock_print.assert_any_call(
+                "Conversion complete: Files written: 2, Errors: 0"
+            )
+            stats = pstats.Stats(prof_path)
+            self.assertTrue(
+                any(
+                    func[2] == "convert_csv_to_json"
+                    for func in stats.stats  # type: ignore[attr-defined]
+                )
+            )
+            reports = [
+                c.args[0]
+                for c in mock_print.call_args_list
+                if c.args and c.kwargs.get("file") is not None
+            ]
+            memory = next(r for r in reports if r.startswith("Memory => peak="))
+            for stage in ("sniff", "rows", "write", "run"):
+                self.assertIn(f"\n  {stage}:\n", memory + "\n")
+            self.assertIn(f"Profile written to {prof_path}", reports)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
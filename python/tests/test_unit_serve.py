@@ -0,0 +1,132 @@
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import threading
+import unittest
+from multiprocessing.connection import Client
+from unittest import mock
+
+from python import json_converter as mod
+from python.core import serve
+from python.tests.cli_fixtures import GBL_FRA_CSV, csv_input
+
+
+class ServeTests(unittest.TestCase):
+    @unittest.skipIf(sys.platform == "win32", "Unix socket address")
+    def test_serve_runs_requests_in_warm_process(self):
+        with csv_input(GBL_FRA_CSV) as (path, td):
+            address = os.path.join(td, "conv.sock")
+            ready = threading.Event()
+            server = threading.Thread(
+                target=serve.serve_forever,
+                args=(mod.main,),
+                kwargs={"address": address, "ready": lambda _a: ready.set()},
+            )
+            server.start()
+            try:
+                self.assertTrue(ready.wait(10))
+                self.assertIsNotNone(serve.ping_server(address=address))
+                out = os.path.join(td, "out.json")
+                response = serve.run_via_server(
+                    [path, out, "--split-by-country"], address=address
+                )
+                self.assertEqual(response["exitCode"], 0)
+                self.assertIn(
+                    "Conversion complete: Files written: 2, Errors: 0",
+                    response["stdout"],
+                )
+                self.assertTrue(os.path.isfile(os.path.join(td, "out_FRA.json")))
+                # argparse errors come back as a response; the server keeps going.
+                bad = serve.run_via_server(["--jobs", "0"], address=address)
+                self.assertEqual(bad["exitCode"], 2)
+                self.assertIn("--jobs", bad["stderr"])
+            finally:
+                self.assertTrue(serve.stop_server(address=address))
+                server.join(10)
+            self.assertFalse(os.path.exists(address))
+            self.assertIsNone(serve.ping_server(address=address))
+
+    @unittest.skipIf(sys.platform == "win32", "Unix socket address")
+    def test_client_refuses_address_not_owned_socket(self):
+        with csv_input(GBL_FRA_CSV) as (path, td):
+            # A regular file squatting on the address is never connected to.
+            address = os.path.join(td, "conv.sock")
+            with open(address, "w", encoding="utf-8") as f:
+                f.write("squatter")
+            self.assertIsNone(serve.ping_server(address=address))
+            self.assertFalse(serve.stop_server(address=address))
+            out = os.path.join(td, "out.json")
+            err = io.StringIO()
+            with (
+                contextlib.redirect_stdout(io.StringIO()),
+                contextlib.redirect_stderr(err),
+            ):
+                rc = serve.dispatch_serve_flags(
+                    ["--via-server", "--serve-address", address, path, out],
+                    mod.main,
+                )
+            self.assertEqual(rc, 0)
+            self.assertIn("not a socket owned by the current user", err.getvalue())
+            self.assertIn("running in-process", err.getvalue())
+            self.assertTrue(os.path.isfile(out))
+            # The server neither replaces nor deletes it.
+            err = io.StringIO()
+            with contextlib.redirect_stderr(err):
+                self.assertEqual(serve.serve_forever(mod.main, address=address), 1)
+            self.assertIn("refusing to replace", err.getvalue())
+            self.assertTrue(os.path.isfile(address))
+
+    @unittest.skipIf(sys.platform == "win32", "Unix socket address")
+    def test_default_address_requires_private_directory(self):
+        with tempfile.TemporaryDirectory() as td:
+            env = {k: v for k, v in os.environ.items() if k != "XDG_RUNTIME_DIR"}
+            with (
+                mock.patch.dict(os.environ, env, clear=True),
+                mock.patch.object(serve.tempfile, "gettempdir", return_value=td),
+            ):
+                address = serve.default_serve_address()
+                private = os.path.dirname(address)
+                self.assertEqual(
+                    private, os.path.join(td, f"json_converter-{os.getuid()}")
+                )
+                self.assertEqual(os.stat(private).st_mode & 0o777, 0o700)
+                os.chmod(private, 0o755)
+                with self.assertRaises(PermissionError):
+                    serve.default_serve_address()
+                self.assertIsNone(serve.ping_server())
+
+    @unittest.skipIf(sys.platform == "win32", "Unix socket address")
+    def test_silent_client_does_not_block_server(self):
+        with csv_input(GBL_FRA_CSV) as (path, td):
+            address = os.path.join(td, "conv.sock")
+            ready = threading.Event()
+            server = threading.Thread(
+                target=serve.serve_forever,
+                args=(mod.main,),
+                kwargs={
+                    "address": address,
+                    "ready": lambda _a: ready.set(),
+                    "request_timeout": 0.2,
+                },
+            )
+            err = io.StringIO()
+            with contextlib.redirect_stderr(err):
+                server.start()
+                try:
+                    self.assertTrue(ready.wait(10))
+                    with Client(address, family="AF_UNIX"):
+                        # Connected but never answers the handshake.
+                        self.assertIsNotNone(serve.ping_server(address=address))
+                    wrong_key = serve.ping_server(address=address, authkey=b"other")
+                    self.assertIsNone(wrong_key)
+                finally:
+                    self.assertTrue(serve.stop_server(address=address))
+                    server.join(10)
+            self.assertIn("no message within 0.2s", err.getvalue())
+            self.assertIn("digest received was wrong", err.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
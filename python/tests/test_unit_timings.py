@@ -0,0 +1,64 @@
+import json
+import os
+import unittest
+from unittest import mock
+
+from python import json_converter as mod
+from python.tests.cli_fixtures import csv_input, unified_csv
+
+
+class TimingsTests(unittest.TestCase):
+    def test_timings_report_stage_spans_and_counters(self):
+        csv_content = unified_csv(
+            ("GBL", "FRA"),
+            "meta_global;;;;;briefVersion;Y;ALL;53;;",
+            "meta_global;;;;;fps;Y;ALL;25;;",
+            "sub;V1;1;00:00:00:00;00:00:01:00;;;;;a;b",
+            "sub;V1;2;00:00:01:00;00:00:02:00;;;;;c;d",
+        )
+        with csv_input(csv_content) as (path, td):
+            out = os.path.join(td, "out.json")
+            timings_path = os.path.join(td, "timings.json")
+            with mock.patch("builtins.print") as mock_print:
+                rc = mod.main(
+                    [
+                        path,
+                        out,
+                        "--split-by-country",
+                        "--timings",
+                        "--timings-json",
+                        timings_path,
+                    ]
+                )
+            self.assertEqual(rc, 0)
+            lines = [c.args[0] for c in mock_print.call_args_list if c.args]
+            summary_at = lines.index("Conversion complete: Files written: 2, Errors: 0")
+            timing_line, counts_line = lines[summary_at + 1 : summary_at + 3]
+            self.assertTrue(timing_line.startswith("Timing (s) => sniff="))
+            self.assertTrue(timing_line.endswith(tuple("0123456789")))
+            # Same comma-separated key=value shape the log picker parses.
+            timing = dict(
+                part.split("=") for part in timing_line.split(" => ", 1)[1].split(", ")
+            )
+            self.assertIn("total", timing)
+            counts = dict(
+                part.split("=") for part in counts_line.split(" => ", 1)[1].split(", ")
+            )
+            self.assertEqual(counts["rows.sub"], "2")
+            self.assertEqual(counts["countries"], "2")
+            self.assertEqual(counts["filesWritten"], "2")
+
+            with open(timings_path, encoding="utf-8") as f:
+                report = json.load(f)
+            for span in ("sniff", "read", "rows", "merge", "build", "write"):
+                self.assertIn(span, report["spans"])
+            self.assertIn("build:FRA", report["spans"])
+            written = sum(
+                os.path.getsize(os.path.join(td, f"out_{c}.json"))
+                for c in ("GBL", "FRA")
+            )
+            self.assertEqual(report["counters"]["bytesWritten"], written)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
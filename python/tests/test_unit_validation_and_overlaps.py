@@ -6,6 +6,7 @@ import io
 from unittest import mock
 
 from python import json_converter as mod
+from python.core.validation import build_validator, validate_structure
 
 
 def tmp_csv(content: str) -> str:
@@ -196,6 +197,117 @@ class ValidationAndOverlapTests(unittest.TestCase):
         finally:
             os.remove(path)
 
+    def test_incremental_check_reuses_unchanged_countries_and_reports_delta(self):
+        header = (
+            "record_type;video_id;line;start;end;key;is_global;country_scope;metadata;GBL;GBL;DEU;DEU\n"
+            "meta_global;;;;;briefVersion;Y;ALL;53;;;;\n"
+            "meta_global;;;;;fps;Y;ALL;25;;;;\n"
+            "sub;V7;1;00:00:00:00;00:00:01:00;;;;;hi;;hallo;\n"
+        )
+        overlapping = header + "sub;V7;2;00:00:00:12;00:00:02:00;;;;;;;wieder;\n"
+        # Only DEU's text changes: the overlapping line is gone for DEU.
+        fixed = header + "sub;V7;2;00:00:00:12;00:00:02:00;;;;;;;;\n"
+        path = tmp_csv(overlapping)
+        try:
+            with tempfile.TemporaryDirectory() as td:
+                report_path = os.path.join(td, "report.json")
+                argv = [
+                    path,
+                    os.path.join(td, "out.json"),
+                    "--check",
+                    "--split-by-country",
+                    "--validation-report",
+                    report_path,
+                    "--incremental-check",
+                ]
+
+                def run_check():
+                    with mock.patch("sys.stdout", new_callable=io.StringIO):
+                        self.assertEqual(mod.main(argv), 0)
+                    with open(report_path, "r", encoding="utf-8") as f:
+                        return json.load(f)
+
+                first = run_check()
+                self.assertTrue(os.path.isfile(os.path.join(td, "report.cache.json")))
+                self.assertFalse(first["delta"]["baseline"])
+                self.assertEqual(first["delta"]["revalidated"], ["GBL", "DEU"])
+                self.assertEqual(len(first["delta"]["new"]), 2)
+
+                second = run_check()
+                self.assertEqual(second["delta"]["revalidated"], [])
+                self.assertEqual(second["delta"]["reused"], ["GBL", "DEU"])
+                self.assertEqual(second["delta"]["new"], [])
+                self.assertEqual(len(second["delta"]["unchanged"]), 2)
+                for a, b in zip(first["countries"], second["countries"]):
+                    self.assertTrue(b["cached"])
+                    self.assertEqual(a["errors"], b["errors"])
+                    self.assertEqual(a["videos"], b["videos"])
+
+                with open(path, "w", encoding="utf-8") as f:
+                    f.write(fixed)
+                third = run_check()
+                self.assertEqual(third["delta"]["revalidated"], ["DEU"])
+                self.assertEqual(third["delta"]["reused"], ["GBL"])
+                self.assertEqual(third["summary"]["errors"], 0)
+                self.assertEqual(third["delta"]["new"], [])
+                self.assertEqual(
+                    [(i["country"], i["level"]) for i in third["delta"]["fixed"]],
+                    [("DEU", "error"), ("DEU", "error")],
+                )
+        finally:
+            os.remove(path)
+
+    def test_compiled_validator_summary_counts(self):
+        payload = {
+            "claim": {"landscape": ["C1", "C2"], "portrait": ["C1"]},
+            "logo": {"landscape": [], "portrait": []},
+            "metadataGlobal": {"briefVersion": 1},
+            "videos": [
+                {
+                    "videoId": "V1_landscape",
+                    "metadata": {"orientation": "landscape"},
+                    "subtitles": [{"in": 0, "out": 2}, {"in": 1, "out": 3}],
+                },
+                {
+                    "videoId": "V1_portrait",
+                    "metadata": {"orientation": "portrait"},
+                    "subtitles": [{"in": 0, "out": 1}],
+                },
+            ],
+        }
+        validate = build_validator(required_global_keys=["briefVersion", "fps"])
+        res = validate(payload)
+        self.assertEqual(
+            res["errors"],
+            [
+                "metadataGlobal missing required key 'fps'",
+                "videos[0].subtitles[1] overlaps previous (start 1.0 < prev end 2.0)",
+            ],
+        )
+        self.assertEqual(
+            res["warnings"], ["claim: landscape/portrait length mismatch 2!=1"]
+        )
+        summary = res["summary"]
+        self.assertEqual(
+            summary["videos"],
+            [
+                {"videoId": "V1_landscape", "subtitleCount": 2},
+                {"videoId": "V1_portrait", "subtitleCount": 1},
+            ],
+        )
+        self.assertEqual(summary["subtitleLines"], 3)
+        self.assertEqual(summary["claimLines"], 2)
+        self.assertEqual(summary["logoLines"], 2)
+        self.assertEqual(summary["disclaimerLines"], 0)
+        # Same compiled function for the same options; wrapper keeps its shape.
+        self.assertIs(
+            validate, build_validator(required_global_keys=("briefVersion", "fps"))
+        )
+        self.assertEqual(
+            validate_structure(payload, required_global_keys=["briefVersion", "fps"]),
+            {"errors": res["errors"], "warnings": res["warnings"]},
+        )
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
@@ -6,7 +6,7 @@ import unittest
 from unittest import mock
 
 from python import json_converter as mod
-from python.core import cli_runner
+from python.core import cli_runner, provenance
 
 HERE = os.path.dirname(os.path.abspath(__file__))
 PYTHON_DIR = os.path.abspath(os.path.join(HERE, ".."))
@@ -120,6 +120,31 @@ class VersionFromChangelogTests(unittest.TestCase):
         finally:
             os.remove(path)
 
+    def test_provenance_is_resolved_once_and_persisted(self):
+        script = os.path.join(PYTHON_DIR, "json_converter.py")
+        with tempfile.TemporaryDirectory() as td:
+            cache_path = os.path.join(td, "provenance.json")
+            with mock.patch.dict(
+                os.environ, {provenance.PROVENANCE_CACHE_ENV: cache_path}
+            ):
+                provenance.clear_provenance_cache()
+                first = provenance.resolve_provenance(script)
+                self.assertTrue(os.path.isfile(cache_path))
+                self.assertEqual(first.changelog_version, read_expected_version())
+
+                # A new process (empty memo) reads the file instead of forking git.
+                provenance.clear_provenance_cache()
+                with mock.patch.object(
+                    provenance.subprocess, "check_output"
+                ) as check_output:
+                    self.assertEqual(provenance.resolve_provenance(script), first)
+                    self.assertEqual(provenance.resolve_provenance(script), first)
+                check_output.assert_not_called()
+
+            with mock.patch.dict(os.environ, {provenance.PROVENANCE_CACHE_ENV: "0"}):
+                self.assertIsNone(provenance.default_provenance_cache_path())
+        provenance.clear_provenance_cache()
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
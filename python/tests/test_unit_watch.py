@@ -0,0 +1,69 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from python import json_converter as mod
+from python.core import watch
+from python.tests.cli_fixtures import unified_csv
+
+
+class WatchTests(unittest.TestCase):
+    def test_watch_rebuilds_only_touched_countries(self):
+        with tempfile.TemporaryDirectory() as td:
+            path = os.path.join(td, "in.csv")
+            out_dir = os.path.join(td, "out")
+
+            def write_sheet(sub_row: str, stamp: int) -> None:
+                with open(path, "w", encoding="utf-8") as f:
+                    f.write(
+                        unified_csv(
+                            ("GBL", "FRA"), "meta_global;;;;;fps;Y;ALL;25;;", sub_row
+                        )
+                    )
+                os.utime(path, ns=(stamp, stamp))
+
+            def out_mtime(country: str) -> int:
+                return os.stat(os.path.join(out_dir, f"out_{country}.json")).st_mtime_ns
+
+            write_sheet("sub;V1;1;00:00:00:00;00:00:01:00;;;;;a;b", 1_000_000_000)
+            edits = {
+                # poll 1: only the FRA text changes
+                1: ("sub;V1;1;00:00:00:00;00:00:01:00;;;;;a;b2", 2_000_000_000),
+                # poll 3 (after the settle check): shared timing changes
+                3: ("sub;V1;1;00:00:00:00;00:00:02:00;;;;;a;b2", 3_000_000_000),
+            }
+            sleeps = []
+            mtimes = {"GBL": [], "FRA": []}
+
+            def fake_sleep(_interval: float) -> None:
+                sleeps.append(1)
+                for country in mtimes:
+                    mtimes[country].append(out_mtime(country))
+                edit = edits.get(len(sleeps))
+                if edit:
+                    write_sheet(*edit)
+
+            argv = [path, os.path.join(out_dir, "out.json"), "--split-by-country"]
+            with mock.patch("builtins.print") as mock_print:
+                rc = watch.watch_loop(argv, mod._run, max_polls=2, sleep=fake_sleep)
+            self.assertEqual(rc, 0)
+            mock_print.assert_any_call(
+                f"Change detected in {path}: reconverting 1 of 2 countries (FRA)"
+            )
+            mock_print.assert_any_call(
+                f"Change detected in {path}: reconverting all countries"
+            )
+            # Sleep 3 runs after the FRA-only reconversion: GBL was not rewritten.
+            self.assertEqual(mtimes["GBL"][2], mtimes["GBL"][0])
+            self.assertNotEqual(mtimes["FRA"][2], mtimes["FRA"][0])
+            self.assertNotEqual(out_mtime("GBL"), mtimes["GBL"][2])
+            with open(os.path.join(out_dir, "out_FRA.json"), encoding="utf-8") as f:
+                fra = json.load(f)
+            sub = fra["videos"][0]["subtitles"][0]
+            self.assertEqual((sub["text"], sub["out"]), ("b2", 2.0))
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
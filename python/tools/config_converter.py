@@ -22,17 +22,28 @@ from __future__ import annotations
 import argparse
 import json
 import os
-from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Sequence, cast
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    cast,
+)
 
 from .sheet_names_config import SHEETS_BY_KEY
 
+try:
+    from .xlsx_values import load_values_workbook
+except ImportError:
+    from python.tools.xlsx_values import (  # type: ignore[no-redef]
+        load_values_workbook,
+    )
+
 if TYPE_CHECKING:
     from openpyxl.worksheet.worksheet import Worksheet as WorksheetType
 
-try:
-    from openpyxl import load_workbook as _openpyxl_load_workbook
-except Exception:
-    _openpyxl_load_workbook = None
 
 RE_CENTER_KEYS: Sequence[str] = ("force", "noRecenter", "alignH", "alignV")
 VALID_BEHAVIORS: Sequence[str] = ("timed", "span", "asIs")
@@ -325,18 +336,13 @@ def convert_workbook(
     in_path: str,
     separator: str,
 ) -> Dict[str, object]:
-    if _openpyxl_load_workbook is None:
-        raise RuntimeError(
-            "XLSX support requires openpyxl. Install with: pip install openpyxl"
-        )
-
     layer_names_sheet = SHEETS_BY_KEY["LAYER_NAME_CONFIG_items"].default_sheet_name
     recenter_rules_sheet = SHEETS_BY_KEY[
         "LAYER_NAME_CONFIG_recenterRules"
     ].default_sheet_name
     root_key = "LAYER_NAME_CONFIG"
 
-    wb = _openpyxl_load_workbook(in_path, read_only=True, data_only=True)
+    wb = load_values_workbook(in_path)
     try:
         ws_layers = _sheet_by_name_ci(wb, layer_names_sheet)
         ws_rules = _sheet_by_name_ci(wb, recenter_rules_sheet)
@@ -49,11 +49,17 @@ from datetime import date, datetime
 from collections import OrderedDict
 from typing import Dict, Iterable, List, TextIO, Tuple
 
-try:
-    from openpyxl import load_workbook as _openpyxl_load_workbook
-except Exception:
-    _openpyxl_load_workbook = None
 
+try:
+    from .xlsx_values import load_values_workbook
+except ImportError:
+    try:
+        from python.tools.xlsx_values import (  # type: ignore[no-redef]
+            load_values_workbook,
+        )
+    except ImportError:
+        # Run as a standalone script: the sibling module is on sys.path.
+        from xlsx_values import load_values_workbook  # type: ignore[no-redef]
 
 CREATIVE_RE = re.compile(r"^(?P<dur>[0-9]+s)(?:C(?P<idx>[1-5]))?\s*$", re.I)
 OUTPUT_ROOT_KEY = "EXTRA_OUTPUT_COMPS"
@@ -291,12 +297,7 @@ def read_csv(
 ) -> List[dict]:
     ext = os.path.splitext(path)[1].lower()
     if ext in (".xlsx", ".xlsm", ".xltx", ".xltm"):
-        if _openpyxl_load_workbook is None:
-            raise RuntimeError(
-                "XLSX input requires 'openpyxl'. Install it (e.g., pip install openpyxl) or provide CSV input."
-            )
-
-        wb = _openpyxl_load_workbook(path, data_only=True, read_only=True)
+        wb = load_values_workbook(path)
         try:
             if xlsx_sheet:
                 if xlsx_sheet not in wb.sheetnames:
@@ -1,18 +1,25 @@
 from __future__ import annotations
 
 import csv
+import functools
 import os
 import re
-from typing import List, Optional, Tuple
+from typing import Any, Callable, List, Optional, Tuple
 
+from python.core.timecode import parse_timecodes
 from python.tools.srt_csv.timecode import FRAME_TC_RE, MS_TC_RE, format_time_ms
 
 ISO_HEADER_RE = re.compile(r"^[A-Z]{3}(?:_[A-Z]{3})?$")
 
-try:
-    from openpyxl import load_workbook as _load_workbook
-except Exception:  # pragma: no cover - optional dependency
-    _load_workbook = None  # type: ignore[assignment]
+
+@functools.lru_cache(maxsize=None)
+def _openpyxl_load_workbook() -> Optional[Callable[..., Any]]:
+    # Imported on first XLSX use so CSV input never loads openpyxl.
+    try:
+        from openpyxl import load_workbook
+    except Exception:  # pragma: no cover - optional dependency
+        return None
+    return load_workbook
 
 
 def _normalize_header_name(name: str) -> str:
@@ -86,11 +93,12 @@ def _read_reverse_table(
     encoding: str,
 ) -> Tuple[List[str], List[List[str]]]:
     if in_path.lower().endswith(".xlsx"):
-        if _load_workbook is None:
+        load_workbook = _openpyxl_load_workbook()
+        if load_workbook is None:
             raise SystemExit(
                 "XLSX input requires openpyxl. Install with: pip install openpyxl"
             )
-        wb = _load_workbook(in_path, data_only=True)
+        wb = load_workbook(in_path, data_only=True)
         ws = wb.active
         if ws is None:
             raise ValueError("XLSX file has no active worksheet")
@@ -173,7 +181,7 @@ def _rows_to_reverse_records(
     time_format: str,
     fps: float,
 ) -> List[Tuple[float, float, str]]:
-    out: List[Tuple[float, float, str]] = []
+    timed: List[Tuple[str, str, str]] = []
     for row in rows:
         start = (row[idx_start] if idx_start < len(row) else "").strip()
         end = (row[idx_end] if idx_end < len(row) else "").strip()
@@ -186,11 +194,36 @@ def _rows_to_reverse_records(
             raise ValueError(
                 "Row has only one time value; both Start Time and End Time are required"
             )
+        timed.append((start, end, text))
+
+    if time_format == "frames" and fps > 0:
+        # Strict HH:MM:SS:FF tokens are converted by the core batch parser
+        # (same arithmetic, one pass per column). It also accepts seconds and
+        # HH:MM:SS forms, so every other token goes through
+        # _parse_reverse_timecode, which rejects them.
+        starts = parse_timecodes([t[0] for t in timed], fps)
+        ends = parse_timecodes([t[1] for t in timed], fps)
+        out: List[Tuple[float, float, str]] = []
+        for i, (start, end, text) in enumerate(timed):
+            if starts.invalid[i] or not FRAME_TC_RE.match(start):
+                tin = _parse_reverse_timecode(start, time_format, fps)
+            else:
+                tin = starts.seconds[i]
+            if ends.invalid[i] or not FRAME_TC_RE.match(end):
+                tout = _parse_reverse_timecode(end, time_format, fps)
+            else:
+                tout = ends.seconds[i]
+            out.append((tin, tout, text))
+        return out
 
-        tin = _parse_reverse_timecode(start, time_format, fps)
-        tout = _parse_reverse_timecode(end, time_format, fps)
-        out.append((tin, tout, text))
-    return out
+    return [
+        (
+            _parse_reverse_timecode(start, time_format, fps),
+            _parse_reverse_timecode(end, time_format, fps),
+            text,
+        )
+        for start, end, text in timed
+    ]
 
 
 def _records_to_srt_text(records: List[Tuple[float, float, str]]) -> str:
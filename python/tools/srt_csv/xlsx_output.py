@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 import csv
+import functools
 import os
-from typing import TYPE_CHECKING, Callable, List, Optional, Type
+from typing import TYPE_CHECKING, Callable, List, NamedTuple, Optional, Type
 
 from .forward import HEADER
 
@@ -23,30 +24,32 @@ except ImportError:
 
 # openpyxl is an optional runtime dependency (only needed for XLSX output).
 # The TYPE_CHECKING block gives Pylance accurate type information without
-# requiring the package to be installed. The try/except block captures the
-# actual runtime values; all three names are checked together before use.
+# requiring the package to be installed. The runtime classes are imported on
+# first XLSX use, so CSV output never loads openpyxl.
 if TYPE_CHECKING:
     from openpyxl import Workbook as WorkbookType
     from openpyxl.styles import Color as ColorType
     from openpyxl.styles import Font as FontType
     from openpyxl.styles import PatternFill as PatternFillType
 
-try:
-    from openpyxl import Workbook
-    from openpyxl import load_workbook
-    from openpyxl.styles import Color, Font, PatternFill
-except Exception:  # pragma: no cover - optional dependency
-    Workbook = None  # type: ignore[assignment,misc]
-    load_workbook = None  # type: ignore[assignment,misc]
-    Color = None  # type: ignore[assignment,misc]
-    Font = None  # type: ignore[assignment,misc]
-    PatternFill = None  # type: ignore[assignment,misc]
-
-_Workbook: Optional[Type["WorkbookType"]] = Workbook
-_load_workbook: Optional[Callable[..., "WorkbookType"]] = load_workbook
-_Color: Optional[Type["ColorType"]] = Color
-_Font: Optional[Type["FontType"]] = Font
-_PatternFill: Optional[Type["PatternFillType"]] = PatternFill
+
+class _OpenpyxlBackend(NamedTuple):
+    Workbook: Type["WorkbookType"]
+    load_workbook: Callable[..., "WorkbookType"]
+    Color: Type["ColorType"]
+    Font: Type["FontType"]
+    PatternFill: Type["PatternFillType"]
+
+
+@functools.lru_cache(maxsize=None)
+def _openpyxl_backend() -> Optional[_OpenpyxlBackend]:
+    try:
+        from openpyxl import Workbook, load_workbook
+        from openpyxl.styles import Color, Font, PatternFill
+    except Exception:  # pragma: no cover - optional dependency
+        return None
+    return _OpenpyxlBackend(Workbook, load_workbook, Color, Font, PatternFill)
+
 
 XLSX_TEMPLATE_ENV = "SRT_TO_CSV_XLSX_TEMPLATE"
 XLSX_THEME_ENV = "SRT_TO_CSV_XLSX_THEME_FILE"
@@ -72,26 +75,23 @@ def _create_output_workbook(
     abort with a clear message instead of silently falling back to default
     theme/workbook styling.
     """
-    if _Workbook is None:
+    backend = _openpyxl_backend()
+    if backend is None:
         raise SystemExit(
             "XLSX output requires openpyxl. Install with: pip install openpyxl"
         )
 
     template_path = _resolve_optional_file_path(template_path_raw)
     if not template_path:
-        return _Workbook()
+        return backend.Workbook()
 
-    if _load_workbook is None:
-        raise SystemExit(
-            "XLSX template loading requires openpyxl load_workbook support"
-        )
     if not os.path.isfile(template_path):
         raise SystemExit(
             f"XLSX template path from {template_source} was not found: {template_path}"
         )
 
     try:
-        return _load_workbook(template_path)
+        return backend.load_workbook(template_path)
     except Exception as ex:
         raise SystemExit(
             f"Failed to load XLSX template from {template_source}: {template_path} ({ex})"
@@ -150,11 +150,10 @@ def write_tabular_output(
 
     if output_type != "xlsx":
         raise ValueError("output_type must be 'csv' or 'xlsx'")
-    # openpyxl symbols are checked together because XLSX formatting relies on
+    # openpyxl symbols are resolved together because XLSX formatting relies on
     # workbook, styles, and table objects.
-    # Checking all needed symbols keeps the type narrowed to
-    # non-None for the remainder of the XLSX path.
-    if _Workbook is None or _Color is None or _Font is None or _PatternFill is None:
+    backend = _openpyxl_backend()
+    if backend is None:
         raise SystemExit(
             "XLSX output requires openpyxl. Install with: pip install openpyxl"
         )
@@ -201,8 +200,10 @@ def write_tabular_output(
     )
 
     # Excel theme color: Plum, Accent 5, Lighter 80%.
-    title_fill = _PatternFill(fill_type="solid", fgColor=_Color(theme=8, tint=0.8))
-    body_font = _Font(name="Aptos Narrow", size=12)
+    title_fill = backend.PatternFill(
+        fill_type="solid", fgColor=backend.Color(theme=8, tint=0.8)
+    )
+    body_font = backend.Font(name="Aptos Narrow", size=12)
 
     for row in rows:
         normalized = list(row[: len(XLSX_HEADER)])
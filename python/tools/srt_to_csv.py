@@ -14,6 +14,8 @@ Options:
 - --output-type <csv|xlsx>    Output container override (otherwise inferred from output extension)
 - --xlsx-theme-file <path>    Optional OOXML theme XML file to apply to generated XLSX workbooks
 - --xlsx-template <path>      Optional XLSX template workbook to use as base for output
+- --profile <path>            Write cProfile stats of the run to <path>
+- --trace-memory              Print peak memory and top allocation sites (tracemalloc) to stderr
 
 Examples:
     # Single file
@@ -33,7 +35,9 @@ Examples:
 from __future__ import annotations
 
 import argparse
+import functools
 
+from python.core.profiling import MemoryTracer, add_profiling_arguments, run_profiled
 from python.tools.srt_csv.cli_ops import run_forward_mode, run_reverse_mode
 
 from python.tools.srt_csv.xlsx_output import (
@@ -132,13 +136,19 @@ def main() -> None:
         "--text-col",
         help="Reverse mode: text column name or 1-based index",
     )
+    add_profiling_arguments(p)
     args = p.parse_args()
 
-    if args.reverse or args.reverse_joined:
-        run_reverse_mode(args)
+    mode = run_reverse_mode if args.reverse or args.reverse_joined else run_forward_mode
+    if args.profile or args.trace_memory:
+        run_profiled(
+            functools.partial(mode, args),
+            profile_path=args.profile,
+            memory_tracer=MemoryTracer() if args.trace_memory else None,
+        )
         return
 
-    run_forward_mode(args)
+    mode(args)
 
 
 if __name__ == "__main__":
@@ -1,21 +1,33 @@
 from __future__ import annotations
 
+import functools
 import os
 import re
-from typing import TYPE_CHECKING, Dict, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Tuple
 
 if TYPE_CHECKING:
     from openpyxl import Workbook as WorkbookType
     from openpyxl.worksheet.worksheet import Worksheet as WorksheetType
 
-try:
-    from openpyxl.utils import get_column_letter as _get_column_letter
-    from openpyxl.worksheet.table import Table as _Table
-    from openpyxl.worksheet.table import TableStyleInfo as _TableStyleInfo
-except Exception:
-    _get_column_letter = None
-    _Table = None
-    _TableStyleInfo = None
+
+@functools.lru_cache(maxsize=None)
+def _openpyxl_get_column_letter() -> Optional[Callable[[int], str]]:
+    # openpyxl is imported on first use, not when this module is imported.
+    try:
+        from openpyxl.utils import get_column_letter
+    except Exception:
+        return None
+    return get_column_letter
+
+
+@functools.lru_cache(maxsize=None)
+def _openpyxl_table_types() -> Optional[Tuple[Any, Any]]:
+    """``(Table, TableStyleInfo)`` from openpyxl, or None when unavailable."""
+    try:
+        from openpyxl.worksheet.table import Table, TableStyleInfo
+    except Exception:
+        return None
+    return Table, TableStyleInfo
 
 
 def resolve_optional_file_path(raw_path: Optional[str]) -> Optional[str]:
@@ -79,17 +91,20 @@ def apply_table_style(
     style_name: str = "TableStyleMedium9",
 ) -> None:
     """Format worksheet used range as table with header row enabled."""
-    if _Table is None or _TableStyleInfo is None or _get_column_letter is None:
+    table_types = _openpyxl_table_types()
+    get_column_letter = _openpyxl_get_column_letter()
+    if table_types is None or get_column_letter is None:
         raise SystemExit(
             "XLSX table styling requires openpyxl. Install with: pip install openpyxl"
         )
 
     if worksheet.max_row < 2 or worksheet.max_column < 1:
         return
+    table_cls, style_info_cls = table_types
 
-    last_col = _get_column_letter(worksheet.max_column)
+    last_col = get_column_letter(worksheet.max_column)
     table_ref = f"A1:{last_col}{worksheet.max_row}"
-    style = _TableStyleInfo(
+    style = style_info_cls(
         name=style_name,
         showFirstColumn=False,
         showLastColumn=False,
@@ -105,7 +120,7 @@ def apply_table_style(
         return
 
     normalized_name = _sanitize_table_name(table_name or f"{worksheet.title}_Table")
-    table = _Table(displayName=normalized_name, ref=table_ref)
+    table = table_cls(displayName=normalized_name, ref=table_ref)
     table.tableStyleInfo = style
     worksheet.add_table(table)
 
@@ -119,7 +134,8 @@ def autosize_columns(
     manual_width_overrides: Optional[Dict[str, float]] = None,
 ) -> None:
     """Set column widths based on content length with optional per-column overrides."""
-    if _get_column_letter is None:
+    get_column_letter = _openpyxl_get_column_letter()
+    if get_column_letter is None:
         raise SystemExit(
             "XLSX column autosize requires openpyxl. Install with: pip install openpyxl"
         )
@@ -129,7 +145,7 @@ def autosize_columns(
     overrides = {k.upper(): v for k, v in (manual_width_overrides or {}).items()}
 
     for col_idx in range(1, worksheet.max_column + 1):
-        col_letter = _get_column_letter(col_idx)
+        col_letter = get_column_letter(col_idx)
         if col_letter in overrides:
             width = float(overrides[col_letter])
             worksheet.column_dimensions[col_letter].width = max(lo, min(hi, width))
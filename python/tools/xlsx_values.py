@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import functools
+import sys
+from typing import Any, Callable, Optional
+
+
+@functools.lru_cache(maxsize=None)
+def _openpyxl_load_workbook() -> Optional[Callable[..., Any]]:
+    # Imported on first XLSX use so CSV-only runs never load openpyxl.
+    try:
+        from openpyxl import load_workbook
+    except Exception:
+        return None
+    return load_workbook
+
+
+@functools.lru_cache(maxsize=None)
+def _workbook_cache_opener() -> Optional[Callable[..., Any]]:
+    # The core package's shared workbook cache (see core/workbook_cache.py),
+    # so one pipeline run parses each sheet only once. The tools also run
+    # standalone, where only openpyxl is used.
+    for name in ("python.core.workbook_cache", "core.workbook_cache"):
+        module = sys.modules.get(name)
+        if module is not None:
+            return module.open_cached_workbook
+    try:
+        from python.core.workbook_cache import open_cached_workbook
+    except Exception:
+        try:
+            from core.workbook_cache import open_cached_workbook  # type: ignore
+        except Exception:
+            return None
+    return open_cached_workbook
+
+
+def openpyxl_fallback(path: str, **kwargs: Any) -> Any:
+    """``openpyxl.load_workbook``; raises RuntimeError when openpyxl is missing."""
+    load_workbook = _openpyxl_load_workbook()
+    if load_workbook is None:
+        raise RuntimeError(
+            "XLSX input requires openpyxl. Install with: pip install openpyxl"
+        )
+    return load_workbook(path, **kwargs)
+
+
+def load_values_workbook(path: str) -> Any:
+    """Read-only, values-only workbook for ``path``; call ``close()`` when done.
+
+    Served by the core workbook cache when available, else by openpyxl.
+    """
+    open_cached_workbook = _workbook_cache_opener()
+    if open_cached_workbook is not None:
+        return open_cached_workbook(path, openpyxl_fallback)
+    return openpyxl_fallback(path, data_only=True, read_only=True)